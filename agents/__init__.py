@@ -1,22 +1,37 @@
 """
 AI Pair Programming Multi-Agent Framework
 Agents package containing all agent implementations.
+
+Agents are imported on first access, so importing one of them doesn't load the audio
+stack (pyaudio, Porcupine, pygame) or the other agents' dependencies.
 """
 
-from .base_agent import BaseAgent
-from .stt_agent import STTAgent
-from .tts_agent import TTSPromptAgent
-from .python_agent import ProgrammingAgent as PythonAgent
-from .discussion_agent import DiscussionAgent
-from .code_analysis_agent import CodeAnalysisAgent
-from .coderabbit_agent import CodeRabbitAgent
-
-__all__ = [
-    'BaseAgent',
-    'STTAgent',
-    'TTSPromptAgent',
-    'PythonAgent',
-    'DiscussionAgent',
-    'CodeAnalysisAgent',
-    'CodeRabbitAgent'
-]
+import importlib
+
+# Exported name -> (submodule, class name)
+_AGENT_MODULES = {
+    'BaseAgent': ('.base_agent', 'BaseAgent'),
+    'STTAgent': ('.stt_agent', 'STTAgent'),
+    'TTSPromptAgent': ('.tts_agent', 'TTSPromptAgent'),
+    'PythonAgent': ('.python_agent', 'ProgrammingAgent'),
+    'DiscussionAgent': ('.discussion_agent', 'DiscussionAgent'),
+    'CodeAnalysisAgent': ('.code_analysis_agent', 'CodeAnalysisAgent'),
+    'CodeRabbitAgent': ('.coderabbit_agent', 'CodeRabbitAgent'),
+    'FileAgent': ('.file_agent', 'FileAgent'),
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    try:
+        module_name, class_name = _AGENT_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    agent_class = getattr(importlib.import_module(module_name, __name__), class_name)
+    globals()[name] = agent_class  # Later lookups skip __getattr__
+    return agent_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
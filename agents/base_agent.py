@@ -3,6 +3,7 @@ Base Agent class for the AI Pair Programming multi-agent framework.
 All agents inherit from this base class.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
@@ -20,6 +21,7 @@ class BaseAgent(ABC):
         """
         self.name = name
         self.config = config or {}
+        self.logger = logging.getLogger(f"agents.{name}")
     
     @abstractmethod
     def run(self, input_data: Any) -> Any:
@@ -36,4 +38,8 @@ class BaseAgent(ABC):
     
     def log(self, message: str) -> None:
         """Log a message with the agent's name."""
-        print(f"[{self.name}] {message}")
+        # Agents used on their own, without the pipeline's queued logging, still print
+        if self.logger.hasHandlers():
+            self.logger.info("[%s] %s", self.name, message)
+        else:
+            print(f"[{self.name}] {message}")
@@ -4,8 +4,11 @@ Explains, analyzes, and provides insights about selected code snippets.
 """
 
 import os
+import hashlib
 import subprocess
 import platform
+import threading
+from pathlib import Path
 from typing import Dict, Any
 from openai import OpenAI
 from .base_agent import BaseAgent
@@ -17,9 +20,14 @@ from prompts import (CODE_EXPLANATION_PROMPT, CODE_REVIEW_PROMPT,
 class CodeAnalysisAgent(BaseAgent):
     """Agent that analyzes and explains code through voice."""
     
+    MODEL = "gpt-4"
+    
     def __init__(self, config: dict = None):
         super().__init__("CodeAnalysisAgent", config)
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(api_key=self.config.get("openai_api_key") or os.getenv("OPENAI_API_KEY"))
+        # Analyses are kept on disk by prompt, so asking about the same snippet again skips GPT-4
+        self.cache_dir = Path(self.config.get("analysis_cache_dir") or Path.home() / ".cache" / "mypeer" / "analysis")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def run(self, input_data: Dict[str, Any]) -> str:
         """
@@ -56,25 +64,45 @@ class CodeAnalysisAgent(BaseAgent):
             self.log(f"Error in code analysis: {str(e)}")
             return "I encountered an issue while analyzing the code. Could you try again?"
     
+    def _complete(self, system_prompt: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Run a GPT-4 analysis, reusing the cached answer for an identical prompt and settings."""
+        # Sampling settings are part of the key, so a cached answer is only reused for the same request
+        request = "\0".join((self.MODEL, str(temperature), str(max_tokens), system_prompt, prompt))
+        key = hashlib.blake2b(request.encode("utf-8"), digest_size=16).hexdigest()
+        cache_path = self.cache_dir / f"{key}.txt"
+        if cache_path.exists():
+            self.log("Using cached analysis")
+            return cache_path.read_text(encoding="utf-8")
+        
+        response = self.client.chat.completions.create(
+            model=self.MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        analysis = response.choices[0].message.content.strip()
+        
+        # Write next to the cache entry and rename, so a partial write is never read back;
+        # the temp name is per process and thread, so concurrent writers never share one
+        partial_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.part")
+        partial_path.write_text(analysis, encoding="utf-8")
+        os.replace(partial_path, cache_path)
+        return analysis
+    
     def _explain_code(self, code: str, language: str = "auto") -> str:
         """Explain what the code does in simple terms."""
         
         prompt = format_code_prompt(CODE_EXPLANATION_PROMPT, code, language)
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert code analyst providing voice-friendly explanations."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=500
+            return self._complete(
+                "You are an expert code analyst providing voice-friendly explanations.",
+                prompt, temperature=0.7, max_tokens=500
             )
-            
-            explanation = response.choices[0].message.content.strip()
-            return explanation
-            
+
         except Exception as e:
             self.log(f"Error generating code explanation: {str(e)}")
             return "I had trouble analyzing this code. Could you try selecting a smaller code snippet?"
@@ -85,18 +113,11 @@ class CodeAnalysisAgent(BaseAgent):
         prompt = format_code_prompt(CODE_REVIEW_PROMPT, code, language)
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a senior developer conducting a friendly code review."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=400
+            return self._complete(
+                "You are a senior developer conducting a friendly code review.",
+                prompt, temperature=0.6, max_tokens=400
             )
-            
-            return response.choices[0].message.content.strip()
-            
+
         except Exception as e:
             self.log(f"Error in code review: {str(e)}")
             return "I couldn't complete the code review. Please try again with the code snippet."
@@ -107,18 +128,11 @@ class CodeAnalysisAgent(BaseAgent):
         prompt = format_code_prompt(CODE_OPTIMIZATION_PROMPT, code, language)
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a performance optimization specialist providing voice-friendly advice."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.6,
-                max_tokens=400
+            return self._complete(
+                "You are a performance optimization specialist providing voice-friendly advice.",
+                prompt, temperature=0.6, max_tokens=400
             )
-            
-            return response.choices[0].message.content.strip()
-            
+
         except Exception as e:
             self.log(f"Error suggesting optimizations: {str(e)}")
             return "I couldn't analyze the code for optimizations. Please try again."
@@ -129,18 +143,11 @@ class CodeAnalysisAgent(BaseAgent):
         prompt = format_code_prompt(CODE_DEBUG_PROMPT, code, language)
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a debugging expert providing voice-friendly analysis."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=400
+            return self._complete(
+                "You are a debugging expert providing voice-friendly analysis.",
+                prompt, temperature=0.5, max_tokens=400
             )
-            
-            return response.choices[0].message.content.strip()
-            
+
         except Exception as e:
             self.log(f"Error in debug analysis: {str(e)}")
             return "I couldn't complete the debugging analysis. Please try again."
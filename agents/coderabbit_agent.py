@@ -5,6 +5,7 @@ Integrates CodeRabbit CLI for AI-powered code reviews
 """
 
 import os
+import shutil
 import subprocess
 import tempfile
 from typing import Dict, List, Optional
@@ -12,7 +13,8 @@ from .base_agent import BaseAgent
 from prompts import (
     CODERABBIT_SUMMARIZATION_PROMPT,
     CODERABBIT_RATE_LIMIT_MESSAGE,
-    CODERABBIT_TIMEOUT_MESSAGE
+    CODERABBIT_TIMEOUT_MESSAGE,
+    render_prompt
 )
 
 
@@ -25,25 +27,24 @@ class CodeRabbitAgent(BaseAgent):
         
     def _find_coderabbit_path(self) -> str:
         """Find CodeRabbit CLI path"""
-        try:
-            # Try to find coderabbit in PATH
-            result = subprocess.run(['which', 'coderabbit'], 
-                                 capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except subprocess.CalledProcessError:
-            # Fallback to common installation paths
-            possible_paths = [
-                os.path.expanduser("~/.local/bin/coderabbit"),
-                "/usr/local/bin/coderabbit",
-                "/opt/homebrew/bin/coderabbit"
-            ]
-            
-            for path in possible_paths:
-                if os.path.exists(path):
-                    return path
-            
-            # If not found, return 'coderabbit' and let subprocess handle it
-            return "coderabbit"
+        # Try to find coderabbit in PATH (in-process, rather than forking `which`)
+        path = shutil.which('coderabbit')
+        if path:
+            return path
+        
+        # Fallback to common installation paths
+        possible_paths = [
+            os.path.expanduser("~/.local/bin/coderabbit"),
+            "/usr/local/bin/coderabbit",
+            "/opt/homebrew/bin/coderabbit"
+        ]
+        
+        for path in possible_paths:
+            if os.path.exists(path):
+                return path
+        
+        # If not found, return 'coderabbit' and let subprocess handle it
+        return "coderabbit"
     
     def run(self, input_data: str) -> str:
         """
@@ -239,7 +240,7 @@ class CodeRabbitAgent(BaseAgent):
             from langchain_openai import ChatOpenAI
             
             # Use prompt from prompts.py
-            prompt = CODERABBIT_SUMMARIZATION_PROMPT.format(review_output=review_output)
+            prompt = render_prompt(CODERABBIT_SUMMARIZATION_PROMPT, review_output=review_output)
             
             # Use GPT-4 for summarization
             llm = ChatOpenAI(model="gpt-4", temperature=0.3)
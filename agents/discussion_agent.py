@@ -4,24 +4,70 @@ Handles questions, explanations, and general conversation.
 """
 
 import os
+import atexit
+import hashlib
+import threading
+import weakref
+import concurrent.futures
+import numpy as np
+from pathlib import Path
 from openai import OpenAI
 from .base_agent import BaseAgent
-from prompts import DISCUSSION_SYSTEM_PROMPT, DISCUSSION_PROGRAMMING_PROMPT
+from prompts import DISCUSSION_SYSTEM_PROMPT, DISCUSSION_PROGRAMMING_PROMPT, render_prompt
+
+# Agents whose caches are written at exit; held weakly, so finished agents aren't kept alive for it
+_live_agents = weakref.WeakSet()
+
+
+@atexit.register
+def _save_live_caches() -> None:
+    for agent in list(_live_agents):
+        agent._save_cache()
 
 
 class DiscussionAgent(BaseAgent):
     """Agent that handles questions and discussion through voice."""
     
+    MODEL = "gpt-4"
+    TEMPERATURE = 0.7
+    MAX_TOKENS = 250  # Keep responses concise for voice
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    # Cosine similarity above which a new question reuses an earlier answer
+    CACHE_THRESHOLD = 0.92
+    # Oldest answers are dropped beyond this many
+    CACHE_MAX_ENTRIES = 256
+    
     def __init__(self, config: dict = None):
         super().__init__("DiscussionAgent", config)
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(api_key=self.config.get("openai_api_key") or os.getenv("OPENAI_API_KEY"))
+        # Answers are cached by question embedding, so rephrasings of an earlier question skip GPT-4
+        cache_dir = Path(self.config.get("discussion_cache_dir") or Path.home() / ".cache" / "mypeer")
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_path = cache_dir / "discussion_cache.npz"
+        # Saved answers only count for the model settings and prompt they were generated with
+        self._cache_key = hashlib.sha1(
+            f"{self.MODEL}|{self.TEMPERATURE}|{self.MAX_TOKENS}|{self.EMBEDDING_MODEL}|{DISCUSSION_SYSTEM_PROMPT}".encode("utf-8")
+        ).hexdigest()
+        # run() may be called from the pipeline's speculation thread and its main thread at once
+        self._cache_lock = threading.Lock()
+        self._cache_embeddings, self._cache_answers = self._load_cache()
+        self._cache_dirty = False
+        # The latest answer to a question the user hasn't confirmed yet: (question, embedding, answer)
+        self._unconfirmed = None
+        # The cache is written once at exit rather than on every new answer
+        _live_agents.add(self)
+        # Questions being answered right now, so a repeat asked meanwhile waits for the same answer
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
     
-    def run(self, input_data: str) -> str:
+    def run(self, input_data: str, confirmed: bool = True) -> str:
         """
         Handle discussion/question requests.
         
         Args:
             input_data: User's question or discussion topic
+            confirmed: False when answering ahead of the user's confirmation; the answer is only
+                cached once remember() is called for it
             
         Returns:
             Response text to be spoken back to user
@@ -29,8 +75,8 @@ class DiscussionAgent(BaseAgent):
         try:
             self.log(f"Processing discussion request: '{input_data}'")
             
-            # Generate response using GPT-4
-            response = self._generate_discussion_response(input_data)
+            # Generate response using GPT-4, sharing the call if the same question is already in flight
+            response = self._answer_once(input_data, confirmed)
             
             self.log(f"Generated response ({len(response)} characters)")
             
@@ -40,20 +86,111 @@ class DiscussionAgent(BaseAgent):
             self.log(f"Error in discussion: {str(e)}")
             return "I'm sorry, I had trouble processing your question. Could you please try asking it differently?"
     
-    def _generate_discussion_response(self, question: str) -> str:
+    def remember(self, question: str) -> None:
+        """Cache the answer given ahead of confirmation, now that the user has confirmed the question."""
+        with self._cache_lock:
+            unconfirmed, self._unconfirmed = self._unconfirmed, None
+        if unconfirmed is not None and unconfirmed[0] == question:
+            self._store_answer(unconfirmed[1], unconfirmed[2])
+    
+    def _answer_once(self, question: str, confirmed: bool = True) -> str:
+        """Generate the answer, or wait for the identical question another caller is answering."""
+        key = " ".join(question.lower().split())
+        with self._inflight_lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                self._inflight[key] = future = concurrent.futures.Future()
+        if pending is not None:
+            self.log("Same question already in flight, waiting for its answer")
+            return pending.result()
+        
+        try:
+            answer = self._generate_discussion_response(question, confirmed)
+            future.set_result(answer)
+            return answer
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _load_cache(self):
+        """Read the embedding matrix and answers saved by earlier sessions with the same settings."""
+        try:
+            with np.load(self.cache_path) as data:
+                if str(data["key"]) != self._cache_key:
+                    return None, []
+                return data["embeddings"], [str(answer) for answer in data["answers"]]
+        except (OSError, KeyError, ValueError):
+            return None, []
+    
+    def _save_cache(self) -> None:
+        """Persist the cache if it gained answers this session."""
+        with self._cache_lock:
+            if not self._cache_dirty:
+                return
+            embeddings, answers = self._cache_embeddings, list(self._cache_answers)
+            self._cache_dirty = False
+        try:
+            partial_path = self.cache_path.with_suffix(f".{os.getpid()}.part.npz")
+            np.savez(partial_path, key=self._cache_key, embeddings=embeddings, answers=np.array(answers))
+            os.replace(partial_path, self.cache_path)
+        except OSError as e:
+            self.log(f"Error saving discussion cache: {str(e)}")
+    
+    def _embed(self, text: str):
+        """Unit-length embedding of the question, or None if the API call fails."""
+        try:
+            response = self.client.embeddings.create(model=self.EMBEDDING_MODEL, input=text.strip().lower())
+        except Exception as e:
+            self.log(f"Error embedding question: {str(e)}")
+            return None
+        return np.asarray(response.data[0].embedding, dtype=np.float32)
+    
+    def _cached_answer(self, embedding) -> str:
+        """Answer to the most similar cached question, if it is close enough."""
+        if embedding is None:
+            return None
+        with self._cache_lock:
+            if self._cache_embeddings is None:
+                return None
+            scores = self._cache_embeddings @ embedding
+            best = int(np.argmax(scores))
+            return self._cache_answers[best] if scores[best] >= self.CACHE_THRESHOLD else None
+    
+    def _store_answer(self, embedding, answer: str) -> None:
+        """Add an answer to the cache, dropping the oldest beyond CACHE_MAX_ENTRIES."""
+        if embedding is None:
+            return
+        with self._cache_lock:
+            if self._cache_embeddings is None:
+                self._cache_embeddings = embedding[np.newaxis, :]
+            else:
+                self._cache_embeddings = np.vstack([self._cache_embeddings, embedding])[-self.CACHE_MAX_ENTRIES:]
+            self._cache_answers = (self._cache_answers + [answer])[-self.CACHE_MAX_ENTRIES:]
+            self._cache_dirty = True
+    
+    def _generate_discussion_response(self, question: str, confirmed: bool = True) -> str:
         """Generate a conversational response using GPT-4."""
         
+        embedding = self._embed(question)
+        cached = self._cached_answer(embedding)
+        if cached is not None:
+            self.log("Answering from discussion cache")
+            return cached
+        
         system_prompt = DISCUSSION_SYSTEM_PROMPT
 
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": question}
                 ],
-                temperature=0.7,
-                max_tokens=250  # Keep responses concise for voice
+                temperature=self.TEMPERATURE,
+                max_tokens=self.MAX_TOKENS
             )
             
             answer = response.choices[0].message.content.strip()
@@ -63,6 +200,11 @@ class DiscussionAgent(BaseAgent):
                 # Truncate and add continuation offer
                 answer = answer[:400] + "... Would you like me to explain more about any specific part?"
             
+            if confirmed:
+                self._store_answer(embedding, answer)
+            else:
+                with self._cache_lock:
+                    self._unconfirmed = (question, embedding, answer)
             return answer
             
         except Exception as e:
@@ -72,7 +214,7 @@ class DiscussionAgent(BaseAgent):
     def handle_programming_question(self, question: str) -> str:
         """Handle specific programming-related questions."""
         
-        programming_prompt = DISCUSSION_PROGRAMMING_PROMPT.format(question=question)
+        programming_prompt = render_prompt(DISCUSSION_PROGRAMMING_PROMPT, question=question)
 
         try:
             response = self.client.chat.completions.create(
@@ -4,12 +4,22 @@ Handles file-related voice commands like opening, reading, and editing files.
 """
 
 import os
+import re
 import subprocess
 import platform
 from pathlib import Path
 from typing import Dict, Any, List
 from .base_agent import BaseAgent
 
+# (action, whole-word pattern) in priority order. Whole words keep "remove_duplicates.py" from
+# reading as "move" and "exchange_rates.py" from reading as "change".
+_FILE_ACTION_PATTERNS = tuple((action, re.compile(rf"\b(?:{'|'.join(words)})\b")) for action, words in (
+    ("modify_file", ("rename", "move", "copy", "change")),  # Not supported; run() says so rather than opening the file
+    ("open_file", ("open", "launch", "start")),
+    ("show_file", ("read", "show", "display", "contents")),
+    ("list_files", ("list", "files", "directory"))
+))
+
 
 class FileAgent(BaseAgent):
     """Agent that handles file operations through voice commands."""
@@ -186,15 +196,8 @@ class FileAgent(BaseAgent):
         """Extract file operation details from user request."""
         request_lower = user_request.lower()
         
-        # Determine action
-        if any(word in request_lower for word in ["open", "launch", "start"]):
-            action = "open_file"
-        elif any(word in request_lower for word in ["read", "show", "display", "contents"]):
-            action = "show_file"
-        elif any(word in request_lower for word in ["list", "files", "directory"]):
-            action = "list_files"
-        else:
-            action = "open_file"  # Default
+        # Determine action, opening the file by default
+        action = next((action for action, pattern in _FILE_ACTION_PATTERNS if pattern.search(request_lower)), "open_file")
         
         # Extract filename
         filename = self._extract_filename(user_request)
@@ -1,22 +1,67 @@
 """
-Intent Classification Agent using GPT-4.
+Intent Classification Agent using OpenAI structured outputs.
 Determines user intent to route to appropriate agents and modes.
 """
 
 import os
+import re
 import json
+from collections import Counter
 from typing import Dict, Any
 from openai import OpenAI
 from .base_agent import BaseAgent
 from prompts import INTENT_CLASSIFICATION_PROMPT, format_user_request_prompt
 
+# Phrases that settle the intent without an LLM round-trip, with the action the classifier
+# would report for them. Matched as whole words in a single compiled alternation.
+_INTENT_PHRASES = {
+    "coding": ("write a", "write me", "create a", "build a", "make a", "generate", "implement"),
+    "file_operations": ("open file", "open the file", "read the file", "show me the contents", "edit file"),
+    "code_analysis": ("explain this code", "explain the code", "review my code", "review this code",
+                      "analyze this", "debug this", "optimize this", "what does this function do"),
+    "discussion": ("what is", "how does", "why does", "can you help me understand", "tell me about"),
+}
+_INTENT_ACTIONS = {
+    "coding": "generate_code",
+    "file_operations": "open_file",
+    "code_analysis": "analyze_code",
+    "discussion": "discuss",
+}
+# Structured output schema for the GPT fallback, so the reply always parses and carries no extra prose
+_INTENT_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "intent_classification",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "intent": {"type": "string", "enum": ["coding", "discussion", "file_operations", "code_analysis"]},
+                "confidence": {"type": "number"},
+                "action": {"type": "string"},
+                "message": {"type": "string"},
+            },
+            "required": ["intent", "confidence", "action", "message"],
+            "additionalProperties": False,
+        },
+    },
+}
+_PHRASE_INTENTS = {phrase: intent for intent, phrases in _INTENT_PHRASES.items() for phrase in phrases}
+_INTENT_PHRASE_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(p) for p in sorted(_PHRASE_INTENTS, key=len, reverse=True)) + r")\b",
+    re.ASCII,
+)
+
 
 class IntentAgent(BaseAgent):
     """Agent that classifies user intent to route to appropriate handlers."""
     
+    # Structured outputs need a model from the gpt-4o family
+    MODEL = "gpt-4o-mini"
+    
     def __init__(self, config: dict = None):
         super().__init__("IntentAgent", config)
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(api_key=self.config.get("openai_api_key") or os.getenv("OPENAI_API_KEY"))
     
     def run(self, input_data: str) -> Dict[str, Any]:
         """
@@ -40,8 +85,8 @@ class IntentAgent(BaseAgent):
                     "message": "Goodbye session detected"
                 }
             
-            # Use GPT-4 for intent classification
-            classification = self._classify_with_gpt4(input_data)
+            # Obvious phrasings are classified locally; only ambiguous requests go to the model
+            classification = self._classify_with_keywords(input_data) or self._classify_with_model(input_data)
             
             self.log(f"Classified intent: {classification['intent']} (confidence: {classification['confidence']})")
             
@@ -71,41 +116,50 @@ class IntentAgent(BaseAgent):
         text_lower = text.lower().strip()
         return any(phrase in text_lower for phrase in exit_phrases)
     
-    def _classify_with_gpt4(self, user_request: str) -> Dict[str, Any]:
-        """Use GPT-4 to classify the user's intent."""
+    def _classify_with_keywords(self, text: str):
+        """Classify from known phrases when they all point at one intent, else return None."""
+        text_lower = text.lower().strip()
+        matches = list(_INTENT_PHRASE_PATTERN.finditer(text_lower))
+        hits = Counter(_PHRASE_INTENTS[m.group(0)] for m in matches)
+        if len(hits) != 1:
+            return None
+        intent, count = hits.most_common(1)[0]
+        # One phrase is enough when the request opens with it ("write a ...", "what is ...")
+        if count < 2 and matches[0].start() != 0:
+            return None
+        return {
+            "intent": intent,
+            "confidence": 0.9,
+            "action": _INTENT_ACTIONS[intent],
+            "extracted_info": {},
+            "message": f"Matched {intent} phrase '{matches[0].group(0)}'"
+        }
+
+    def _classify_with_model(self, user_request: str) -> Dict[str, Any]:
+        """Use the LLM, constrained to the intent schema, to classify the user's intent."""
         
         prompt = format_user_request_prompt(INTENT_CLASSIFICATION_PROMPT, user_request)
 
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.MODEL,
                 messages=[
-                    {"role": "system", "content": "You are an intent classification expert. Always respond with valid JSON."},
+                    {"role": "system", "content": "You are an intent classification expert."},
                     {"role": "user", "content": prompt}
                 ],
                 temperature=0.1,
-                max_tokens=300
+                max_tokens=150,
+                response_format=_INTENT_RESPONSE_FORMAT
             )
             
-            result_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
-            classification = json.loads(result_text)
-            
-            # Validate required fields
-            required_fields = ["intent", "confidence", "action", "message"]
-            for field in required_fields:
-                if field not in classification:
-                    raise ValueError(f"Missing required field: {field}")
-            
-            # Add extracted_info if missing
-            if "extracted_info" not in classification:
-                classification["extracted_info"] = {}
+            # The schema guarantees the fields; extracted_info is kept for callers that read it
+            classification = json.loads(response.choices[0].message.content)
+            classification["extracted_info"] = {}
             
             return classification
             
         except Exception as e:
-            self.log(f"Error in GPT-4 classification: {str(e)}")
+            self.log(f"Error in model classification: {str(e)}")
             # Return default classification
             return {
                 "intent": "discussion",
@@ -14,9 +14,12 @@ from prompts import CODE_SYSTEM_PROMPT, CODE_GENERATION_PROMPT, format_tasks_pro
 class ProgrammingAgent(BaseAgent):
     """Agent that generates programming code from to-do lists."""
     
+    # Routes every code-generation call to the same prompt cache, since they share the system prompt
+    PROMPT_CACHE_KEY = "mypeer-code-generation"
+    
     def __init__(self, config: dict = None):
         super().__init__("ProgrammingAgent", config)
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(api_key=self.config.get("openai_api_key") or os.getenv("OPENAI_API_KEY"))
         self.output_file = config.get('output_file', 'pair_program.py') if config else 'pair_program.py'
     
     def run(self, input_data: List[str]) -> str:
@@ -49,17 +52,35 @@ class ProgrammingAgent(BaseAgent):
         """Generate code from the to-do list."""
         prompt = self._create_code_prompt(todo_list)
         
-        response = self.client.chat.completions.create(
+        stream = self.client.chat.completions.create(
             model="gpt-4",
             messages=[
                 {"role": "system", "content": self._get_system_prompt()},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.2,
-            max_tokens=2000
+            max_tokens=2000,
+            extra_body={"prompt_cache_key": self.PROMPT_CACHE_KEY},
+            stream=True
         )
         
-        generated_code = response.choices[0].message.content.strip()
+        # Echo the code as it streams in, so the user sees progress instead of waiting for the whole file.
+        # It goes out a line at a time through _echo, so it stays in order with the queued log messages.
+        self._echo("\n" + "="*60)
+        chunks = []
+        pending_line = ""
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                chunks.append(delta)
+                *lines, pending_line = (pending_line + delta).split("\n")
+                for line in lines:
+                    self._echo(line)
+        if pending_line:
+            self._echo(pending_line)
+        self._echo("="*60)
+        
+        generated_code = "".join(chunks).strip()
         
         # Extract code from markdown if present
         if "```python" in generated_code:
@@ -77,7 +98,7 @@ class ProgrammingAgent(BaseAgent):
     
     def _get_system_prompt(self) -> str:
         """Get the system prompt for code generation."""
-        return PROGRAMMING_SYSTEM_PROMPT
+        return CODE_SYSTEM_PROMPT
     
     def _create_code_prompt(self, todo_list: List[str]) -> str:
         """Create the prompt for code generation."""
@@ -137,6 +158,14 @@ Generated at: {self._get_timestamp()}
             self.log(f"Error validating code: {e}")
             return False
     
+    def _echo(self, text: str) -> None:
+        """Show generated code on the same stream as the agent's log messages."""
+        # Same rule as BaseAgent.log, minus the agent-name prefix so the code can be copied as-is
+        if self.logger.hasHandlers():
+            self.logger.info("%s", text)
+        else:
+            print(text, flush=True)
+    
     def preview_code(self, file_path: str) -> None:
         """
         Preview the generated code.
@@ -148,11 +177,11 @@ Generated at: {self._get_timestamp()}
             with open(file_path, 'r', encoding='utf-8') as f:
                 code = f.read()
             
-            print("\n" + "="*60)
-            print(f"GENERATED CODE: {file_path}")
-            print("="*60)
-            print(code)
-            print("="*60)
+            self._echo("\n" + "="*60)
+            self._echo(f"GENERATED CODE: {file_path}")
+            self._echo("="*60)
+            self._echo(code)
+            self._echo("="*60)
             
         except Exception as e:
             self.log(f"Error previewing code: {e}")
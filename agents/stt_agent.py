@@ -7,6 +7,7 @@ __init__ - Initialize the agent
 _initialize_porcupine - Set up wake-up word detection
 set_wake_word_callback - Set callback for wake-up word
 listen_for_wake_word - Listen for "Hey lily"
+_get_pyaudio - Shared PortAudio handle for wake-word listening
 run - Main transcription function
 record_and_transcribe - Fixed-duration recording
 get_voice_confirmation - Voice confirmation (deprecated)
@@ -15,13 +16,19 @@ auto_record_speech - Intelligent speech recording
 _wait_for_speech_start - Wait for speech to begin
 _record_until_silence - Record until silence
 _transcribe_audio_data - Transcribe audio data
+_wav_upload - Encode samples as an in-memory WAV
+_transcribe_file - Send audio to Whisper
+warmup - Prime transcription and PortAudio before the first utterance
 get_voice_confirmation_auto - Auto voice confirmation
 """
 
+import io
 import os
-import tempfile
+import atexit
+import re
 import time
 import threading
+import concurrent.futures
 import numpy as np
 import sounddevice as sd
 import scipy.io.wavfile as wav
@@ -32,13 +39,25 @@ from typing import Union, Optional, Callable
 from openai import OpenAI
 from .base_agent import BaseAgent
 
+# Whole-word yes replies, including common Whisper spellings. Matching words rather than
+# substrings keeps "y" from confirming anything that contains the letter.
+_AFFIRMATIVE_WORDS = frozenset({"yes", "y", "correct", "ok", "okay", "true", "yeah", "yep", "yup", "yea", "approve"})
+_WORD_PATTERN = re.compile(r"[a-z']+")
+
+
+def _is_affirmative(response: str) -> bool:
+    """True if any word of the transcribed reply means yes."""
+    return not _AFFIRMATIVE_WORDS.isdisjoint(_WORD_PATTERN.findall(response.lower()))
+
 
 class STTAgent(BaseAgent):
     """Speech-to-Text Agent using OpenAI Whisper API with automatic voice detection and wake-up word."""
     
+    MODEL = "whisper-1"
+    
     def __init__(self, config: dict = None):
         super().__init__("STTAgent", config)
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(api_key=self.config.get("openai_api_key") or os.getenv("OPENAI_API_KEY"))
         
         # Voice Activity Detection settings
         self.vad = webrtcvad.Vad(2)  # Aggressiveness level (0-3, 2 is balanced)
@@ -57,6 +76,7 @@ class STTAgent(BaseAgent):
         self.porcupine = None
         self.wake_word_detected = threading.Event()
         self.wake_word_callback = None
+        self._pyaudio = None  # Opened on the first wake-word listen and kept for the process
         self._initialize_porcupine()
     
     def _initialize_porcupine(self):
@@ -65,8 +85,9 @@ class STTAgent(BaseAgent):
             # Initialize Porcupine with default wake word
             self.porcupine = pvporcupine.create(
                 keywords=["blueberry"],  # Default wake word (using available keyword)
-                access_key=os.getenv("PORCUPINE_ACCESS_KEY", ""),  # You'll need to get this from Picovoice
-                sensitivities=[0.5]  # Sensitivity level (0.0 to 1.0)
+                access_key=self.config.get("porcupine_access_key") or os.getenv("PORCUPINE_ACCESS_KEY", ""),  # You'll need to get this from Picovoice
+                # 0.0 to 1.0: higher catches more wake words but also more false wakes
+                sensitivities=[self.config.get("porcupine_sensitivity", 0.5)]
             )
             self.log("Wake-up word detection initialized successfully")
         except Exception as e:
@@ -95,8 +116,7 @@ class STTAgent(BaseAgent):
             self.log(f"🎧 Listening for wake-up word: '{self.wake_word}'")
             
             # Audio stream settings
-            pa = pyaudio.PyAudio()
-            stream = pa.open(
+            stream = self._get_pyaudio().open(
                 rate=self.porcupine.sample_rate,
                 channels=1,
                 format=pyaudio.paInt16,
@@ -104,39 +124,44 @@ class STTAgent(BaseAgent):
                 frames_per_buffer=self.porcupine.frame_length
             )
             
-            start_time = time.time()
-            
-            while True:
-                # Check timeout
-                if timeout and (time.time() - start_time) > timeout:
-                    self.log("Wake-up word listening timeout")
-                    break
-                
-                # Read audio frame
-                pcm = stream.read(self.porcupine.frame_length)
-                pcm = np.frombuffer(pcm, dtype=np.int16)
-                
-                # Process with Porcupine
-                keyword_index = self.porcupine.process(pcm)
+            try:
+                # This loop runs for every 32 ms frame while idle, so its lookups are done once here
+                read, process, frame_length, clock = stream.read, self.porcupine.process, self.porcupine.frame_length, time.time
+                start_time = clock()
                 
-                if keyword_index >= 0:
-                    self.log(f"🎯 Wake-up word detected!")
-                    if self.wake_word_callback:
-                        self.wake_word_callback()
-                    stream.stop_stream()
-                    stream.close()
-                    pa.terminate()
-                    return True
-            
-            stream.stop_stream()
-            stream.close()
-            pa.terminate()
-            return False
+                while True:
+                    # Check timeout
+                    if timeout and (clock() - start_time) > timeout:
+                        self.log("Wake-up word listening timeout")
+                        return False
+                    
+                    # Read audio frame. Porcupine unpacks the samples into a ctypes array itself, and a
+                    # memoryview yields plain ints for that (an ndarray yields a numpy scalar per sample)
+                    pcm = memoryview(read(frame_length)).cast("h")
+                    
+                    # Process with Porcupine
+                    keyword_index = process(pcm)
+                    
+                    if keyword_index >= 0:
+                        self.log(f"🎯 Wake-up word detected!")
+                        if self.wake_word_callback:
+                            self.wake_word_callback()
+                        return True
+            finally:
+                stream.stop_stream()
+                stream.close()
             
         except Exception as e:
             self.log(f"Error in wake-up word detection: {e}")
             return False
     
+    def _get_pyaudio(self) -> pyaudio.PyAudio:
+        """PortAudio handle shared by every wake-word listen; opening one enumerates all devices."""
+        if self._pyaudio is None:
+            self._pyaudio = pyaudio.PyAudio()
+            atexit.register(self._pyaudio.terminate)
+        return self._pyaudio
+    
     def run(self, input_data: Union[str, bytes]) -> str:
         """
         Transcribe audio input to text or process text input directly.
@@ -157,36 +182,16 @@ class STTAgent(BaseAgent):
             if isinstance(input_data, str) and os.path.isfile(input_data):
                 self.log(f"Transcribing audio file: {input_data}")
                 with open(input_data, "rb") as audio_file:
-                    transcript = self.client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        language="en"  # Force English transcription
-                    )
-                transcribed_text = transcript.text
+                    transcribed_text = self._transcribe_file(audio_file)
                 self.log(f"Transcription result: '{transcribed_text}'")
                 return transcribed_text
             
             # Handle raw audio bytes
             elif isinstance(input_data, bytes):
                 self.log("Transcribing audio from bytes")
-                # For bytes, we'd need to save to a temporary file first
-                import tempfile
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                    temp_file.write(input_data)
-                    temp_path = temp_file.name
-                
-                try:
-                    with open(temp_path, "rb") as audio_file:
-                        transcript = self.client.audio.transcriptions.create(
-                            model="whisper-1",
-                            file=audio_file,
-                            language="en"  # Force English transcription
-                        )
-                    transcribed_text = transcript.text
-                    self.log(f"Transcription result: '{transcribed_text}'")
-                    return transcribed_text
-                finally:
-                    os.unlink(temp_path)
+                transcribed_text = self._transcribe_file(("speech.wav", input_data))
+                self.log(f"Transcription result: '{transcribed_text}'")
+                return transcribed_text
             
             else:
                 raise ValueError(f"Unsupported input type: {type(input_data)}")
@@ -211,32 +216,18 @@ class STTAgent(BaseAgent):
             self.log(f"🎤 Recording for {duration} seconds... Speak now!")
             print(f"🔴 RECORDING - Speak now for {duration} seconds...")
             
-            # Record audio
+            # Record 16-bit PCM, the same as auto_record_speech: no float conversion is needed
+            # anywhere, and the WAV upload is a quarter the size of float64 samples
             audio_data = sd.rec(int(duration * sample_rate), 
                                samplerate=sample_rate, 
                                channels=1, 
-                               dtype='float64')
+                               dtype='int16')
             sd.wait()  # Wait until recording is finished
             print("🟢 Recording finished!")
             
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-                wav.write(temp_path, sample_rate, audio_data)
-            
-            try:
-                # Transcribe the recorded audio
-                with open(temp_path, "rb") as audio_file:
-                    transcript = self.client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        language="en"  # Force English transcription
-                    )
-                transcribed_text = transcript.text.strip()
-                self.log(f"Transcribed: '{transcribed_text}'")
-                return transcribed_text
-            finally:
-                os.unlink(temp_path)
+            transcribed_text = self._transcribe_file(self._wav_upload(audio_data, sample_rate)).strip()
+            self.log(f"Transcribed: '{transcribed_text}'")
+            return transcribed_text
                 
         except Exception as e:
             self.log(f"Error in voice recording: {str(e)}")
@@ -261,8 +252,7 @@ class STTAgent(BaseAgent):
             self.log("No voice input detected")
             return False
         
-        affirmative_responses = ['yes', 'y', 'correct', 'ok', 'true', 'yeah', 'yep', 'approve']
-        is_confirmed = any(word in response.lower() for word in affirmative_responses)
+        is_confirmed = _is_affirmative(response)
         
         self.log(f"User response: '{response}' -> {'Confirmed' if is_confirmed else 'Declined'}")
         return is_confirmed
@@ -315,8 +305,8 @@ class STTAgent(BaseAgent):
             
             print("🟢 Recording complete!")
             
-            # Save and transcribe
-            return self._transcribe_audio_data(audio_data)
+            # Drop the silence that ended the recording so it isn't uploaded, then transcribe
+            return self._transcribe_audio_data(self._trim_trailing_silence(audio_data))
             
         except Exception as e:
             self.log(f"Error in auto speech recording: {str(e)}")
@@ -332,7 +322,6 @@ class STTAgent(BaseAgent):
         Returns:
             True if speech detected, False if timeout
         """
-        start_time = time.time()
         chunk_size = self.frame_size
         
         # Callback to check for speech
@@ -341,28 +330,19 @@ class STTAgent(BaseAgent):
         def audio_callback(indata, frames, time_info, status):
             if status:
                 return
-                
-            # Convert to bytes for VAD
-            audio_bytes = (indata[:, 0] * 32767).astype(np.int16).tobytes()
             
             # Check if speech is detected
-            if len(audio_bytes) >= self.frame_size * 2:  # 2 bytes per sample
-                frame = audio_bytes[:self.frame_size * 2]
-                if self.is_speech(frame):
-                    speech_detected.set()
+            if frames >= self.frame_size and self.is_speech(self._frame_bytes(indata)):
+                speech_detected.set()
         
-        # Start listening
+        # Start listening; int16 input is what VAD reads, so frames need no conversion
         with sd.InputStream(callback=audio_callback, 
                            channels=1, 
                            samplerate=self.sample_rate,
-                           blocksize=chunk_size):
-            
-            while not speech_detected.is_set():
-                if time.time() - start_time > timeout:
-                    return False
-                time.sleep(0.1)
-        
-        return True
+                           blocksize=chunk_size,
+                           dtype="int16"):
+            # Wakes as soon as the callback sees speech rather than on the next poll
+            return speech_detected.wait(timeout)
     
     def _record_until_silence(self, max_duration: int) -> np.ndarray:
         """
@@ -372,28 +352,27 @@ class STTAgent(BaseAgent):
             max_duration: Maximum recording duration
             
         Returns:
-            Recorded audio data
+            Recorded 16-bit PCM samples (a view of the capture buffer)
         """
-        audio_data = []
+        # Blocks are copied once, straight from the stream into a buffer sized for the whole
+        # recording; the extra frame leaves room for the block that arrives as time runs out
+        audio_buffer = np.empty(int(max_duration * self.sample_rate) + self.frame_size, dtype=np.int16)
+        recorded = 0
         silence_start = None
-        recording = True
+        stopped = threading.Event()
         
         def audio_callback(indata, frames, time_info, status):
-            nonlocal silence_start, recording
+            nonlocal recorded, silence_start
             
-            if not recording:
+            if stopped.is_set():
                 return
-                
-            audio_data.extend(indata[:, 0])
             
-            # Convert to bytes for VAD
-            audio_bytes = (indata[:, 0] * 32767).astype(np.int16).tobytes()
+            count = min(frames, len(audio_buffer) - recorded)
+            audio_buffer[recorded:recorded + count] = indata[:count, 0]
+            recorded += count
             
             # Check for speech in this frame
-            has_speech = False
-            if len(audio_bytes) >= self.frame_size * 2:
-                frame = audio_bytes[:self.frame_size * 2]
-                has_speech = self.is_speech(frame)
+            has_speech = frames >= self.frame_size and self.is_speech(self._frame_bytes(indata))
             
             # Track silence
             if has_speech:
@@ -402,54 +381,89 @@ class STTAgent(BaseAgent):
                 if silence_start is None:
                     silence_start = time.time()
                 elif time.time() - silence_start > self.silence_threshold:
-                    recording = False  # Stop recording
+                    stopped.set()  # Stop recording
         
-        # Start recording
-        start_time = time.time()
+        # Start recording; returns as soon as the callback hears enough silence
         with sd.InputStream(callback=audio_callback,
                            channels=1,
                            samplerate=self.sample_rate,
-                           blocksize=self.frame_size):
+                           blocksize=self.frame_size,
+                           dtype="int16"):
+            stopped.wait(max_duration)
+        
+        return audio_buffer[:recorded]
+    
+    def _frame_bytes(self, pcm: np.ndarray) -> memoryview:
+        """First VAD frame of 16-bit PCM as a byte view, without copying."""
+        return memoryview(pcm[:self.frame_size]).cast("B")
+    
+    def _trim_trailing_silence(self, audio_data: np.ndarray) -> np.ndarray:
+        """
+        Cut the non-speech tail left by silence-based stopping.
+        
+        Args:
+            audio_data: Recorded 16-bit PCM samples
             
-            while recording and (time.time() - start_time) < max_duration:
-                time.sleep(0.1)
+        Returns:
+            Audio data up to the last voiced frame plus a short pad
+        """
+        end = len(audio_data) - len(audio_data) % self.frame_size
+        
+        # Walk back frame by frame; the tail is at most silence_threshold seconds long
+        while end >= self.frame_size:
+            if self.is_speech(self._frame_bytes(audio_data[end - self.frame_size:end])):
+                break
+            end -= self.frame_size
+        
+        if end < self.frame_size:
+            return audio_data  # No voiced frame found, let Whisper decide
         
-        return np.array(audio_data)
+        pad = int(self.sample_rate * 0.3)
+        return audio_data[:end + pad]
     
     def _transcribe_audio_data(self, audio_data: np.ndarray) -> str:
         """
         Transcribe audio data using OpenAI Whisper.
         
         Args:
-            audio_data: Audio data array
+            audio_data: Recorded 16-bit PCM samples
             
         Returns:
             Transcribed text
         """
         try:
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = temp_file.name
-                wav.write(temp_path, self.sample_rate, audio_data.astype(np.float32))
-            
-            try:
-                # Transcribe
-                with open(temp_path, "rb") as audio_file:
-                    transcript = self.client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        language="en"  # Force English transcription
-                    )
-                transcribed_text = transcript.text.strip()
-                self.log(f"Transcribed: '{transcribed_text}'")
-                return transcribed_text
-            finally:
-                os.unlink(temp_path)
+            # 16-bit PCM is what Whisper works from and half the upload of float32
+            transcribed_text = self._transcribe_file(self._wav_upload(audio_data, self.sample_rate)).strip()
+            self.log(f"Transcribed: '{transcribed_text}'")
+            return transcribed_text
                 
         except Exception as e:
             self.log(f"Error transcribing audio: {str(e)}")
             return ""
     
+    def _wav_upload(self, audio_data: np.ndarray, sample_rate: int) -> tuple:
+        """Encode samples as an in-memory WAV upload; no temp file to write, reopen and delete"""
+        buffer = io.BytesIO()
+        wav.write(buffer, sample_rate, audio_data)
+        return ("speech.wav", buffer.getvalue())
+    
+    def _transcribe_file(self, audio_file) -> str:
+        """Send an open audio file or a (filename, bytes) upload to Whisper"""
+        transcript = self.client.audio.transcriptions.create(
+            model=self.MODEL,
+            file=audio_file,
+            language="en"  # Force English transcription
+        )
+        return transcript.text
+    
+    def warmup(self) -> None:
+        """Send a second of silence through transcription so the first real utterance doesn't pay
+        for the API connection setup. PortAudio is opened for wake-word listening at the same time."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt-warmup") as pool:
+            if self.wake_word_enabled:
+                pool.submit(self._get_pyaudio)
+            self._transcribe_audio_data(np.zeros(self.sample_rate, dtype=np.int16))
+    
     def get_voice_confirmation_auto(self, prompt: str = "Please respond with yes or no") -> bool:
         """
         Get voice confirmation with automatic detection (no typing fallback).
@@ -469,8 +483,7 @@ class STTAgent(BaseAgent):
             self.log("No voice input detected")
             return False
         
-        affirmative_responses = ['yes', 'y', 'correct', 'ok', 'true', 'yeah', 'yep', 'approve']
-        is_confirmed = any(word in response.lower() for word in affirmative_responses)
+        is_confirmed = _is_affirmative(response)
         
         self.log(f"User response: '{response}' -> {'Confirmed' if is_confirmed else 'Declined'}")
         return is_confirmed
\ No newline at end of file
@@ -8,7 +8,7 @@ import json
 from typing import List
 from openai import OpenAI
 from .base_agent import BaseAgent
-from prompts import TODO_SYSTEM_PROMPT, TODO_CREATION_PROMPT
+from prompts import TODO_SYSTEM_PROMPT, TODO_CREATION_PROMPT, render_prompt
 
 
 class TodoAgent(BaseAgent):
@@ -16,7 +16,7 @@ class TodoAgent(BaseAgent):
     
     def __init__(self, config: dict = None):
         super().__init__("TodoAgent", config)
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(api_key=self.config.get("openai_api_key") or os.getenv("OPENAI_API_KEY"))
     
     def run(self, input_data: str) -> List[str]:
         """
@@ -65,7 +65,7 @@ class TodoAgent(BaseAgent):
     
     def _create_todo_prompt(self, request: str) -> str:
         """Create the prompt for to-do generation."""
-        return TODO_CREATION_PROMPT.format(request=request)
+        return render_prompt(TODO_CREATION_PROMPT, request=request)
     
     def _parse_todo_response(self, response: str) -> List[str]:
         """Parse the GPT response to extract to-do items."""
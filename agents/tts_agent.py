@@ -4,9 +4,12 @@ Handles voice confirmations and responses to the user.
 """
 
 import os
-import tempfile
+import hashlib
+import threading
+import concurrent.futures
 import pygame
 from pathlib import Path
+from typing import Optional
 from openai import OpenAI
 from .base_agent import BaseAgent
 
@@ -14,20 +17,27 @@ from .base_agent import BaseAgent
 class TTSPromptAgent(BaseAgent):
     """Text-to-Speech Agent for confirmations and responses."""
     
+    MODEL = "tts-1"
+    VOICE = "alloy"  # You can change to: alloy, echo, fable, onyx, nova, shimmer
+    
     def __init__(self, config: dict = None):
         super().__init__("TTSPromptAgent", config)
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        self.client = OpenAI(api_key=self.config.get("openai_api_key") or os.getenv("OPENAI_API_KEY"))
+        # Synthesized audio is kept on disk by content, so repeated prompts skip the TTS API
+        self.cache_dir = Path(self.config.get("tts_cache_dir") or Path.home() / ".cache" / "mypeer" / "tts")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         # Initialize pygame mixer for audio playback
         pygame.mixer.init()
         # Flag to stop TTS when interrupted
         self._stop_tts = False
     
-    def run(self, input_data: str) -> str:
+    def run(self, input_data: str, audio: Optional[concurrent.futures.Future] = None) -> str:
         """
         Convert text to speech and play it back.
         
         Args:
             input_data: Text to convert to speech
+            audio: Pending result of synthesize(input_data), if it was started ahead of playback
             
         Returns:
             The same text that was spoken
@@ -35,23 +45,10 @@ class TTSPromptAgent(BaseAgent):
         try:
             self.log(f"Converting to speech: '{input_data}'")
             
-            # Generate speech using OpenAI TTS
-            response = self.client.audio.speech.create(
-                model="tts-1",
-                voice="alloy",  # You can change to: alloy, echo, fable, onyx, nova, shimmer
-                input=input_data
-            )
-            
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-                temp_path = temp_file.name
-                response.stream_to_file(temp_path)
+            audio_path = audio.result() if audio is not None else self.synthesize(input_data)
             
             # Play the audio
-            self._play_audio(temp_path)
-            
-            # Clean up temporary file
-            os.unlink(temp_path)
+            self._play_audio(str(audio_path))
             
             self.log("Speech playback completed")
             return input_data
@@ -62,6 +59,32 @@ class TTSPromptAgent(BaseAgent):
             print(f"[TTS FALLBACK] {input_data}")
             return input_data
     
+    def synthesize(self, text: str) -> Path:
+        """Return the audio file for the text, generating it with OpenAI TTS unless cached."""
+        audio_path = self._cached_audio_path(text)
+        if audio_path.exists():
+            self.log("Using cached speech")
+            return audio_path
+        
+        response = self.client.audio.speech.create(
+            model=self.MODEL,
+            voice=self.VOICE,
+            input=text
+        )
+        
+        # Write next to the cache entry and rename, so an interrupted download is never replayed.
+        # The process and thread ids keep two concurrent syntheses of the same text (say, from
+        # parallel test workers) from sharing a temp file.
+        partial_path = audio_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.part")
+        response.stream_to_file(partial_path)
+        os.replace(partial_path, audio_path)
+        return audio_path
+    
+    def _cached_audio_path(self, text: str) -> Path:
+        """Location of the cached audio for this text, model and voice."""
+        key = hashlib.sha1(f"{self.MODEL}|{self.VOICE}|{text.strip()}".encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.mp3"
+    
     def _play_audio(self, file_path: str) -> None:
         """Play audio file using pygame with interruption handling."""
         try:
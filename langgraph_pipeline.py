@@ -5,28 +5,602 @@ Supports: Python, JavaScript, Java, C++, C#, Go, Rust, PHP, Ruby, Swift, Kotlin,
 """
 
 import os
+import re
+import json
+import math
+import sys
 import time
+import random
+import collections
+import functools
+import concurrent.futures
+import queue
+import atexit
 import signal
-from typing import TypedDict, Optional, List
+import logging
+import logging.handlers
+from dataclasses import dataclass
+from typing import TypedDict, Optional, List, Tuple, Union
 from dotenv import load_dotenv
 
 # LangGraph and LangChain imports
 from langgraph.graph import StateGraph, END
-from langchain_openai import ChatOpenAI
+# langchain_openai is slow to import and only language detection needs it; see _get_language_llm
 from langchain_core.messages import HumanMessage, SystemMessage
 
 # Import our existing agents
 from agents import (
-    STTAgent, TTSPromptAgent, PythonAgent, DiscussionAgent, CodeAnalysisAgent, CodeRabbitAgent
+    STTAgent, TTSPromptAgent, PythonAgent, DiscussionAgent, CodeAnalysisAgent, CodeRabbitAgent, FileAgent
 )
 from prompts import (
+    render_prompt,
     WELCOME_MESSAGE,
     CODERABBIT_START_MESSAGE,
-    CODERABBIT_ERROR_MESSAGE
+    CODERABBIT_ERROR_MESSAGE,
+    LANGUAGE_DETECTION_SYSTEM_PROMPT,
+    LANGUAGE_DETECTION_PROMPT,
+    LANGUAGE_DETECTION_BATCH_PROMPT,
+    PYTHON_CLASS_TEMPLATE,
+    PYTHON_API_TEMPLATE,
+    PYTHON_HELLO_WORLD_TEMPLATE,
+    PYTHON_FUNCTION_TEMPLATE,
+    PYTHON_DEFAULT_TEMPLATE,
+    JAVASCRIPT_CLASS_TEMPLATE,
+    JAVASCRIPT_API_TEMPLATE,
+    JAVASCRIPT_HELLO_WORLD_TEMPLATE,
+    JAVASCRIPT_FUNCTION_TEMPLATE,
+    JAVASCRIPT_DEFAULT_TEMPLATE,
+    JAVA_HELLO_WORLD_TEMPLATE,
+    JAVA_FUNCTION_TEMPLATE,
+    JAVA_DEFAULT_TEMPLATE,
+    CPP_HELLO_WORLD_TEMPLATE,
+    CPP_FUNCTION_TEMPLATE,
+    CPP_DEFAULT_TEMPLATE,
+    HTML_TEMPLATE,
+    SQL_TEMPLATE,
+    BASH_TEMPLATE
 )
 
-# Load environment variables
-load_dotenv()
+logger = logging.getLogger(__name__)
+_log_listener = None
+_env = None
+_shared_pipeline = None
+
+
+@dataclass(frozen=True)
+class Env:
+    """Environment settings, read once at startup and handed to the agents"""
+    openai_api_key: Optional[str]
+    porcupine_access_key: str
+    porcupine_sensitivity: float
+    log_level: str
+    language_model: str
+
+    def agent_config(self) -> dict:
+        """Config dict passed to agents so they don't re-read the environment"""
+        return {
+            "openai_api_key": self.openai_api_key,
+            "porcupine_access_key": self.porcupine_access_key,
+            "porcupine_sensitivity": self.porcupine_sensitivity
+        }
+
+
+def _read_sensitivity(default: float = 0.5) -> float:
+    """PORCUPINE_SENSITIVITY as a float in [0, 1]; a blank or malformed value falls back to the default"""
+    raw = os.getenv("PORCUPINE_SENSITIVITY", "").strip()
+    if not raw:
+        return default
+    try:
+        sensitivity = float(raw)
+        if math.isnan(sensitivity):
+            raise ValueError(raw)
+    except ValueError:
+        logger.warning(f"PORCUPINE_SENSITIVITY={raw!r} is not a number; using {default}")
+        return default
+    if not 0.0 <= sensitivity <= 1.0:
+        logger.warning(f"PORCUPINE_SENSITIVITY={raw} is outside 0.0 to 1.0; clamping it")
+    return min(1.0, max(0.0, sensitivity))
+
+
+def bootstrap() -> Env:
+    """Load the .env file and snapshot the environment (only the first call does any work)"""
+    global _env
+    if _env is None:
+        load_dotenv()
+        _env = Env(
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            porcupine_access_key=os.getenv("PORCUPINE_ACCESS_KEY", ""),
+            porcupine_sensitivity=_read_sensitivity(),
+            log_level=os.getenv("MYPEER_LOG_LEVEL", "INFO"),
+            language_model=os.getenv("MYPEER_LANGUAGE_MODEL", "gpt-4o-mini")
+        )
+    return _env
+
+
+def configure_logging(level: str = "INFO") -> None:
+    """Send pipeline logs through a background queue listener so nodes never block on stdout.
+
+    Calling this more than once is a no-op.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    # Agent logs ("agents.<Name>") share the queue, so BaseAgent.log never writes to stdout inline
+    for pipeline_logger in (logger, logging.getLogger("agents")):
+        pipeline_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        pipeline_logger.setLevel(level.upper())
+        pipeline_logger.propagate = False
+
+
+# Keyword sets for classifying short spoken replies. Replies are split into whole
+# words first, so "ok" no longer matches "broken" and "no" no longer matches "know".
+_WORD_PATTERN = re.compile(r"[a-z']+")
+_CONFIRM_WORDS = frozenset({"yes", "yeah", "yep", "yup", "yea", "correct", "right", "good", "ok", "okay"})
+# The request read-back takes only a plain yes, without "good"; see _is_affirmative for negations
+_REQUEST_CONFIRM_WORDS = frozenset({"yes", "yeah", "yep", "yup", "yea", "correct", "right", "ok", "okay"})
+_NEGATION_WORDS = frozenset({"no", "nope", "not", "don't", "dont", "isn't", "wrong"})
+_REJECT_WORDS = frozenset({"no", "nope", "wrong", "change", "changes", "different", "modify", "else"})
+_PROCEED_WORDS = frozenset({"yes", "good", "proceed", "ahead", "ok", "okay", "perfect", "great"})
+_CONTINUE_WORDS = frozenset({"yes", "continue", "next", "ahead"})
+_PAUSE_WORDS = frozenset({"wait", "stop", "pause", "hold"})
+_HELP_WORDS = frozenset({"help", "what", "how", "explain", "support", "languages", "options"})
+_LANGUAGE_QUERY_WORDS = frozenset({"languages", "support", "options"})
+_MORE_HELP_WORDS = frozenset({"yes", "yeah", "yep", "sure", "ok", "okay", "help", "more", "another", "continue"})
+_NO_MORE_HELP_WORDS = frozenset({"no", "nope", "don't", "dont", "nothing", "none", "good", "fine", "thanks", "thank"})
+_ALL_SET_PATTERN = re.compile(r"\ball set\b")  # Phrase, not the bare word: "set up a database" is a new request
+
+# Multi-word keyword checks on free-form requests: one compiled alternation per call site
+_FILE_OPERATION_PATTERN = re.compile(
+    r"\b(?:rename|change file|move file|copy file|open (?:the )?file|read (?:the )?file|list (?:the )?files)\b",
+    re.ASCII
+)
+_REVIEW_INTENT_PATTERN = re.compile(r"\b(?:review|check|analyze|examine|look at)\b", re.ASCII)
+_EXPLANATION_INTENT_PATTERN = re.compile(r"\b(?:explain|what|how|why|tell me|describe)\b", re.ASCII)
+_TASK_PATTERN = re.compile(r"\b(?:code|program|function|class|write|create|build|make|generate|review|explain)\b", re.ASCII)
+
+
+def _classify_intent(request_lower: str) -> str:
+    """Route a request to review, explanation or coding; review is the most specific, coding the default"""
+    if _REVIEW_INTENT_PATTERN.search(request_lower):
+        return "review"
+    if _EXPLANATION_INTENT_PATTERN.search(request_lower):
+        return "explanation"
+    return "coding"
+
+
+# Language named in discussion feedback -> rewritten todo. Whole-word matching keeps
+# "java" out of "javascript", "shell" out of "powershell" and "go" out of "good".
+_FEEDBACK_LANGUAGE_PATTERN = re.compile(
+    r"(?<![\w+#])(javascript|typescript|powershell|java|js|python|c\+\+|cpp|go|rust|php|ruby|swift|kotlin|ts|html|css|sql|bash|shell)(?![\w+#])",
+    re.ASCII
+)
+# Canonical language -> (file extension, todo template when feedback names the language).
+# Spoken or short forms resolve through _LANGUAGE_ALIASES first.
+_LANGUAGE_INFO = {
+    "python": ("py", "Create a Python function: {}"),
+    "javascript": ("js", "Create a JavaScript function: {}"),
+    "typescript": ("ts", "Create a TypeScript function: {}"),
+    "java": ("java", "Create a Java function: {}"),
+    "c++": ("cpp", "Create a C++ function: {}"),
+    "csharp": ("cs", None),
+    "go": ("go", "Create a Go function: {}"),
+    "rust": ("rs", "Create a Rust function: {}"),
+    "php": ("php", "Create a PHP function: {}"),
+    "ruby": ("rb", "Create a Ruby function: {}"),
+    "swift": ("swift", "Create a Swift function: {}"),
+    "kotlin": ("kt", "Create a Kotlin function: {}"),
+    "html": ("html", "Create an HTML page: {}"),
+    "css": ("css", "Create CSS styles: {}"),
+    "sql": ("sql", "Create SQL queries: {}"),
+    "bash": ("sh", "Create a Bash script: {}"),
+    "powershell": ("ps1", "Create a PowerShell script: {}"),
+    "yaml": ("yml", None),
+    "json": ("json", None),
+    "xml": ("xml", None)
+}
+_LANGUAGE_ALIASES = {"js": "javascript", "ts": "typescript", "cpp": "c++", "c#": "csharp", "shell": "bash"}
+
+# Languages the language-detection prompt may answer with
+_VALID_LANGUAGES = frozenset({
+    "python", "javascript", "java", "c++", "c#", "go", "rust", "php", "ruby", "swift", "kotlin",
+    "typescript", "html", "css", "sql", "bash", "powershell", "yaml", "json", "xml"
+})
+# Spoken names -> detected language, for answers that need no LLM call. Several different
+# hits, as in "go with rust", are left to the model.
+_SPOKEN_LANGUAGES = {
+    **{language: language for language in _VALID_LANGUAGES},
+    "js": "javascript",
+    "cpp": "c++",
+    "c plus plus": "c++",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "golang": "go",
+    "ts": "typescript",
+    "shell": "bash",
+    "yml": "yaml"
+}
+_SPOKEN_LANGUAGE_PATTERN = re.compile(
+    r"(?<![\w+#])(" + "|".join(re.escape(name) for name in sorted(_SPOKEN_LANGUAGES, key=len, reverse=True)) + r")(?![\w+#])",
+    re.ASCII
+)
+
+
+def _spoken_language(response: str) -> Optional[str]:
+    """The one language a response names outright, or None when it names none or several"""
+    spoken = {_SPOKEN_LANGUAGES[match] for match in _SPOKEN_LANGUAGE_PATTERN.findall(response.lower())}
+    return spoken.pop() if len(spoken) == 1 else None
+
+def _keyword_language(response: str) -> str:
+    """Crude substring match used when the language-detection model can't be reached"""
+    response_lower = response.lower().strip()
+    if "python" in response_lower:
+        return "python"
+    elif "javascript" in response_lower or "js" in response_lower:
+        return "javascript"
+    elif "java" in response_lower:
+        return "java"
+    elif "c++" in response_lower or "cpp" in response_lower:
+        return "c++"
+    else:
+        return "python"
+
+# Conditional-edge routing tables; routers fall back with .get(key, default)
+_CONFIRMATION_ROUTES = {"confirmed": "intent_classification", "re_record": "voice_input"}
+_INTENT_ROUTES = {
+    "coding": "todo_generation",
+    "review": "code_review",
+    "explanation": "code_explanation",
+    "file_operation": "response_generation"  # Already handled; just read the result back
+}
+_TODO_GENERATION_ROUTES = {"coding": "code_generation", "explanation": "code_explanation", "review": "code_review"}
+
+# Per-task fields cleared by response generation. generated_todos is left out on purpose:
+# a shared list in a module constant would be aliased across sessions, so callers pass a fresh [].
+_TASK_RESET = {
+    "user_confirmed": False,
+    "confirmation_status": "",
+    "confirmation_spoken": False,
+    "user_intent": "",
+    "todos_completed": False,
+    "generated_code": "",
+    "code_file_path": "",
+    "code_explanation": "",
+    "code_review": "",
+    "review_score": 0,
+    "user_feedback": "",
+    "feedback_processed": False,
+    "iteration_count": 0,
+    "task_result": "",
+    "task_completed": False,
+    "final_response": "",
+    "current_todo_index": 0
+}
+_NEW_TASK_RESET = {
+    **_TASK_RESET,
+    "pipeline_status": "active",
+    "current_step": "intent_classification"
+}
+_WAKE_WORD_RESET = {
+    **_TASK_RESET,
+    "wake_word_detected": False,
+    "voice_input": "",
+    "transcribed_text": "",
+    "current_step": "wake_word_detection",
+    "pipeline_status": "active"
+}
+
+# Fresh interaction state; like the resets, callers add their own generated_todos list
+_INITIAL_STATE = {
+    **_WAKE_WORD_RESET,
+    "error_message": "",
+    "max_iterations": 3,
+    "interaction_count": 0
+}
+
+# Long answers are spoken in sentence-aligned pieces of about this many characters, so the first
+# piece plays while the rest are still being synthesized
+_SPEECH_CHUNK_CHARS = 150
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s+")
+# How many of those pieces (or queued prompts) are synthesized at once; playback stays in queue order
+_TTS_CONCURRENCY = 3
+
+# A failing interaction is retried after 1, 2, 4, ... seconds (plus jitter, capped), and the
+# session gives up after this many failures in a row
+_MAX_RESTART_ATTEMPTS = 6
+_MAX_RESTART_DELAY = 60
+
+
+def _tokenize(text: str) -> frozenset:
+    """Lowercase a spoken reply and split it into a set of words"""
+    return frozenset(_WORD_PATTERN.findall(text.lower()))
+
+
+def _is_affirmative(words: frozenset, positive_words: frozenset) -> bool:
+    """True when a tokenized reply says yes: any negation wins, so "no, that's not good" never proceeds"""
+    return _NEGATION_WORDS.isdisjoint(words) and not positive_words.isdisjoint(words)
+
+
+def _speech_chunks(text: str) -> List[str]:
+    """Group whole sentences into pieces of up to _SPEECH_CHUNK_CHARS (a longer sentence stays whole)"""
+    chunks = []
+    current = ""
+    for sentence in _SENTENCE_END_PATTERN.split(text.strip()):
+        if current and len(current) + 1 + len(sentence) > _SPEECH_CHUNK_CHARS:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _keyword_pattern(keywords: Tuple[str, ...], plurals: bool = False) -> re.Pattern:
+    """Compile keywords into one whole-word alternation ("go" must not match "good")"""
+    alternation = "|".join(re.escape(keyword) for keyword in keywords)
+    suffix = "(?:e?s)?" if plurals else ""
+    return re.compile(rf"(?<![\w+#])(?:{alternation}){suffix}(?![\w+#])", re.ASCII)
+
+
+# (name, pattern) in priority order: the first category with a hit wins. A language named
+# outright beats an ecosystem hint, so "a python script" is Python and not Bash.
+_CODE_LANGUAGE_PATTERNS = tuple((name, _keyword_pattern(keywords)) for name, keywords in (
+    ("python", ("python",)),
+    ("typescript", ("typescript", "ts")),
+    ("javascript", ("javascript", "js")),
+    ("java", ("java",)),
+    ("cpp", ("c++", "cpp", "c plus plus")),
+    ("csharp", ("c#", "csharp", "c sharp")),
+    ("go", ("golang",)),
+    ("rust", ("rust",)),
+    ("php", ("php",)),
+    ("ruby", ("ruby",)),
+    ("swift", ("swift",)),
+    ("kotlin", ("kotlin",)),
+    ("html", ("html", "css")),
+    ("sql", ("sql",)),
+    ("bash", ("bash", "shell")),
+    ("powershell", ("powershell",)),
+    ("yaml", ("yaml", "yml")),
+    ("json", ("json",)),
+    ("xml", ("xml",))
+))
+_CODE_LANGUAGE_HINT_PATTERNS = tuple((name, _keyword_pattern(keywords)) for name, keywords in (
+    ("javascript", ("node", "react", "vue", "angular")),
+    ("java", ("spring", "maven", "gradle")),
+    ("csharp", ("dotnet", ".net")),
+    ("go", ("go",)),
+    ("rust", ("cargo",)),
+    ("php", ("laravel", "symfony")),
+    ("ruby", ("rails", "sinatra")),
+    ("swift", ("ios", "macos")),
+    ("kotlin", ("android",)),
+    ("html", ("web", "frontend")),
+    ("sql", ("database", "query")),
+    ("bash", ("script", "linux")),
+    ("powershell", ("windows",)),
+    ("yaml", ("config",)),
+    ("json", ("api", "rest")),
+    ("xml", ("soap",))
+))
+_TASK_TYPE_PATTERNS = tuple((name, _keyword_pattern(keywords, plurals=True)) for name, keywords in (
+    ("class", ("class", "object", "oop", "inheritance")),
+    ("api", ("api", "endpoint", "rest", "http")),
+    ("database", ("database", "model", "schema", "table")),
+    ("test", ("test", "unit", "integration", "spec")),
+    ("script", ("script", "automation", "tool")),
+    ("frontend", ("web", "frontend", "ui", "component")),
+    ("backend", ("backend", "server", "service")),
+    ("algorithm", ("algorithm", "data structure", "sort", "search")),
+    ("config", ("config", "configuration", "setup"))
+))
+
+# (pattern, filename) in priority order for naming generated files after the request
+_FILENAME_PATTERNS = tuple((_keyword_pattern(keywords, plurals=plurals), filename) for keywords, plurals, filename in (
+    (("hello world", "print hello"), False, "hello_world"),
+    (("function",), True, "main_function"),
+    (("class",), True, "main_class"),
+    (("api",), True, "api_server"),
+    (("database",), True, "database_model"),
+    (("test",), True, "test_file"),
+    (("script",), True, "script"),
+    (("web", "html"), False, "index"),
+    (("css",), False, "styles"),
+    (("javascript", "js"), False, "main"),
+    (("java",), False, "Main"),
+    (("c++", "cpp"), False, "main"),
+    (("go",), False, "main"),
+    (("rust",), False, "main"),
+    (("php",), False, "index"),
+    (("ruby",), False, "main"),
+    (("swift",), False, "main"),
+    (("kotlin",), False, "Main"),
+    (("sql",), False, "database_schema"),
+    (("bash", "shell"), False, "script"),
+    (("powershell",), False, "script"),
+    (("yaml", "yml"), False, "config"),
+    (("json",), False, "data"),
+    (("xml",), False, "data")
+))
+_DEFAULT_FILENAME_BY_LANGUAGE = {
+    "java": "Main",
+    "kotlin": "Main",
+    "php": "index",
+    "html": "index",
+    "css": "styles",
+    "sql": "database",
+    "bash": "script",
+    "powershell": "script",
+    "yaml": "config",
+    "json": "data",
+    "xml": "data"
+}
+
+@functools.lru_cache(maxsize=512)
+def _classify_code_request(request_lower: str) -> Tuple[str, str, bool]:
+    """Determine (language, task_type, language_specified) for a normalized (lowercased, single-spaced) request"""
+    # Language detection - handles "I want a Java function" type requests. A named language
+    # counts as specified; a hint ("node", "script") or the Python default does not.
+    language = next((name for name, pattern in _CODE_LANGUAGE_PATTERNS if pattern.search(request_lower)), None)
+    language_specified = language is not None
+    if language is None:
+        language = next((name for name, pattern in _CODE_LANGUAGE_HINT_PATTERNS if pattern.search(request_lower)), "python")
+    
+    # Task type detection, defaults to a plain function
+    task_type = next((name for name, pattern in _TASK_TYPE_PATTERNS if pattern.search(request_lower)), "function")
+    
+    return language, task_type, language_specified
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_request(request: str) -> str:
+    """Lowercase and collapse whitespace so equivalent transcripts share cache entries.
+
+    Cached as well, so the helpers that see the same transcript during a turn lowercase it once.
+    """
+    return " ".join(request.lower().split())
+
+
+@functools.lru_cache(maxsize=512)
+def _summarize_request(request: str) -> str:
+    """Summarize a user request in a more natural way (pure, so results are cached)"""
+    request_lower = request.lower()
+    
+    # Extract key action and object with better pattern matching
+    if "write" in request_lower and "function" in request_lower:
+        if "hello world" in request_lower:
+            return "write a function to print hello world"
+        elif "print" in request_lower:
+            return "write a function that prints something"
+        else:
+            return "write a function"
+    elif "create" in request_lower and "function" in request_lower:
+        if "hello world" in request_lower:
+            return "create a hello world function"
+        elif "print" in request_lower:
+            return "create a function that prints something"
+        else:
+            return "create a function"
+    elif "print" in request_lower and "hello world" in request_lower:
+        return "create a function to print hello world"
+    elif "create" in request_lower and "class" in request_lower:
+        return "create a class"
+    elif "create" in request_lower and "api" in request_lower:
+        return "create an API"
+    elif "build" in request_lower:
+        return "build something"
+    elif "make" in request_lower:
+        return "make something"
+    elif "generate" in request_lower:
+        return "generate some code"
+    elif "hello world" in request_lower:
+        return "create a hello world program"
+    elif "print" in request_lower:
+        return "create something that prints"
+    else:
+        # Default summarization - keep more context
+        words = request.split()
+        if len(words) > 8:
+            return f"{' '.join(words[:4])}... {words[-2]} {words[-1]}"
+        elif len(words) > 5:
+            return f"{' '.join(words[:3])}... {words[-1]}"
+        else:
+            return request
+
+
+# Todo plans for recognised request shapes, first match wins. Patterns are plain substring
+# alternations (no word boundaries) so "functions" and "testing" still hit their plans.
+_TODO_PLANS = (
+    (re.compile(r"function"), ("Create the main function with proper parameters", "Implement the function logic")),
+    (re.compile(r"class"), ("Define the class structure and constructor", "Implement class methods")),
+    (re.compile(r"api|endpoint|rest|http"), ("Set up the API framework", "Create the endpoint structure")),
+    (re.compile(r"database|model|schema|table"), ("Design the database schema", "Create the database model")),
+    (re.compile(r"test"), ("Create test cases", "Implement test logic")),
+    (re.compile(r"web|html|css|frontend"), ("Create HTML structure", "Add CSS styling"))
+)
+_CREATE_FILE_TODO = "Create a new file with appropriate name and extension"
+_DEFAULT_TODO_PLAN = ("Implement the requested functionality", "Add proper documentation and comments")
+
+
+@functools.lru_cache(maxsize=512)
+def _todos_for_request(request_lower: str) -> Tuple[str, ...]:
+    """Build the todo plan for a normalized request; a tuple so cached plans can't be mutated"""
+    # Always start with file creation, then the plan for the first matching request shape
+    for pattern, plan in _TODO_PLANS:
+        if pattern.search(request_lower):
+            return (_CREATE_FILE_TODO,) + plan
+    return (_CREATE_FILE_TODO,) + _DEFAULT_TODO_PLAN
+
+
+def _format_todos(todos: List[str], prefix: str, suffix: str = "") -> str:
+    """Render todos as comment lines for a generated file header"""
+    return "\n".join(f"{prefix}{todo}{suffix}" for todo in todos)
+
+
+# Language -> (templates by kind, todo comment prefix, todo comment suffix)
+_CODE_TEMPLATES = {
+    "python": ({
+        "class": PYTHON_CLASS_TEMPLATE,
+        "api": PYTHON_API_TEMPLATE,
+        "hello_world": PYTHON_HELLO_WORLD_TEMPLATE,
+        "function": PYTHON_FUNCTION_TEMPLATE,
+        "default": PYTHON_DEFAULT_TEMPLATE
+    }, "# - ", ""),
+    "javascript": ({
+        "class": JAVASCRIPT_CLASS_TEMPLATE,
+        "api": JAVASCRIPT_API_TEMPLATE,
+        "hello_world": JAVASCRIPT_HELLO_WORLD_TEMPLATE,
+        "function": JAVASCRIPT_FUNCTION_TEMPLATE,
+        "default": JAVASCRIPT_DEFAULT_TEMPLATE
+    }, "// - ", ""),
+    "java": ({
+        "hello_world": JAVA_HELLO_WORLD_TEMPLATE,
+        "function": JAVA_FUNCTION_TEMPLATE,
+        "default": JAVA_DEFAULT_TEMPLATE
+    }, "    // - ", ""),
+    "cpp": ({
+        "hello_world": CPP_HELLO_WORLD_TEMPLATE,
+        "function": CPP_FUNCTION_TEMPLATE,
+        "default": CPP_DEFAULT_TEMPLATE
+    }, "    // - ", ""),
+    "html": ({"default": HTML_TEMPLATE}, "    <!-- - ", " -->"),
+    "sql": ({"default": SQL_TEMPLATE}, "-- - ", ""),
+    "bash": ({"default": BASH_TEMPLATE}, "# - ", "")
+}
+_CODE_TEMPLATES["c++"] = _CODE_TEMPLATES["cpp"]
+
+
+def _request_kind(request_lower: str) -> str:
+    """Pick the template kind a request asks for when its task type has no scaffold"""
+    if "hello world" in request_lower or "print hello" in request_lower:
+        return "hello_world"
+    elif "function" in request_lower:
+        return "function"
+    return "default"
+
+
+def _write_code_file(path: str, code: str) -> bool:
+    """Write generated code as UTF-8, skipping the write if the file already holds it"""
+    data = code.encode("utf-8")
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass  # Missing or unreadable: just write it
+
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
 
 
 class VoiceCodingState(TypedDict):
@@ -76,6 +650,10 @@ class VoiceCodingState(TypedDict):
     iteration_count: int  # Number of iterations
     max_iterations: int  # Maximum allowed iterations
     
+    # Direct task results (file operations, explanations), read back by response generation
+    task_result: str
+    task_completed: bool
+    
     # Response generation
     final_response: str  # Final response to user
     
@@ -86,24 +664,127 @@ class VoiceCodingState(TypedDict):
     current_todo_index: int  # Track which todo we're currently working on
 
 
+@dataclass(frozen=True)
+class ScriptedEvent:
+    """One step of a scripted session (see LangGraphVoicePipeline.run_scripted)"""
+    kind: str  # "wake", "utterance" or "silence"
+    payload: Union[str, float] = ""  # The words for an utterance, seconds for a silence
+
+
+class _ScriptEnded(BaseException):
+    """The script ran out of events or time. A BaseException, like KeyboardInterrupt, so the
+    nodes' own error handling can't swallow it and keep the graph going."""
+
+
+class _ScriptedSpeech:
+    """Stands in for the STT agent and answers the pipeline's listens from scripted events.
+
+    Nothing waits on the clock: a silence is just a listen that hears nothing.
+    """
+
+    def __init__(self, events: List[ScriptedEvent], max_duration: float):
+        self._events = collections.deque(events)
+        self._deadline = time.monotonic() + max_duration
+
+    def _next_event(self) -> ScriptedEvent:
+        if not self._events or time.monotonic() > self._deadline:
+            raise _ScriptEnded
+        return self._events.popleft()
+
+    def listen_for_wake_word(self, timeout: Optional[float] = None) -> bool:
+        # Like the real detector, anything before the wake word goes unheard
+        while self._next_event().kind != "wake":
+            pass
+        return True
+
+    def auto_record_speech(self, max_duration: int = 30) -> str:
+        event = self._next_event()
+        return event.payload if event.kind == "utterance" else ""
+
+    def run(self, input_data: str) -> str:
+        return input_data  # Scripted replies are already text
+
+
 class LangGraphVoicePipeline:
     """LangGraph-based voice coding pipeline with wake-up word detection - Confirmation Flow Only"""
     
-    def __init__(self):
-        """Initialize the pipeline with all agents"""
+    def __init__(self, stt_agent=None, tts_agent=None, env: Optional[Env] = None):
+        """Initialize the pipeline with all agents. stt_agent and tts_agent, when given, stand in
+        for the microphone and speaker agents (the tests pass mocks); env replaces the settings
+        from bootstrap(), so tests can run without real API keys."""
+        self.env = env if env is not None else bootstrap()
+        configure_logging(self.env.log_level)
+
         # Initialize all agents
-        self.stt_agent = STTAgent()
-        self.tts_agent = TTSPromptAgent()
-        self.python_agent = PythonAgent()
-        self.discussion_agent = DiscussionAgent()
-        self.code_analysis_agent = CodeAnalysisAgent()
-        self.coderabbit_agent = CodeRabbitAgent()
+        agent_config = self.env.agent_config()
+        # STT (Porcupine model load) and CodeRabbit (CLI lookup) are the slow constructors, so they
+        # start in the background while the rest, including pygame's mixer, start on this thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="agent-init") as pool:
+            stt_future = pool.submit(STTAgent, agent_config) if stt_agent is None else None
+            coderabbit_future = pool.submit(CodeRabbitAgent, agent_config)
+            self.tts_agent = TTSPromptAgent(agent_config) if tts_agent is None else tts_agent
+            self.python_agent = PythonAgent(agent_config)
+            self.discussion_agent = DiscussionAgent(agent_config)
+            self.code_analysis_agent = CodeAnalysisAgent(agent_config)
+            self.file_agent = FileAgent(agent_config)
+            self.stt_agent = stt_future.result() if stt_future is not None else stt_agent
+            self.coderabbit_agent = coderabbit_future.result()
+
+        # Speech plays on one worker thread so prompts come out in order without overlapping,
+        # while the graph carries on with work that doesn't need the speaker or the mic.
+        # Synthesis runs on its own threads, so the next prompt is fetched while the current one plays.
+        self._speech_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+        self._synthesis_pool = concurrent.futures.ThreadPoolExecutor(max_workers=_TTS_CONCURRENCY, thread_name_prefix="tts-synth")
+        self._last_speech: Optional[concurrent.futures.Future] = None
+        self._language_llm = None  # Created on first language-detection call
+        # Explanation answer requested while the user is still confirming: (request, future)
+        self._speculation_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculative")
+        self._speculative_explanation: Optional[Tuple[str, concurrent.futures.Future]] = None
+        self._warmed = False
         
         # Create the workflow
         self.workflow = self._create_workflow()
         
-        print(" LangGraph Voice Pipeline initialized successfully!")
-        print(" Flow: Wake-up → Voice → Speech-to-Text → Confirmation → Intent Classification → Complete Multi-Agent Pipeline")
+        logger.info(" LangGraph Voice Pipeline initialized successfully!")
+        logger.info(" Flow: Wake-up → Voice → Speech-to-Text → Confirmation → Intent Classification → Complete Multi-Agent Pipeline")
+    
+    @classmethod
+    def instance(cls) -> "LangGraphVoicePipeline":
+        """The process-wide pipeline, built on first use; later callers reuse its agents and graph"""
+        global _shared_pipeline
+        if _shared_pipeline is None:
+            _shared_pipeline = cls()
+        return _shared_pipeline
+    
+    def reset_conversation_state(self) -> None:
+        """Forget the previous conversation before reusing the pipeline for a new one.
+
+        Dialogue state lives in the graph state passed to each run, so this only settles what the
+        instance carries between turns: queued speech and any speculative explanation.
+        """
+        self._wait_for_speech()
+        self._last_speech = None
+        self._discard_speculative_explanation()
+    
+    def close(self) -> None:
+        """Stop the speech, synthesis and speculation threads; prompts not yet started are dropped.
+
+        The pipeline can't speak afterwards, so instance() builds a new one if this was it.
+        Calling this again does nothing.
+        """
+        global _shared_pipeline
+        if _shared_pipeline is self:
+            _shared_pipeline = None
+        self._discard_speculative_explanation()
+        for pool in (self._speculation_pool, self._synthesis_pool, self._speech_pool):
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def _warmup(self) -> None:
+        """Run a silent clip through speech-to-text once, ahead of the first real request"""
+        if self._warmed:
+            return
+        self.stt_agent.warmup()
+        self._warmed = True
     
     def _create_workflow(self) -> StateGraph:
         """Create the confirmation flow workflow"""
@@ -161,6 +842,7 @@ class LangGraphVoicePipeline:
                 "todo_generation": "todo_generation",
                 "code_review": "code_review",
                 "code_explanation": "code_explanation",
+                "response_generation": "response_generation",
                 END: END
             }
         )
@@ -253,23 +935,24 @@ class LangGraphVoicePipeline:
     
     def _wake_word_detection_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 1: Detect wake-up word using STT Agent"""
-        print(" [Node 1] Listening for wake-up word...")
+        logger.info(" [Node 1] Listening for wake-up word...")
         
         try:
             # Use STT agent's wake-up word detection
+            self._wait_for_speech()
             wake_word_detected = self.stt_agent.listen_for_wake_word()
             
             state["wake_word_detected"] = wake_word_detected
             state["current_step"] = "wake_word_detection"
             
             if wake_word_detected:
-                print(" Wake-up word detected! Starting voice input...")
+                logger.info(" Wake-up word detected! Starting voice input...")
             else:
-                print("⏰ Wake-up word timeout. Ending session.")
+                logger.info("⏰ Wake-up word timeout. Ending session.")
                 state["pipeline_status"] = "completed"
                 
         except Exception as e:
-            print(f" Error in wake-up word detection: {e}")
+            logger.error(f" Error in wake-up word detection: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -277,25 +960,25 @@ class LangGraphVoicePipeline:
     
     def _voice_input_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 2: Capture voice input using STT Agent"""
-        print(" [Node 2] Capturing voice input...")
+        logger.info(" [Node 2] Capturing voice input...")
         
         try:
             # Reset confirmation spoken flag when starting new voice input
             state["confirmation_spoken"] = False
             
             # Capture voice input using STT agent (no prompt needed after wake-up word)
-            voice_input = self.stt_agent.auto_record_speech(max_duration=30)
+            voice_input = self._listen(max_duration=30)
             
             if voice_input:
                 state["voice_input"] = voice_input
                 state["current_step"] = "voice_input"
-                print(f" Voice input captured: '{voice_input}'")
+                logger.info(f" Voice input captured: '{voice_input}'")
             else:
                 state["error_message"] = "No voice input detected"
                 state["pipeline_status"] = "error"
                 
         except Exception as e:
-            print(f" Error in voice input: {e}")
+            logger.error(f" Error in voice input: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -303,7 +986,7 @@ class LangGraphVoicePipeline:
     
     def _speech_to_text_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 3: Convert speech to text using STT Agent"""
-        print(" [Node 3] Converting speech to text...")
+        logger.info(" [Node 3] Converting speech to text...")
         
         try:
             voice_input = state.get("voice_input", "")
@@ -315,13 +998,13 @@ class LangGraphVoicePipeline:
                 state["transcribed_text"] = transcribed_text
                 state["current_step"] = "speech_to_text"
                 
-                print(f" Transcribed: '{transcribed_text}'")
+                logger.info(f" Transcribed: '{transcribed_text}'")
             else:
                 state["error_message"] = "No voice input to transcribe"
                 state["pipeline_status"] = "error"
                 
         except Exception as e:
-            print(f" Error in speech-to-text: {e}")
+            logger.error(f" Error in speech-to-text: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -329,7 +1012,7 @@ class LangGraphVoicePipeline:
     
     def _confirmation_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 4: Confirm transcribed text with user - Summarized and human-like"""
-        print(" [Node 4] Confirming transcribed text...")
+        logger.info(" [Node 4] Confirming transcribed text...")
         
         try:
             transcribed_text = state.get("transcribed_text", "")
@@ -340,42 +1023,45 @@ class LangGraphVoicePipeline:
                     # Summarize the user's request with natural filler sounds
                     summary = self._summarize_user_request(transcribed_text)
                     confirmation_msg = f"Um, so you want me to {summary}, right?"
-                    print(f"🔊 Speaking: {confirmation_msg}")
-                    self.tts_agent.run(confirmation_msg)
+                    logger.info(f"🔊 Speaking: {confirmation_msg}")
+                    self._say_async(confirmation_msg)
+                    # Most requests are confirmed, so explanation answers start while we wait for the yes
+                    self._start_speculative_explanation(transcribed_text)
                     state["confirmation_spoken"] = True
                 
                 # Always process user response (even if confirmation was already spoken)
-                print(" Listening for your response...")
-                print(" Say 'yes' to continue or 'no' to re-record")
-                confirmation_response = self.stt_agent.auto_record_speech(max_duration=15)
+                logger.info(" Listening for your response...")
+                logger.info(" Say 'yes' to continue or 'no' to re-record")
+                confirmation_response = self._listen(max_duration=15)
                 
                 if confirmation_response:
-                    confirmation_lower = confirmation_response.lower().strip()
-                    print(f" You said: '{confirmation_response}'")
+                    confirmation_words = _tokenize(confirmation_response)
+                    logger.info(f" You said: '{confirmation_response}'")
                     
-                    if any(word in confirmation_lower for word in ["yes", "correct", "right", "yeah", "yep", "ok", "okay"]):
+                    if _is_affirmative(confirmation_words, _REQUEST_CONFIRM_WORDS):
                         state["user_confirmed"] = True
                         state["confirmation_status"] = "confirmed"
-                        print(" User confirmed! Ready for intent classification.")
+                        logger.info(" User confirmed! Ready for intent classification.")
                         # Add human-like response with filler sounds
-                        print("🔊 Speaking: Great! Um, let me get started on that for you.")
-                        self.tts_agent.run("Great! Um, let me get started on that for you.")
+                        logger.info("🔊 Speaking: Great! Um, let me get started on that for you.")
+                        self._say_async("Great! Um, let me get started on that for you.")
                     else:
                         state["user_confirmed"] = False
                         state["confirmation_status"] = "re_record"
-                        print("🔄 User wants to re-record. Going back to voice input.")
+                        logger.info("🔄 User wants to re-record. Going back to voice input.")
                         # Say sorry and ask to try again with human-like filler
+                        self._discard_speculative_explanation()
                         sorry_msg = "Oh, um, I'm sorry about that. Could you please say it again?"
-                        print(f"🔊 Speaking: {sorry_msg}")
-                        self.tts_agent.run(sorry_msg)
+                        logger.info(f"🔊 Speaking: {sorry_msg}")
+                        self._say(sorry_msg)
                 else:
                     # No response detected - assume yes and continue (no duplicate TTS)
-                    print("⏰ No response detected. Assuming 'yes' and continuing...")
+                    logger.info("⏰ No response detected. Assuming 'yes' and continuing...")
                     state["user_confirmed"] = True
                     state["confirmation_status"] = "confirmed"
-                    print(" Assuming confirmation. Ready for intent classification.")
+                    logger.info(" Assuming confirmation. Ready for intent classification.")
                     # Only speak once with filler sounds
-                    self.tts_agent.run("Um, I'll assume that's correct and continue.")
+                    self._say("Um, I'll assume that's correct and continue.")
                 
                 state["current_step"] = "confirmation"
             else:
@@ -383,7 +1069,7 @@ class LangGraphVoicePipeline:
                 state["pipeline_status"] = "error"
                 
         except Exception as e:
-            print(f" Error in confirmation: {e}")
+            logger.error(f" Error in confirmation: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -391,62 +1077,51 @@ class LangGraphVoicePipeline:
     
     def _intent_classification_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 5: Classify user intent - Handle both initial and continuous help"""
-        print("🧠 [Node 5] Classifying user intent...")
+        logger.info("🧠 [Node 5] Classifying user intent...")
         
         try:
             transcribed_text = state.get("transcribed_text", "")
             # Check if this is a new task from continuous help
             if not transcribed_text:
-                print("🔄 New task from continuous help. Getting user input...")
-                self.tts_agent.run("What would you like me to help you with?")
+                # The "what next?" prompt was already spoken by response generation
+                logger.info("🔄 New task from continuous help. Getting user input...")
                 
                 # Get new user input
-                print(" Listening for your new request...")
-                new_request = self.stt_agent.auto_record_speech(max_duration=30)
+                logger.info(" Listening for your new request...")
+                new_request = self._listen(max_duration=30)
                 
                 if new_request:
-                    print(f" New request: '{new_request}'")
+                    logger.info(f" New request: '{new_request}'")
                     
                     # Check if this is a file operation request
-                    if any(word in new_request.lower() for word in ["rename", "rename file", "change file", "move file", "copy file"]):
-                        print("📁 File operation detected. Handling file request...")
+                    if _FILE_OPERATION_PATTERN.search(new_request.lower()):
+                        logger.info("📁 File operation detected. Handling file request...")
                         self._handle_file_operation(new_request, state)
                         return state
                     else:
                         state["transcribed_text"] = new_request
                         transcribed_text = new_request
                 else:
-                    print("⏰ No new request. Ending session.")
-                    self.tts_agent.run("I didn't catch that. Just say 'Blueberry' whenever you need help. Goodbye!")
+                    logger.info("⏰ No new request. Ending session.")
+                    self._say("I didn't catch that. Just say 'Blueberry' whenever you need help. Goodbye!")
                     state["pipeline_status"] = "completed"
                     return state
             
             if transcribed_text:
-                # Simple intent classification (placeholder)
-                # In a real implementation, you'd use an LLM or ML model here
-                transcribed_lower = transcribed_text.lower()
-                # Check for review intent first (most specific)
-                if any(word in transcribed_lower for word in ["review", "check", "analyze", "examine", "look at"]):
-                    intent = "review"
-                elif any(word in transcribed_lower for word in ["explain", "what", "how", "why", "tell me", "describe"]):
-                    intent = "explanation"
-                elif any(word in transcribed_lower for word in ["code", "program", "function", "class", "write", "create", "build", "make", "generate"]):
-                    intent = "coding"
-                else:
-                    # Default to coding for most requests
-                    intent = "coding"
+                # Simple keyword intent classification
+                intent = _classify_intent(transcribed_text.lower())
                 
                 state["user_intent"] = intent
                 state["current_step"] = "intent_classification"
                 
-                print(f" Classified intent: {intent}")
-                print(" Intent classification completed. Routing to appropriate task...")
+                logger.info(f" Classified intent: {intent}")
+                logger.info(" Intent classification completed. Routing to appropriate task...")
             else:
                 state["error_message"] = "No transcribed text for intent classification"
                 state["pipeline_status"] = "error"
                 
         except Exception as e:
-            print(f" Error in intent classification: {e}")
+            logger.error(f" Error in intent classification: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -454,7 +1129,7 @@ class LangGraphVoicePipeline:
     
     def _code_generation_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 6: Discussion-Friendly Interactive Code Generation - Real-time Conversation"""
-        print(" [Node 6] Discussion-Friendly Interactive Code Generation")
+        logger.info(" [Node 6] Discussion-Friendly Interactive Code Generation")
         
         try:
             transcribed_text = state.get("transcribed_text", "")
@@ -466,8 +1141,8 @@ class LangGraphVoicePipeline:
                 # Get current todo
                 current_todo = todos[current_todo_index] if current_todo_index < len(todos) else todos[-1]
                 
-                print(f" Working on todo {current_todo_index + 1}/{len(todos)}: '{current_todo}'")
-                print(f" User Request: '{transcribed_text}'")
+                logger.info(f" Working on todo {current_todo_index + 1}/{len(todos)}: '{current_todo}'")
+                logger.info(f" User Request: '{transcribed_text}'")
                 
                 # Start interactive discussion
                 self._start_interactive_discussion(state, current_todo, transcribed_text, todos, current_todo_index)
@@ -477,7 +1152,7 @@ class LangGraphVoicePipeline:
                 state["pipeline_status"] = "error"
                 
         except Exception as e:
-            print(f" Error in code generation: {e}")
+            logger.error(f" Error in code generation: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -485,21 +1160,21 @@ class LangGraphVoicePipeline:
     
     def _start_interactive_discussion(self, state: VoiceCodingState, current_todo: str, transcribed_text: str, todos: List[str], current_todo_index: int):
         """Start interactive discussion with user - Real-time conversation"""
-        print(f"\n🤝 Starting interactive discussion for: '{current_todo}'")
+        logger.info(f"\n🤝 Starting interactive discussion for: '{current_todo}'")
         
         # Determine programming language and task type
-        language, task_type = self._analyze_code_request(transcribed_text)
+        language, task_type, language_specified = self._analyze_code_request(transcribed_text)
         
         # Check if language was specified, if not ask the user
-        if language == "python" and not self._is_language_specified(transcribed_text):
-            print(" No programming language specified. Asking user to choose...")
-            self.tts_agent.run("Um, I need to know which programming language you'd like me to use. I support Python, JavaScript, Java, C++, C#, Go, Rust, PHP, Ruby, Swift, Kotlin, TypeScript, HTML, CSS, SQL, Bash, PowerShell, YAML, JSON, and XML. Which one would you prefer?")
+        if not language_specified and language == "python":
+            logger.info(" No programming language specified. Asking user to choose...")
+            self._say("Um, I need to know which programming language you'd like me to use. I support Python, JavaScript, Java, C++, C#, Go, Rust, PHP, Ruby, Swift, Kotlin, TypeScript, HTML, CSS, SQL, Bash, PowerShell, YAML, JSON, and XML. Which one would you prefer?")
             
             # Get user's language choice with interactive discussion
             language = self._get_language_with_discussion()
         
-        print(f" Final Language: {language}")
-        print(f" Task Type: {task_type}")
+        logger.info(f" Final Language: {language}")
+        logger.info(f" Task Type: {task_type}")
         
         # Start the interactive discussion loop
         self._interactive_discussion_loop(state, current_todo, transcribed_text, todos, current_todo_index, language, task_type)
@@ -507,213 +1182,187 @@ class LangGraphVoicePipeline:
     def _get_language_with_discussion(self) -> str:
         """Get language choice through interactive discussion"""
         while True:
-            print(" Listening for your language choice...")
-            language_response = self.stt_agent.auto_record_speech(max_duration=15)
+            logger.info(" Listening for your language choice...")
+            language_response = self._listen(max_duration=15)
             
             if language_response:
                 language = self._extract_language_from_response(language_response)
-                print(f" User specified language: {language}")
+                logger.info(f" User specified language: {language}")
                 
                 # Confirm the choice
-                self.tts_agent.run(f"Um, great! I'll use {language} for this task. Is that correct?")
+                self._say(f"Um, great! I'll use {language} for this task. Is that correct?")
                 
                 # Get confirmation
-                print(" Listening for confirmation...")
-                confirm_response = self.stt_agent.auto_record_speech(max_duration=10)
+                logger.info(" Listening for confirmation...")
+                confirm_response = self._listen(max_duration=10)
                 
                 if confirm_response:
-                    confirm_lower = confirm_response.lower().strip()
-                    if any(word in confirm_lower for word in ["yes", "correct", "right", "good", "ok", "okay"]):
+                    confirm_words = _tokenize(confirm_response)
+                    if _is_affirmative(confirm_words, _CONFIRM_WORDS):
                         return language
-                    elif any(word in confirm_lower for word in ["no", "wrong", "change", "different"]):
-                        self.tts_agent.run("Um, no problem! What language would you prefer instead?")
+                    elif not _REJECT_WORDS.isdisjoint(confirm_words):
+                        self._say("Um, no problem! What language would you prefer instead?")
                         continue
                     else:
                         # Ambiguous response, ask for clarification
-                        self.tts_agent.run("Um, I'm not sure if that's correct. Could you please say 'yes' or 'no'?")
+                        self._say("Um, I'm not sure if that's correct. Could you please say 'yes' or 'no'?")
                         continue
                 else:
                     # No response, assume yes
                     return language
             else:
-                print("⏰ No language specified. Using Python as default.")
-                self.tts_agent.run("Um, I'll use Python as the default language.")
+                logger.info("⏰ No language specified. Using Python as default.")
+                self._say("Um, I'll use Python as the default language.")
                 return "python"
     
     def _interactive_discussion_loop(self, state: VoiceCodingState, current_todo: str, transcribed_text: str, todos: List[str], current_todo_index: int, language: str, task_type: str):
         """Interactive discussion loop - Real-time conversation with user"""
-        print(f"\n💬 Starting interactive discussion loop for: '{current_todo}'")
+        logger.info(f"\n💬 Starting interactive discussion loop for: '{current_todo}'")
         
         # Check if we've already asked about this todo
         todo_key = f"todo_asked_{current_todo_index}"
         if state.get(todo_key, False):
-            print(f"⏭️ Already asked about todo {current_todo_index + 1}. Skipping duplicate question.")
+            logger.info(f"⏭️ Already asked about todo {current_todo_index + 1}. Skipping duplicate question.")
             return
         
         # Mark this todo as asked
         state[todo_key] = True
+        introduced = False  # The full introduction is only repeated when the todo itself changes
         
         while True:
-            # Ask user about the current todo (speak only, no duplicate print)
-            # Removed duplicate print - TTS already says this
-            
-            # Speak to user like a colleague with natural filler sounds
-            self.tts_agent.run(f"Um, hey! I'm working on {current_todo}. I'll create a {language} {task_type} for you. What do you think?")
+            # Speak to user like a colleague with natural filler sounds; after a detour (help,
+            # pause, an unclear answer) a short question picks the discussion back up
+            if introduced:
+                self._say(f"Um, okay! So, should I go ahead with the {language} {task_type}?")
+            else:
+                self._say(f"Um, hey! I'm working on {current_todo}. I'll create a {language} {task_type} for you. What do you think?")
+                introduced = True
             
             # Get user response with longer timeout for discussion
-            print(" Listening for your response...")
-            user_response = self.stt_agent.auto_record_speech(max_duration=20)
+            logger.info(" Listening for your response...")
+            user_response = self._listen(max_duration=20)
             
             if user_response:
-                response_lower = user_response.lower().strip()
-                print(f" You said: '{user_response}'")
+                response_words = _tokenize(user_response)
+                logger.info(f" You said: '{user_response}'")
                 
                 # Handle different types of responses
-                if any(word in response_lower for word in ["yes", "good", "sounds good", "proceed", "go ahead", "ok", "okay", "perfect", "great"]):
-                    print(" User confirmed! Proceeding with code generation...")
+                if _is_affirmative(response_words, _PROCEED_WORDS):
+                    logger.info(" User confirmed! Proceeding with code generation...")
                     self._generate_and_save_code(state, current_todo, transcribed_text, todos, current_todo_index, language, task_type)
                     break
                     
-                elif any(word in response_lower for word in ["no", "wrong", "change", "different", "something else", "i want something else"]):
-                    print("🔄 User wants changes. Let's discuss what you'd like instead.")
+                elif not _REJECT_WORDS.isdisjoint(response_words):
+                    logger.info("🔄 User wants changes. Let's discuss what you'd like instead.")
                     
                     # Check if user is asking about language options
-                    if any(word in response_lower for word in ["languages", "support", "options", "what languages", "which languages", "other languages"]):
-                        print("📋 User asking about language options during discussion.")
-                        self.tts_agent.run("Um, I support many programming languages! I can work with Python, JavaScript, Java, C++, C#, Go, Rust, PHP, Ruby, Swift, Kotlin, TypeScript, HTML, CSS, SQL, Bash, PowerShell, YAML, JSON, and XML. Which one would you like to use instead?")
+                    if not _LANGUAGE_QUERY_WORDS.isdisjoint(response_words):
+                        logger.info("📋 User asking about language options during discussion.")
+                        self._say("Um, I support many programming languages! I can work with Python, JavaScript, Java, C++, C#, Go, Rust, PHP, Ruby, Swift, Kotlin, TypeScript, HTML, CSS, SQL, Bash, PowerShell, YAML, JSON, and XML. Which one would you like to use instead?")
                     else:
-                        self.tts_agent.run("Oh, um, no problem! What would you like me to change or do differently?")
+                        self._say("Oh, um, no problem! What would you like me to change or do differently?")
                     
                     # Get user's specific requirements
-                    print(" Listening for your specific requirements...")
-                    new_requirements = self.stt_agent.auto_record_speech(max_duration=30)
+                    logger.info(" Listening for your specific requirements...")
+                    new_requirements = self._listen(max_duration=30)
                     
                     if new_requirements:
-                        print(f" New requirements: '{new_requirements}'")
+                        logger.info(f" New requirements: '{new_requirements}'")
                         # Update the current todo based on new requirements
                         current_todo = self._update_todo_based_on_feedback(current_todo, new_requirements)
-                        print(f"🔄 Updated todo: '{current_todo}'")
+                        logger.info(f"🔄 Updated todo: '{current_todo}'")
                         
                         # Re-analyze language from the new requirements
-                        new_language, new_task_type = self._analyze_code_request(new_requirements)
-                        print(f" New language detected: {new_language}")
-                        print(f" New task type: {new_task_type}")
+                        new_language, new_task_type, _ = self._analyze_code_request(new_requirements)
+                        logger.info(f" New language detected: {new_language}")
+                        logger.info(f" New task type: {new_task_type}")
                         
                         # Update the language and task type
                         language = new_language
                         task_type = new_task_type
                         
-                        self.tts_agent.run(f"Um, got it! I'll work on {current_todo} using {language}. Let's continue.")
+                        self._say(f"Um, got it! I'll work on {current_todo} using {language}. Let's continue.")
+                        introduced = False
                         continue
                     else:
-                        print("⏰ No specific requirements. Let's try again.")
-                        self.tts_agent.run("Um, hmm, I didn't catch that. Could you please tell me what you'd like me to change?")
+                        logger.info("⏰ No specific requirements. Let's try again.")
+                        self._say("Um, hmm, I didn't catch that. Could you please tell me what you'd like me to change?")
                         continue
                         
-                elif any(word in response_lower for word in ["wait", "stop", "pause", "hold on"]):
-                    print("⏸️ User wants to pause. Waiting for further instructions.")
-                    self.tts_agent.run("Um, sure! I'll wait. What would you like me to do?")
+                elif not _PAUSE_WORDS.isdisjoint(response_words):
+                    logger.info("⏸️ User wants to pause. Waiting for further instructions.")
+                    self._say("Um, sure! I'll wait. What would you like me to do?")
                     continue
                     
-                elif any(word in response_lower for word in ["help", "what", "how", "explain", "support", "languages", "options"]):
-                    print("❓ User needs help. Providing assistance.")
+                elif not _HELP_WORDS.isdisjoint(response_words):
+                    logger.info("❓ User needs help. Providing assistance.")
                     
                     # Check if user is asking about supported languages
-                    if any(word in response_lower for word in ["languages", "support", "options", "what languages", "which languages"]):
-                        print("📋 User asking about supported languages. Providing language list.")
-                        self.tts_agent.run("Um, I support many programming languages! I can work with Python, JavaScript, Java, C++, C#, Go, Rust, PHP, Ruby, Swift, Kotlin, TypeScript, HTML, CSS, SQL, Bash, PowerShell, YAML, JSON, and XML. Which one would you like to use?")
+                    if not _LANGUAGE_QUERY_WORDS.isdisjoint(response_words):
+                        logger.info("📋 User asking about supported languages. Providing language list.")
+                        self._say("Um, I support many programming languages! I can work with Python, JavaScript, Java, C++, C#, Go, Rust, PHP, Ruby, Swift, Kotlin, TypeScript, HTML, CSS, SQL, Bash, PowerShell, YAML, JSON, and XML. Which one would you like to use?")
                     else:
-                        self.tts_agent.run(f"Um, I'm here to help! I'm working on {current_todo} using {language}. What would you like me to explain or help you with?")
+                        self._say(f"Um, I'm here to help! I'm working on {current_todo} using {language}. What would you like me to explain or help you with?")
                     
                     # Get user's help response
-                    print(" Listening for your help response...")
-                    help_response = self.stt_agent.auto_record_speech(max_duration=20)
+                    logger.info(" Listening for your help response...")
+                    help_response = self._listen(max_duration=20)
                     if help_response:
-                        print(f" Help response: '{help_response}'")
+                        logger.info(f" Help response: '{help_response}'")
                         # Process help response and continue
                         continue
                     else:
-                        print("⏰ No help response. Continuing with task.")
+                        logger.info("⏰ No help response. Continuing with task.")
                         continue
                     
                 else:
                     # Ambiguous response, ask for clarification
-                    print("❓ Ambiguous response. Asking for clarification.")
-                    self.tts_agent.run("Um, hmm, I'm not sure what you mean. Could you please say 'yes' to continue, 'no' to change something, or 'help' if you need assistance?")
+                    logger.info("❓ Ambiguous response. Asking for clarification.")
+                    self._say("Um, hmm, I'm not sure what you mean. Could you please say 'yes' to continue, 'no' to change something, or 'help' if you need assistance?")
                     continue
                     
             else:
-                print("⏰ No response. Asking if user is still there.")
-                self.tts_agent.run("Um, are you still there? Should I continue with the current task?")
+                logger.info("⏰ No response. Asking if user is still there.")
+                self._say("Um, are you still there? Should I continue with the current task?")
                 
                 # Get a quick response
-                quick_response = self.stt_agent.auto_record_speech(max_duration=5)
+                quick_response = self._listen(max_duration=5)
                 if quick_response:
-                    response_lower = quick_response.lower().strip()
-                    if any(word in response_lower for word in ["yes", "continue", "go ahead"]):
-                        print(" User confirmed. Proceeding with code generation...")
+                    response_words = _tokenize(quick_response)
+                    if _is_affirmative(response_words, _CONTINUE_WORDS):
+                        logger.info(" User confirmed. Proceeding with code generation...")
                         self._generate_and_save_code(state, current_todo, transcribed_text, todos, current_todo_index, language, task_type)
                         break
                     else:
-                        print("🔄 User wants to discuss further.")
+                        logger.info("🔄 User wants to discuss further.")
                         continue
                 else:
-                    print("⏰ No response. Proceeding with code generation...")
+                    logger.info("⏰ No response. Proceeding with code generation...")
                     self._generate_and_save_code(state, current_todo, transcribed_text, todos, current_todo_index, language, task_type)
                     break
     
     def _update_todo_based_on_feedback(self, current_todo: str, feedback: str) -> str:
         """Update todo based on user feedback with language detection"""
-        # Extract language from feedback
+        # Extract language from feedback in a single scan
         feedback_lower = feedback.lower()
-        
-        # Check for language keywords in feedback
-        if "java" in feedback_lower:
-            return f"Create a Java function: {feedback}"
-        elif "javascript" in feedback_lower or "js" in feedback_lower:
-            return f"Create a JavaScript function: {feedback}"
-        elif "python" in feedback_lower:
-            return f"Create a Python function: {feedback}"
-        elif "c++" in feedback_lower or "cpp" in feedback_lower:
-            return f"Create a C++ function: {feedback}"
-        elif "go" in feedback_lower:
-            return f"Create a Go function: {feedback}"
-        elif "rust" in feedback_lower:
-            return f"Create a Rust function: {feedback}"
-        elif "php" in feedback_lower:
-            return f"Create a PHP function: {feedback}"
-        elif "ruby" in feedback_lower:
-            return f"Create a Ruby function: {feedback}"
-        elif "swift" in feedback_lower:
-            return f"Create a Swift function: {feedback}"
-        elif "kotlin" in feedback_lower:
-            return f"Create a Kotlin function: {feedback}"
-        elif "typescript" in feedback_lower or "ts" in feedback_lower:
-            return f"Create a TypeScript function: {feedback}"
-        elif "html" in feedback_lower:
-            return f"Create an HTML page: {feedback}"
-        elif "css" in feedback_lower:
-            return f"Create CSS styles: {feedback}"
-        elif "sql" in feedback_lower:
-            return f"Create SQL queries: {feedback}"
-        elif "bash" in feedback_lower or "shell" in feedback_lower:
-            return f"Create a Bash script: {feedback}"
-        elif "powershell" in feedback_lower:
-            return f"Create a PowerShell script: {feedback}"
+        match = _FEEDBACK_LANGUAGE_PATTERN.search(feedback_lower)
+        if match:
+            language = _LANGUAGE_ALIASES.get(match.group(1), match.group(1))
+            return _LANGUAGE_INFO[language][1].format(feedback)
+        
+        # Default update
+        if "different" in feedback_lower or "something else" in feedback_lower:
+            return f"Modified task based on your feedback: {feedback}"
+        elif "change" in feedback_lower:
+            return f"Updated task: {feedback}"
         else:
-            # Default update
-            if "different" in feedback_lower or "something else" in feedback_lower:
-                return f"Modified task based on your feedback: {feedback}"
-            elif "change" in feedback_lower:
-                return f"Updated task: {feedback}"
-            else:
-                return f"Revised task: {feedback}"
+            return f"Revised task: {feedback}"
     
     def _generate_and_save_code(self, state: VoiceCodingState, current_todo: str, transcribed_text: str, todos: List[str], current_todo_index: int, language: str, task_type: str):
         """Generate and save code with user confirmation"""
-        print("🔨 Generating code...")
-        print(f" Using language: {language}")
-        print(f" Task type: {task_type}")
+        logger.info("🔨 Generating code...")
+        logger.info(f" Using language: {language}")
+        logger.info(f" Task type: {task_type}")
         
         # Generate code using appropriate approach
         generated_code = self._generate_universal_code(transcribed_text, todos, language, task_type)
@@ -722,8 +1371,7 @@ class LangGraphVoicePipeline:
         file_extension = self._get_file_extension(language)
         smart_filename = self._generate_smart_filename(transcribed_text, language)
         code_file_path = f"{smart_filename}.{file_extension}"
-        with open(code_file_path, 'w') as f:
-            f.write(generated_code)
+        _write_code_file(code_file_path, generated_code)
         
         state["generated_code"] = generated_code
         state["code_file_path"] = code_file_path
@@ -731,59 +1379,63 @@ class LangGraphVoicePipeline:
         state["current_step"] = "code_generation"
         state["current_todo_index"] = current_todo_index + 1  # Move to next todo
         
-        print(f" Code generated and saved to: {code_file_path}")
-        print(f" Code preview:\n{generated_code[:200]}...")
+        logger.info(f" Code generated and saved to: {code_file_path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(" Code preview:\n%s...", generated_code[:200])
         
         # Speak the result like a colleague
-        self.tts_agent.run(f"Um, perfect! I've created the {language} code for {current_todo}. It's saved as {code_file_path}. Ready for the next task?")
+        self._say(f"Um, perfect! I've created the {language} code for {current_todo}. It's saved as {code_file_path}. Ready for the next task?")
         
         # Ask if user wants to continue or make changes
-        print(" Listening for your next instruction...")
-        next_instruction = self.stt_agent.auto_record_speech(max_duration=15)
+        logger.info(" Listening for your next instruction...")
+        next_instruction = self._listen(max_duration=15)
         
         if next_instruction:
-            instruction_lower = next_instruction.lower().strip()
-            if any(word in instruction_lower for word in ["yes", "continue", "next", "go ahead"]):
-                print(" User wants to continue. Moving to next task.")
-            elif any(word in instruction_lower for word in ["no", "change", "modify", "different"]):
-                print("🔄 User wants to make changes. Starting discussion loop again.")
+            instruction_words = _tokenize(next_instruction)
+            if _is_affirmative(instruction_words, _CONTINUE_WORDS):
+                logger.info(" User wants to continue. Moving to next task.")
+            elif not _REJECT_WORDS.isdisjoint(instruction_words):
+                logger.info("🔄 User wants to make changes. Starting discussion loop again.")
                 self._interactive_discussion_loop(state, current_todo, transcribed_text, todos, current_todo_index, language, task_type)
             else:
-                print(" Continuing with next task.")
+                logger.info(" Continuing with next task.")
         else:
-            print(" Continuing with next task.")
+            logger.info(" Continuing with next task.")
     
     
     def _code_explanation_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 8: Code Explanation/Debug Task"""
-        print(" [Node 8] Executing code explanation/debug task...")
+        logger.info(" [Node 8] Executing code explanation/debug task...")
         
         try:
             transcribed_text = state.get("transcribed_text", "")
             
             if transcribed_text:
-                print(" Explaining/debugging code based on your request...")
+                logger.info(" Explaining/debugging code based on your request...")
                 
-                # Use Discussion agent for code explanation
-                result = self.discussion_agent.run(transcribed_text)
+                # Use Discussion agent for code explanation, picking up the answer started during confirmation
+                result = self._take_speculative_explanation(transcribed_text)
+                if result is None:
+                    result = self.discussion_agent.run(transcribed_text)
                 
+                state["code_explanation"] = result  # Read back by response generation
                 state["task_result"] = result
                 state["task_completed"] = True
                 state["current_step"] = "code_explanation"
                 state["pipeline_status"] = "completed"
                 
-                print(" Code explanation completed!")
-                print(f" Explanation:\n{result}")
+                logger.info(" Code explanation completed!")
+                logger.info(f" Explanation:\n{result}")
                 
-                # Speak the result
-                self.tts_agent.run("Code explanation completed. Here's what I found.")
+                # Speak the result; response generation queues the explanation right behind it
+                self._say_async("Code explanation completed. Here's what I found.")
                 
             else:
                 state["error_message"] = "No transcribed text for code explanation"
                 state["pipeline_status"] = "error"
                 
         except Exception as e:
-            print(f" Error in code explanation: {e}")
+            logger.error(f" Error in code explanation: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -791,15 +1443,15 @@ class LangGraphVoicePipeline:
     
     def _todo_generation_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 6: Generate todos/tasks based on user request - Interactive and Collaborative"""
-        print(" [Node 6] Todo Generation - Interactive Mode")
+        logger.info(" [Node 6] Todo Generation - Interactive Mode")
         
         try:
             transcribed_text = state.get("transcribed_text", "")
             user_intent = state.get("user_intent", "")
             
-            print(f" Intent: {user_intent}")
-            print(f" User Request: '{transcribed_text}'")
-            print("📋 Generating tasks based on user request...")
+            logger.info(f" Intent: {user_intent}")
+            logger.info(f" User Request: '{transcribed_text}'")
+            logger.info("📋 Generating tasks based on user request...")
             
             # Generate todos based on the request
             todos = self._generate_todos_from_request(transcribed_text)
@@ -809,21 +1461,21 @@ class LangGraphVoicePipeline:
             state["current_step"] = "todo_generation"
             state["current_todo_index"] = 0  # Track which todo we're working on
             
-            print(f" Generated {len(todos)} tasks:")
+            logger.info(f" Generated {len(todos)} tasks:")
             for i, todo in enumerate(todos, 1):
-                print(f"   {i}. {todo}")
+                logger.info(f"   {i}. {todo}")
             
             # Start interactive todo process
             if todos:
                 first_todo = todos[0]
-                print(f"\n🤝 Let's start with the first task: '{first_todo}'")
-                print("💬 I'll work on this step by step with you, like a colleague!")
+                logger.info(f"\n🤝 Let's start with the first task: '{first_todo}'")
+                logger.info("💬 I'll work on this step by step with you, like a colleague!")
                 
                 # Speak the first todo to the user
-                self.tts_agent.run(f"Great! I've created a plan with {len(todos)} tasks. Let's start with the first one: {first_todo}. Should I proceed with this?")
+                self._say(f"Great! I've created a plan with {len(todos)} tasks. Let's start with the first one: {first_todo}. Should I proceed with this?")
             
         except Exception as e:
-            print(f" Error in todo generation: {e}")
+            logger.error(f" Error in todo generation: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -832,12 +1484,12 @@ class LangGraphVoicePipeline:
     
     def _code_review_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 7: Code Review Task using CodeRabbit"""
-        print(" [Node 7] Code Review Task using CodeRabbit")
-        print(" Intent: review")
+        logger.info(" [Node 7] Code Review Task using CodeRabbit")
+        logger.info(" Intent: review")
         
         try:
-            print(" Running CodeRabbit review on current directory...")
-            self.tts_agent.run(CODERABBIT_START_MESSAGE)
+            logger.info(" Running CodeRabbit review on current directory...")
+            self._say_async(CODERABBIT_START_MESSAGE)
             
             # Use CodeRabbit agent to review current directory
             review_result = self.coderabbit_agent.review_current_directory()
@@ -848,67 +1500,55 @@ class LangGraphVoicePipeline:
                 state["current_step"] = "code_review"
                 state["pipeline_status"] = "completed"
                 
-                print(" CodeRabbit review completed!")
-                print(f" Review summary: {review_result['summary']}")
+                logger.info(" CodeRabbit review completed!")
+                logger.info(f" Review summary: {review_result['summary']}")
                 
                 # Speak the GPT-4 summarized review with filler sounds
-                self.tts_agent.run(review_result["summary"])
+                self._say_in_chunks(review_result["summary"])
                 
             else:
-                print(f" CodeRabbit review failed: {review_result['summary']}")
-                self.tts_agent.run("Rate limit exceeded error")
+                logger.info(f" CodeRabbit review failed: {review_result['summary']}")
+                self._say("Rate limit exceeded error")
                 state["current_step"] = "code_review"
                 state["pipeline_status"] = "error"
                 
         except Exception as e:
-            print(f" Error in code review: {str(e)}")
-            self.tts_agent.run("Rate limit exceeded error")
+            logger.error(f" Error in code review: {str(e)}")
+            self._say("Rate limit exceeded error")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
         return state
     
-    def _code_explanation_node(self, state: VoiceCodingState) -> VoiceCodingState:
-        """Node 8: Code Explanation/Debug Task - Empty Function"""
-        print(" [Node 8] Code Explanation Task")
-        print(" Intent: explanation")
-        print(" User Request: Code explanation requested")
-        print(" Redirected to code explanation based on intent classification")
-        
-        state["current_step"] = "code_explanation"
-        state["pipeline_status"] = "completed"
-        
-        return state
-    
     def _user_feedback_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 9: Collect user feedback on generated code"""
-        print("💬 [Node 9] User Feedback")
+        logger.info("💬 [Node 9] User Feedback")
         
         try:
             generated_code = state.get("generated_code", "")
             
-            print("🔊 Asking for user feedback on generated code...")
+            logger.info("🔊 Asking for user feedback on generated code...")
             feedback_prompt = "Please review the generated code and provide your feedback. What would you like me to change or improve?"
-            self.tts_agent.run(feedback_prompt)
+            self._say(feedback_prompt)
             
             # Get user feedback via voice
-            print(" Listening for your feedback...")
-            user_feedback = self.stt_agent.auto_record_speech(max_duration=30)
+            logger.info(" Listening for your feedback...")
+            user_feedback = self._listen(max_duration=30)
             
             if user_feedback:
                 state["user_feedback"] = user_feedback
                 state["feedback_processed"] = True
                 state["current_step"] = "user_feedback"
                 
-                print(f" User feedback: '{user_feedback}'")
-                print(" Feedback collected successfully")
+                logger.info(f" User feedback: '{user_feedback}'")
+                logger.info(" Feedback collected successfully")
             else:
-                print("⏰ No feedback received")
+                logger.info("⏰ No feedback received")
                 state["user_feedback"] = "No feedback provided"
                 state["feedback_processed"] = False
             
         except Exception as e:
-            print(f" Error in user feedback: {e}")
+            logger.error(f" Error in user feedback: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -916,7 +1556,7 @@ class LangGraphVoicePipeline:
     
     def _code_iteration_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 10: Iterate and improve code based on feedback"""
-        print("🔄 [Node 10] Code Iteration")
+        logger.info("🔄 [Node 10] Code Iteration")
         
         try:
             user_feedback = state.get("user_feedback", "")
@@ -924,11 +1564,11 @@ class LangGraphVoicePipeline:
             iteration_count = state.get("iteration_count", 0)
             max_iterations = state.get("max_iterations", 3)
             
-            print(f"🔄 Iterating code (iteration {iteration_count + 1}/{max_iterations})")
-            print(f" Feedback: '{user_feedback}'")
+            logger.info(f"🔄 Iterating code (iteration {iteration_count + 1}/{max_iterations})")
+            logger.info(f" Feedback: '{user_feedback}'")
             
             if iteration_count >= max_iterations:
-                print("  Maximum iterations reached")
+                logger.info("  Maximum iterations reached")
                 state["current_step"] = "code_iteration"
                 return state
             
@@ -937,18 +1577,18 @@ class LangGraphVoicePipeline:
             
             # Update code file
             code_file_path = state.get("code_file_path", f"generated_code_{int(time.time())}.py")
-            with open(code_file_path, 'w') as f:
-                f.write(improved_code)
+            _write_code_file(code_file_path, improved_code)
             
             state["generated_code"] = improved_code
             state["iteration_count"] = iteration_count + 1
             state["current_step"] = "code_iteration"
             
-            print(f" Code improved and saved to: {code_file_path}")
-            print(f" Improved code preview:\n{improved_code[:200]}...")
+            logger.info(f" Code improved and saved to: {code_file_path}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(" Improved code preview:\n%s...", improved_code[:200])
             
         except Exception as e:
-            print(f" Error in code iteration: {e}")
+            logger.error(f" Error in code iteration: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -956,15 +1596,15 @@ class LangGraphVoicePipeline:
     
     def _todo_completion_check_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 11: Interactive Todo Completion Check - Collaborative Review"""
-        print(" [Node 11] Interactive Todo Completion Check")
+        logger.info(" [Node 11] Interactive Todo Completion Check")
         
         try:
             todos = state.get("generated_todos", [])
             generated_code = state.get("generated_code", "")
             current_todo_index = state.get("current_todo_index", 0)
             
-            print(f"📋 Checking completion of {len(todos)} tasks...")
-            print(f" Current todo index: {current_todo_index}")
+            logger.info(f"📋 Checking completion of {len(todos)} tasks...")
+            logger.info(f" Current todo index: {current_todo_index}")
             
             # Check if all todos are addressed in the code
             completed_todos = self._check_todo_completion(todos, generated_code)
@@ -973,25 +1613,25 @@ class LangGraphVoicePipeline:
             state["current_step"] = "todo_completion_check"
             
             if state["todos_completed"]:
-                print(" All tasks completed successfully!")
-                print(" Great work! We've completed all the tasks together!")
-                self.tts_agent.run("Excellent! We've completed all the tasks together. Great collaboration!")
+                logger.info(" All tasks completed successfully!")
+                logger.info(" Great work! We've completed all the tasks together!")
+                self._say_async("Excellent! We've completed all the tasks together. Great collaboration!")
             else:
                 remaining = len(todos) - len(completed_todos)
-                print(f"  {remaining} tasks still need attention")
+                logger.info(f"  {remaining} tasks still need attention")
                 
                 # Check if we have more todos to work on
                 if current_todo_index < len(todos):
                     next_todo = todos[current_todo_index]
-                    print(f"🔄 Next task: '{next_todo}'")
-                    print("💬 Let's continue with the next task!")
-                    self.tts_agent.run(f"We still have {remaining} tasks to complete. The next one is: {next_todo}. Should we continue?")
+                    logger.info(f"🔄 Next task: '{next_todo}'")
+                    logger.info("💬 Let's continue with the next task!")
+                    self._say_async(f"We still have {remaining} tasks to complete. The next one is: {next_todo}. Should we continue?")
                 else:
-                    print("🔄 All todos processed, but some may need refinement")
-                    self.tts_agent.run("We've worked through all the tasks. Would you like me to review or refine anything?")
+                    logger.info("🔄 All todos processed, but some may need refinement")
+                    self._say_async("We've worked through all the tasks. Would you like me to review or refine anything?")
             
         except Exception as e:
-            print(f" Error in todo completion check: {e}")
+            logger.error(f" Error in todo completion check: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -999,7 +1639,7 @@ class LangGraphVoicePipeline:
     
     def _response_generation_node(self, state: VoiceCodingState) -> VoiceCodingState:
         """Node 12: Generate final response and ask for additional help"""
-        print("📤 [Node 12] Response Generation with Continuous Help Loop")
+        logger.info("📤 [Node 12] Response Generation with Continuous Help Loop")
         
         try:
             user_intent = state.get("user_intent", "")
@@ -1015,143 +1655,76 @@ class LangGraphVoicePipeline:
                 response = self._generate_explanation_response(code_explanation)
             elif user_intent == "review":
                 response = self._generate_review_response(code_review)
+            elif user_intent == "file_operation":
+                response = state.get("task_result", "")
             else:
                 response = "Task completed successfully!"
             
             state["final_response"] = response
             state["current_step"] = "response_generation"
             
-            print(" Final response generated")
-            print(f" Response: {response}")
+            logger.info(" Final response generated")
+            logger.info(f" Response: {response}")
             
-            # Speak the final response
-            self.tts_agent.run(response)
+            # Speak the final response and queue the follow-up question behind it, so the question
+            # is synthesized while the response plays; _listen waits for both to finish
+            self._say_in_chunks(response)
             
             # Ask if user needs help with anything else
-            print("\n🤝 Asking if user needs additional help...")
-            self.tts_agent.run("Is there anything else you'd like me to help you with?")
+            logger.info("\n🤝 Asking if user needs additional help...")
+            self._say_async("Is there anything else you'd like me to help you with?")
             
             # Get user response for additional help (max 10s, stops after 1.5s silence)
-            print(" Listening for your response (max 10s, stops after 1.5s silence)...")
-            help_response = self.stt_agent.auto_record_speech(max_duration=10)
+            logger.info(" Listening for your response (max 10s, stops after 1.5s silence)...")
+            help_response = self._listen(max_duration=10)
             
             if help_response:
-                help_lower = help_response.lower().strip()
-                print(f" You said: '{help_response}'")
+                help_words = _tokenize(help_response)
+                logger.info(f" You said: '{help_response}'")
                 
-                if any(word in help_lower for word in ["yes", "yeah", "yep", "sure", "ok", "okay", "help", "more", "another", "continue"]):
-                    print(" User wants additional help. Starting new task...")
-                    self.tts_agent.run("Great! What would you like me to help you with next?")
+                if _is_affirmative(help_words, _MORE_HELP_WORDS):
+                    logger.info(" User wants additional help. Starting new task...")
                     
-                    # Reset state for new task
-                    state["pipeline_status"] = "active"
-                    state["current_step"] = "intent_classification"
-                    state["user_confirmed"] = False
-                    state["confirmation_status"] = ""
-                    state["confirmation_spoken"] = False
-                    state["user_intent"] = ""
-                    state["generated_todos"] = []
-                    state["todos_completed"] = False
-                    state["generated_code"] = ""
-                    state["code_file_path"] = ""
-                    state["code_explanation"] = ""
-                    state["code_review"] = ""
-                    state["review_score"] = 0
-                    state["user_feedback"] = ""
-                    state["feedback_processed"] = False
-                    state["iteration_count"] = 0
-                    state["final_response"] = ""
-                    state["current_todo_index"] = 0
-                    state["transcribed_text"] = ""  # Clear transcribed text for new task
+                    # If the answer already carries the next request ("yes, create a Java class"),
+                    # keep it so intent classification doesn't have to ask and record again
+                    follow_up_request = self._extract_follow_up_request(help_response)
+                    if follow_up_request:
+                        logger.info(f" Follow-up request: '{follow_up_request}'")
+                        self._say_async("Great! Let me get started on that.")
+                    else:
+                        self._say("Great! What would you like me to help you with next?")
+                    
+                    # Reset state for new task (transcribed_text stays empty unless the user already gave the next task)
+                    state.update(_NEW_TASK_RESET, generated_todos=[], transcribed_text=follow_up_request)
                     
                     # Start new task flow
-                    print("🔄 Starting new task flow...")
+                    logger.info("🔄 Starting new task flow...")
                     return state
                     
-                elif any(word in help_lower for word in ["no", "don't", "dont", "nothing", "none", "all set", "good", "fine", "thanks", "thank you"]):
-                    print("👋 User doesn't want any help. Ending session and going back to wake-up word detection.")
-                    self.tts_agent.run("Perfect! I'm here whenever you need help. Just say 'Blueberry' to start a new session.")
+                elif not _NO_MORE_HELP_WORDS.isdisjoint(help_words) or _ALL_SET_PATTERN.search(help_response.lower()):
+                    logger.info("👋 User doesn't want any help. Ending session and going back to wake-up word detection.")
+                    self._say("Perfect! I'm here whenever you need help. Just say 'Blueberry' to start a new session.")
                     
                     # End session and go back to wake-up word detection
-                    state["pipeline_status"] = "completed"
-                    state["wake_word_detected"] = False
-                    state["voice_input"] = ""
-                    state["transcribed_text"] = ""
-                    state["user_confirmed"] = False
-                    state["confirmation_status"] = ""
-                    state["confirmation_spoken"] = False
-                    state["current_step"] = "wake_word_detection"
-                    state["user_intent"] = ""
-                    state["generated_todos"] = []
-                    state["todos_completed"] = False
-                    state["generated_code"] = ""
-                    state["code_file_path"] = ""
-                    state["code_explanation"] = ""
-                    state["code_review"] = ""
-                    state["review_score"] = 0
-                    state["user_feedback"] = ""
-                    state["feedback_processed"] = False
-                    state["iteration_count"] = 0
-                    state["final_response"] = ""
-                    state["current_todo_index"] = 0
+                    state.update(_WAKE_WORD_RESET, generated_todos=[], pipeline_status="completed")
                     return state
                     
                 else:
-                    print("👋 User doesn't need additional help. Going back to wake-up word detection.")
-                    self.tts_agent.run("Perfect! I'm here whenever you need help. Just say 'Blueberry' to start a new session.")
+                    logger.info("👋 User doesn't need additional help. Going back to wake-up word detection.")
+                    self._say("Perfect! I'm here whenever you need help. Just say 'Blueberry' to start a new session.")
                     
                     # Reset to wake-up word detection instead of ending
-                    state["wake_word_detected"] = False
-                    state["voice_input"] = ""
-                    state["transcribed_text"] = ""
-                    state["user_confirmed"] = False
-                    state["confirmation_status"] = ""
-                    state["confirmation_spoken"] = False
-                    state["current_step"] = "wake_word_detection"
-                    state["pipeline_status"] = "active"
-                    state["user_intent"] = ""
-                    state["generated_todos"] = []
-                    state["todos_completed"] = False
-                    state["generated_code"] = ""
-                    state["code_file_path"] = ""
-                    state["code_explanation"] = ""
-                    state["code_review"] = ""
-                    state["review_score"] = 0
-                    state["user_feedback"] = ""
-                    state["feedback_processed"] = False
-                    state["iteration_count"] = 0
-                    state["final_response"] = ""
-                    state["current_todo_index"] = 0
-                    
+                    state.update(_WAKE_WORD_RESET, generated_todos=[])
+
             else:
-                print("⏰ No response. Going back to wake-up word detection.")
-                self.tts_agent.run("I didn't hear anything. I'm here whenever you need help. Just say 'Blueberry' to start a new session.")
-                
+                logger.info("⏰ No response. Going back to wake-up word detection.")
+                self._say("I didn't hear anything. I'm here whenever you need help. Just say 'Blueberry' to start a new session.")
+
                 # Reset to wake-up word detection instead of ending
-                state["wake_word_detected"] = False
-                state["voice_input"] = ""
-                state["transcribed_text"] = ""
-                state["user_confirmed"] = False
-                state["confirmation_status"] = ""
-                state["confirmation_spoken"] = False
-                state["current_step"] = "wake_word_detection"
-                state["pipeline_status"] = "active"
-                state["user_intent"] = ""
-                state["generated_todos"] = []
-                state["todos_completed"] = False
-                state["generated_code"] = ""
-                state["code_file_path"] = ""
-                state["code_explanation"] = ""
-                state["code_review"] = ""
-                state["review_score"] = 0
-                state["user_feedback"] = ""
-                state["feedback_processed"] = False
-                state["iteration_count"] = 0
-                state["final_response"] = ""
-                state["current_todo_index"] = 0
+                state.update(_WAKE_WORD_RESET, generated_todos=[])
             
         except Exception as e:
-            print(f" Error in response generation: {e}")
+            logger.error(f" Error in response generation: {e}")
             state["error_message"] = str(e)
             state["pipeline_status"] = "error"
         
@@ -1159,255 +1732,173 @@ class LangGraphVoicePipeline:
     
     # ==================== HELPER METHODS ====================
     
+    def _say_async(self, text: str) -> concurrent.futures.Future:
+        """Queue text for speech and return immediately"""
+        audio = self._synthesis_pool.submit(self.tts_agent.synthesize, text)
+        self._last_speech = self._speech_pool.submit(self.tts_agent.run, text, audio)
+        return self._last_speech
+    
+    def _say_in_chunks(self, text: str) -> Optional[concurrent.futures.Future]:
+        """Queue long text a few sentences at a time; playback starts after the first piece is ready"""
+        for chunk in _speech_chunks(text):
+            self._say_async(chunk)
+        return self._last_speech
+    
+    def _say(self, text: str) -> str:
+        """Speak text and wait until it, and anything queued before it, has played.
+
+        Long prompts go out in sentence-sized pieces, so playback starts once the first is synthesized.
+        """
+        self._say_in_chunks(text)
+        self._wait_for_speech()
+        return text
+    
+    def _wait_for_speech(self) -> None:
+        """Block until queued speech has finished playing"""
+        if self._last_speech is not None:
+            self._last_speech.result()
+    
+    def _start_speculative_explanation(self, request: str) -> None:
+        """Ask the discussion agent about an explanation request before the user has confirmed it"""
+        self._discard_speculative_explanation()
+        if _classify_intent(request.lower()) == "explanation":
+            # Unconfirmed: the answer only enters the discussion cache if the user confirms
+            future = self._speculation_pool.submit(self.discussion_agent.run, request, confirmed=False)
+            self._speculative_explanation = (request, future)
+    
+    def _take_speculative_explanation(self, request: str) -> Optional[str]:
+        """Answer started during confirmation for this request, or None if there isn't one"""
+        speculation, self._speculative_explanation = self._speculative_explanation, None
+        if speculation is None or speculation[0] != request:
+            return None
+        answer = speculation[1].result()
+        self.discussion_agent.remember(request)
+        return answer
+    
+    def _discard_speculative_explanation(self) -> None:
+        """Drop an answer for a request the user didn't confirm; one already in flight just finishes"""
+        if self._speculative_explanation is not None:
+            self._speculative_explanation[1].cancel()
+            self._speculative_explanation = None
+    
+    def _listen(self, max_duration: int) -> str:
+        """Record a spoken reply once queued speech is done, so the mic doesn't pick up our own voice"""
+        self._wait_for_speech()
+        return self.stt_agent.auto_record_speech(max_duration=max_duration)
+    
+    def _handle_file_operation(self, request: str, state: VoiceCodingState) -> None:
+        """Carry out a spoken file request; response generation reads the result back"""
+        # The acknowledgement plays while the file is looked up and read
+        self._say_async("Sure, um, let me find that file.")
+        result = self.file_agent.run(self.file_agent.extract_file_operation(request))
+        logger.info(f"📁 {result}")
+        
+        state["user_intent"] = "file_operation"
+        state["task_result"] = result
+        state["task_completed"] = True
+        state["current_step"] = "file_operation"
+    
     def _summarize_user_request(self, request: str) -> str:
         """Summarize user request in a more natural way"""
-        request_lower = request.lower()
-        
-        # Extract key action and object with better pattern matching
-        if "write" in request_lower and "function" in request_lower:
-            if "hello world" in request_lower:
-                return "write a function to print hello world"
-            elif "print" in request_lower:
-                return "write a function that prints something"
-            else:
-                return "write a function"
-        elif "create" in request_lower and "function" in request_lower:
-            if "hello world" in request_lower:
-                return "create a hello world function"
-            elif "print" in request_lower:
-                return "create a function that prints something"
-            else:
-                return "create a function"
-        elif "print" in request_lower and "hello world" in request_lower:
-            return "create a function to print hello world"
-        elif "create" in request_lower and "class" in request_lower:
-            return "create a class"
-        elif "create" in request_lower and "api" in request_lower:
-            return "create an API"
-        elif "build" in request_lower:
-            return "build something"
-        elif "make" in request_lower:
-            return "make something"
-        elif "generate" in request_lower:
-            return "generate some code"
-        elif "hello world" in request_lower:
-            return "create a hello world program"
-        elif "print" in request_lower:
-            return "create something that prints"
-        else:
-            # Default summarization - keep more context
-            words = request.split()
-            if len(words) > 8:
-                return f"{' '.join(words[:4])}... {words[-2]} {words[-1]}"
-            elif len(words) > 5:
-                return f"{' '.join(words[:3])}... {words[-1]}"
-            else:
-                return request
+        return _summarize_request(request)
+    
+    def _extract_follow_up_request(self, help_response: str) -> str:
+        """Return the new task from an "anything else?" answer, or "" if it was just a yes"""
+        # Drop the leading "yes, sure, ..." and keep the rest only if it reads like a task
+        follow_up = re.sub(r"^\W*(?:(?:yes|yeah|yep|sure|ok|okay|please)\b\W*)+", "", help_response, flags=re.IGNORECASE).strip()
+        if _TASK_PATTERN.search(follow_up.lower()):
+            return follow_up
+        return ""
     
     def _generate_todos_from_request(self, request: str) -> List[str]:
         """Generate focused interactive todos from user request - Simplified for better interaction"""
-        # Simplified todo generation for better user interaction
-        todos = []
-        request_lower = request.lower()
-        
-        # Always start with file creation
-        todos.append("Create a new file with appropriate name and extension")
-        
-        # Function-specific todos (simplified)
-        if "function" in request_lower:
-            todos.append("Create the main function with proper parameters")
-            todos.append("Implement the function logic")
-        
-        # Class-specific todos (simplified)
-        elif "class" in request_lower:
-            todos.append("Define the class structure and constructor")
-            todos.append("Implement class methods")
-        
-        # API-specific todos (simplified)
-        elif any(word in request_lower for word in ["api", "endpoint", "rest", "http"]):
-            todos.append("Set up the API framework")
-            todos.append("Create the endpoint structure")
-        
-        # Database-specific todos (simplified)
-        elif any(word in request_lower for word in ["database", "model", "schema", "table"]):
-            todos.append("Design the database schema")
-            todos.append("Create the database model")
-        
-        # Test-specific todos (simplified)
-        elif "test" in request_lower:
-            todos.append("Create test cases")
-            todos.append("Implement test logic")
-        
-        # Web-specific todos (simplified)
-        elif any(word in request_lower for word in ["web", "html", "css", "frontend"]):
-            todos.append("Create HTML structure")
-            todos.append("Add CSS styling")
-        
-        # Default todos for simple requests
-        else:
-            todos.append("Implement the requested functionality")
-            todos.append("Add proper documentation and comments")
-        
-        return todos
-    
-    def _analyze_code_request(self, request: str) -> tuple[str, str]:
-        """Analyze the code request to determine language and task type"""
-        request_lower = request.lower()
-        
-        # Language detection - improved to handle "I want a Java function" type requests
-        language = "python"  # default
-        if any(word in request_lower for word in ["javascript", "js", "node", "react", "vue", "angular"]):
-            language = "javascript"
-        elif any(word in request_lower for word in ["java", "spring", "maven", "gradle"]):
-            language = "java"
-        elif any(word in request_lower for word in ["c++", "cpp", "c plus plus"]):
-            language = "cpp"
-        elif any(word in request_lower for word in ["c#", "csharp", "dotnet", ".net"]):
-            language = "csharp"
-        elif any(word in request_lower for word in ["go", "golang"]):
-            language = "go"
-        elif any(word in request_lower for word in ["rust", "cargo"]):
-            language = "rust"
-        elif any(word in request_lower for word in ["php", "laravel", "symfony"]):
-            language = "php"
-        elif any(word in request_lower for word in ["ruby", "rails", "sinatra"]):
-            language = "ruby"
-        elif any(word in request_lower for word in ["swift", "ios", "macos"]):
-            language = "swift"
-        elif any(word in request_lower for word in ["kotlin", "android"]):
-            language = "kotlin"
-        elif any(word in request_lower for word in ["typescript", "ts"]):
-            language = "typescript"
-        elif any(word in request_lower for word in ["html", "css", "web", "frontend"]):
-            language = "html"
-        elif any(word in request_lower for word in ["sql", "database", "query"]):
-            language = "sql"
-        elif any(word in request_lower for word in ["bash", "shell", "script", "linux"]):
-            language = "bash"
-        elif any(word in request_lower for word in ["powershell", "windows"]):
-            language = "powershell"
-        elif any(word in request_lower for word in ["yaml", "yml", "config"]):
-            language = "yaml"
-        elif any(word in request_lower for word in ["json", "api", "rest"]):
-            language = "json"
-        elif any(word in request_lower for word in ["xml", "soap"]):
-            language = "xml"
-        
-        # Task type detection - improved to handle "I want a Java function" type requests
-        task_type = "function"  # default
-        if any(word in request_lower for word in ["class", "object", "oop", "inheritance"]):
-            task_type = "class"
-        elif any(word in request_lower for word in ["api", "endpoint", "rest", "http"]):
-            task_type = "api"
-        elif any(word in request_lower for word in ["database", "model", "schema", "table"]):
-            task_type = "database"
-        elif any(word in request_lower for word in ["test", "unit", "integration", "spec"]):
-            task_type = "test"
-        elif any(word in request_lower for word in ["script", "automation", "tool"]):
-            task_type = "script"
-        elif any(word in request_lower for word in ["web", "frontend", "ui", "component"]):
-            task_type = "frontend"
-        elif any(word in request_lower for word in ["backend", "server", "service"]):
-            task_type = "backend"
-        elif any(word in request_lower for word in ["algorithm", "data structure", "sort", "search"]):
-            task_type = "algorithm"
-        elif any(word in request_lower for word in ["config", "configuration", "setup"]):
-            task_type = "config"
-        
-        print(f" Language analysis: '{request}' → {language}")
-        print(f" Task type analysis: '{request}' → {task_type}")
-        
-        return language, task_type
+        return list(_todos_for_request(_normalize_request(request)))
+    
+    def _analyze_code_request(self, request: str) -> tuple[str, str, bool]:
+        """Analyze the code request to determine language, task type and whether a language was named"""
+        language, task_type, language_specified = _classify_code_request(_normalize_request(request))
+        
+        logger.debug(" Language analysis: %r → %s (specified: %s)", request, language, language_specified)
+        logger.debug(" Task type analysis: %r → %s", request, task_type)
+        
+        return language, task_type, language_specified
     
     def _get_file_extension(self, language: str) -> str:
         """Get appropriate file extension for the language"""
-        extensions = {
-            "python": "py",
-            "javascript": "js",
-            "typescript": "ts",
-            "java": "java",
-            "c++": "cpp",  # Map "c++" to "cpp" extension
-            "cpp": "cpp",
-            "c#": "cs",
-            "csharp": "cs",
-            "go": "go",
-            "rust": "rs",
-            "php": "php",
-            "ruby": "rb",
-            "swift": "swift",
-            "kotlin": "kt",
-            "html": "html",
-            "css": "css",
-            "sql": "sql",
-            "bash": "sh",
-            "powershell": "ps1",
-            "yaml": "yml",
-            "json": "json",
-            "xml": "xml"
-        }
-        return extensions.get(language, "txt")
-    
-    def _is_language_specified(self, request: str) -> bool:
-        """Check if programming language is specified in the request"""
-        request_lower = request.lower()
-        language_keywords = [
-            "python", "javascript", "js", "java", "c++", "cpp", "c#", "csharp", "go", "golang",
-            "rust", "php", "ruby", "swift", "kotlin", "typescript", "ts", "html", "css",
-            "sql", "bash", "shell", "powershell", "yaml", "yml", "json", "xml"
-        ]
-        return any(keyword in request_lower for keyword in language_keywords)
+        info = _LANGUAGE_INFO.get(_LANGUAGE_ALIASES.get(language, language))
+        return info[0] if info else "txt"
+    
+    def _get_language_llm(self):
+        """Create the language-detection model on first use and reuse it afterwards"""
+        if self._language_llm is None:
+            from langchain_openai import ChatOpenAI
+            # Deterministic, so the same answer always maps to the same language (and caches cleanly)
+            self._language_llm = ChatOpenAI(model=self.env.language_model, temperature=0, api_key=self.env.openai_api_key or None)
+        return self._language_llm
     
     def _extract_language_from_response(self, response: str) -> str:
-        """Extract programming language from user response using GPT-4"""
+        """Extract programming language from user response, asking the model only when it isn't obvious"""
+        # Most answers just name one language ("Java", "let's do C plus plus"); settle those locally
+        detected_language = _spoken_language(response)
+        if detected_language:
+            logger.debug(" Detected language: %r from %r", detected_language, response)
+            return detected_language
+        
         try:
-            # Use GPT-4 to detect language from user response
-            language_prompt = f"""
-            Analyze the following user response and determine which programming language they want to use.
-            
-            User response: "{response}"
-            
-            Return ONLY the language name in lowercase. Choose from:
-            python, javascript, java, c++, c#, go, rust, php, ruby, swift, kotlin, typescript, html, css, sql, bash, powershell, yaml, json, xml
-            
-            If unclear, return "python" as default.
-            
-            Language:"""
-            
-            # Use GPT-4 for language detection
-            from langchain_openai import ChatOpenAI
-            llm = ChatOpenAI(model="gpt-4", temperature=0.1)
-            
-            result = llm.invoke(language_prompt)
+            # Static instructions go first so the prompt prefix is identical across calls
+            messages = [
+                SystemMessage(content=LANGUAGE_DETECTION_SYSTEM_PROMPT),
+                HumanMessage(content=render_prompt(LANGUAGE_DETECTION_PROMPT, response=response))
+            ]
+
+            # Ask the language-detection model
+            result = self._get_language_llm().invoke(messages)
             detected_language = result.content.strip().lower()
             
             # Validate the detected language
-            valid_languages = ["python", "javascript", "java", "c++", "c#", "go", "rust", "php", "ruby", "swift", "kotlin", "typescript", "html", "css", "sql", "bash", "powershell", "yaml", "json", "xml"]
-            
-            if detected_language in valid_languages:
-                print(f" GPT-4 detected language: '{detected_language}' from '{response}'")
+            if detected_language in _VALID_LANGUAGES:
+                logger.debug(" Model detected language: %r from %r", detected_language, response)
                 return detected_language
             else:
-                print(f" GPT-4 returned invalid language '{detected_language}', defaulting to python")
+                logger.info(f" Model returned invalid language '{detected_language}', defaulting to python")
                 return "python"
                 
         except Exception as e:
-            print(f" Error in GPT-4 language detection: {e}")
-            # Fallback to simple keyword matching
-            response_lower = response.lower().strip()
-            if "python" in response_lower:
-                return "python"
-            elif "javascript" in response_lower or "js" in response_lower:
-                return "javascript"
-            elif "java" in response_lower:
-                return "java"
-            elif "c++" in response_lower or "cpp" in response_lower:
-                return "c++"
-            else:
-                return "python"
+            logger.error(f" Error in model language detection: {e}")
+            return _keyword_language(response)
+    
+    def _extract_languages_batch(self, responses: List[str]) -> List[str]:
+        """Extract the language for several responses, sending every unclear one in a single model call"""
+        detected = [_spoken_language(response) for response in responses]
+        pending = [i for i, language in enumerate(detected) if language is None]
+        if not pending:
+            return detected
+        
+        numbered = "\n".join(f"{n}. {responses[i]}" for n, i in enumerate(pending, 1))
+        try:
+            messages = [
+                SystemMessage(content=LANGUAGE_DETECTION_SYSTEM_PROMPT),
+                HumanMessage(content=render_prompt(LANGUAGE_DETECTION_BATCH_PROMPT, responses=numbered))
+            ]
+            content = self._get_language_llm().invoke(messages).content.strip().strip("`")
+            languages = json.loads(content.removeprefix("json"))
+            if not isinstance(languages, list) or len(languages) != len(pending):
+                raise ValueError(f"expected {len(pending)} languages, got {languages!r}")
+        except ValueError as e:  # json.JSONDecodeError is a ValueError
+            logger.info(f" Batched language detection unusable ({e}), detecting one at a time")
+            languages = [self._extract_language_from_response(responses[i]) for i in pending]
+        except Exception as e:
+            logger.error(f" Error in batched model language detection: {e}")
+            languages = [_keyword_language(responses[i]) for i in pending]
+        
+        for i, language in zip(pending, languages):
+            language = str(language).strip().lower()
+            detected[i] = language if language in _VALID_LANGUAGES else "python"
+        return detected
     
     def _generate_smart_filename(self, request: str, language: str) -> str:
         """Generate smart filename based on user request and language"""
-        request_lower = request.lower()
+        request_lower = _normalize_request(request)
         
         # Check if user specified a filename
         if "filename" in request_lower or "file name" in request_lower:
@@ -1419,399 +1910,29 @@ class LangGraphVoicePipeline:
                     if filename:
                         return filename
         
-        # Generate filename based on content
-        if "hello world" in request_lower or "print hello" in request_lower:
-            return "hello_world"
-        elif "function" in request_lower:
-            return "main_function"
-        elif "class" in request_lower:
-            return "main_class"
-        elif "api" in request_lower:
-            return "api_server"
-        elif "database" in request_lower:
-            return "database_model"
-        elif "test" in request_lower:
-            return "test_file"
-        elif "script" in request_lower:
-            return "script"
-        elif "web" in request_lower or "html" in request_lower:
-            return "index"
-        elif "css" in request_lower:
-            return "styles"
-        elif "javascript" in request_lower or "js" in request_lower:
-            return "main"
-        elif "java" in request_lower:
-            return "Main"
-        elif "c++" in request_lower or "cpp" in request_lower:
-            return "main"
-        elif "go" in request_lower:
-            return "main"
-        elif "rust" in request_lower:
-            return "main"
-        elif "php" in request_lower:
-            return "index"
-        elif "ruby" in request_lower:
-            return "main"
-        elif "swift" in request_lower:
-            return "main"
-        elif "kotlin" in request_lower:
-            return "Main"
-        elif "sql" in request_lower:
-            return "database_schema"
-        elif "bash" in request_lower or "shell" in request_lower:
-            return "script"
-        elif "powershell" in request_lower:
-            return "script"
-        elif "yaml" in request_lower or "yml" in request_lower:
-            return "config"
-        elif "json" in request_lower:
-            return "data"
-        elif "xml" in request_lower:
-            return "data"
-        else:
-            # Default filename based on language
-            if language == "python":
-                return "main"
-            elif language == "javascript":
-                return "main"
-            elif language == "java":
-                return "Main"
-            elif language == "cpp":
-                return "main"
-            elif language == "go":
-                return "main"
-            elif language == "rust":
-                return "main"
-            elif language == "php":
-                return "index"
-            elif language == "ruby":
-                return "main"
-            elif language == "swift":
-                return "main"
-            elif language == "kotlin":
-                return "Main"
-            elif language == "html":
-                return "index"
-            elif language == "css":
-                return "styles"
-            elif language == "sql":
-                return "database"
-            elif language == "bash":
-                return "script"
-            elif language == "powershell":
-                return "script"
-            elif language == "yaml":
-                return "config"
-            elif language == "json":
-                return "data"
-            elif language == "xml":
-                return "data"
-            else:
-                return "main"
+        # Generate filename based on content, then fall back to the language default
+        for pattern, filename in _FILENAME_PATTERNS:
+            if pattern.search(request_lower):
+                return filename
+        return _DEFAULT_FILENAME_BY_LANGUAGE.get(language, "main")
     
     def _generate_universal_code(self, request: str, todos: List[str], language: str, task_type: str) -> str:
         """Generate code for any programming language and task type"""
-        try:
-            # Use the appropriate agent based on language
-            if language == "python":
-                return self._generate_python_code(request, todos, task_type)
-            elif language == "javascript":
-                return self._generate_javascript_code(request, todos, task_type)
-            elif language == "java":
-                return self._generate_java_code(request, todos, task_type)
-            elif language == "c++" or language == "cpp":
-                return self._generate_cpp_code(request, todos, task_type)
-            elif language == "html":
-                return self._generate_html_code(request, todos, task_type)
-            elif language == "sql":
-                return self._generate_sql_code(request, todos, task_type)
-            elif language == "bash":
-                return self._generate_bash_code(request, todos, task_type)
-            else:
-                # Fallback to Python agent for other languages
-                return self._generate_python_code(request, todos, task_type)
-        except Exception as e:
-            return f"# Error generating {language} code: {e}"
-    
-    def _generate_python_code(self, request: str, todos: List[str], task_type: str) -> str:
-        """Generate Python code - Enhanced with proper implementation"""
-        todo_text = "\n".join([f"# - {todo}" for todo in todos])
+        # Unknown languages fall back to the Python templates, so the lookups can't fail
+        templates, todo_prefix, todo_suffix = _CODE_TEMPLATES.get(language, _CODE_TEMPLATES["python"])
         
-        if task_type == "class":
-            return f"""# Generated Python class for: {request}
-{todo_text}
-
-class GeneratedClass:
-    def __init__(self):
-        \"\"\"Initialize the class\"\"\"
-        pass
-    
-    def main_method(self):
-        \"\"\"Main method implementation\"\"\"
-        pass
-
-if __name__ == '__main__':
-    obj = GeneratedClass()
-    obj.main_method()
-"""
-        elif task_type == "api":
-            return f"""# Generated Python API for: {request}
-{todo_text}
-
-from flask import Flask, request, jsonify
-
-app = Flask(__name__)
-
-@app.route('/api/endpoint', methods=['GET', 'POST'])
-def api_endpoint():
-    \"\"\"API endpoint implementation\"\"\"
-    return jsonify({{"message": "API response"}})
-
-if __name__ == '__main__':
-    app.run(debug=True)
-"""
-        elif "hello world" in request.lower() or "print hello" in request.lower():
-            return f"""# Generated Python function for: {request}
-{todo_text}
-
-def print_hello_world():
-    \"\"\"Function to print hello world\"\"\"
-    print("Hello, World!")
-
-def main():
-    \"\"\"Main function to run the hello world function\"\"\"
-    print_hello_world()
-
-if __name__ == '__main__':
-    main()
-"""
-        elif "function" in request.lower():
-            return f"""# Generated Python function for: {request}
-{todo_text}
-
-def main():
-    \"\"\"Main function implementation\"\"\"
-    # Add your code here
-    pass
-
-if __name__ == '__main__':
-    main()
-"""
-        else:
-            return f"""# Generated Python code for: {request}
-{todo_text}
-
-def main():
-    \"\"\"Main function implementation\"\"\"
-    # Add your code here
-    pass
-
-if __name__ == '__main__':
-    main()
-"""
-    
-    def _generate_javascript_code(self, request: str, todos: List[str], task_type: str) -> str:
-        """Generate JavaScript code - Enhanced with proper implementation"""
-        todo_text = "\n".join([f"// - {todo}" for todo in todos])
+        # Class/API scaffolds where the language has them, otherwise decide from the request once
+        template = templates.get(task_type) if task_type in ("class", "api") else None
+        if template is None:
+            template = templates.get(_request_kind(_normalize_request(request)), templates["default"])
         
-        if task_type == "class":
-            return f"""// Generated JavaScript class for: {request}
-{todo_text}
-
-class GeneratedClass {{
-    constructor() {{
-        // Constructor implementation
-    }}
-    
-    mainMethod() {{
-        // Main method implementation
-    }}
-}}
-
-// Usage
-const obj = new GeneratedClass();
-obj.mainMethod();
-"""
-        elif task_type == "api":
-            return f"""// Generated JavaScript API for: {request}
-{todo_text}
-
-const express = require('express');
-const app = express();
-
-app.get('/api/endpoint', (req, res) => {{
-    res.json({{ message: 'API response' }});
-}});
-
-app.listen(3000, () => {{
-    console.log('Server running on port 3000');
-}});
-"""
-        elif "hello world" in request.lower() or "print hello" in request.lower():
-            return f"""// Generated JavaScript function for: {request}
-{todo_text}
-
-function printHelloWorld() {{
-    console.log("Hello, World!");
-}}
-
-function main() {{
-    printHelloWorld();
-}}
-
-main();
-"""
-        elif "function" in request.lower():
-            return f"""// Generated JavaScript function for: {request}
-{todo_text}
-
-function main() {{
-    // Main function implementation
-}}
-
-main();
-"""
-        else:
-            return f"""// Generated JavaScript code for: {request}
-{todo_text}
-
-function main() {{
-    // Main function implementation
-}}
-
-main();
-"""
-    
-    def _generate_java_code(self, request: str, todos: List[str], task_type: str) -> str:
-        """Generate Java code - Enhanced with proper implementation"""
-        todo_text = "\n".join([f"    // - {todo}" for todo in todos])
-
-        if "hello world" in request.lower() or "print hello" in request.lower():
-            return f"""// Generated Java code for: {request}
-{todo_text}
-
-public class HelloWorld {{
-    public static void printHelloWorld() {{
-        System.out.println("Hello, World!");
-    }}
-
-    public static void main(String[] args) {{
-        printHelloWorld();
-    }}
-}}
-"""
-        elif "function" in request.lower():
-            return f"""// Generated Java code for: {request}
-{todo_text}
-
-public class Main {{
-    public static void main(String[] args) {{
-        // Main method implementation
-    }}
-}}
-"""
-        else:
-            return f"""// Generated Java code for: {request}
-{todo_text}
-
-public class GeneratedClass {{
-    public static void main(String[] args) {{
-        // Main method implementation
-    }}
-}}
-"""
-
-    def _generate_cpp_code(self, request: str, todos: List[str], task_type: str) -> str:
-        """Generate C++ code - Enhanced with proper implementation"""
-        todo_text = "\n".join([f"    // - {todo}" for todo in todos])
-
-        if "hello world" in request.lower() or "print hello" in request.lower():
-            return f"""// Generated C++ code for: {request}
-{todo_text}
-
-#include <iostream>
-
-void printHelloWorld() {{
-    std::cout << "Hello, World!" << std::endl;
-}}
-
-int main() {{
-    printHelloWorld();
-    return 0;
-}}
-"""
-        elif "function" in request.lower():
-            return f"""// Generated C++ code for: {request}
-{todo_text}
-
-#include <iostream>
-
-int main() {{
-    // Main function implementation
-    return 0;
-}}
-"""
-        else:
-            return f"""// Generated C++ code for: {request}
-{todo_text}
-
-#include <iostream>
-
-int main() {{
-    // Main function implementation
-    return 0;
-}}
-"""
-    
-    def _generate_html_code(self, request: str, todos: List[str], task_type: str) -> str:
-        """Generate HTML code"""
-        todo_text = "\n".join([f"    <!-- - {todo} -->" for todo in todos])
-        
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Generated Page</title>
-</head>
-<body>
-{todo_text}
-    <h1>Generated HTML for: {request}</h1>
-    <script>
-        // JavaScript implementation
-    </script>
-</body>
-</html>
-"""
-    
-    def _generate_sql_code(self, request: str, todos: List[str], task_type: str) -> str:
-        """Generate SQL code"""
-        todo_text = "\n".join([f"-- - {todo}" for todo in todos])
-        
-        return f"""-- Generated SQL for: {request}
-{todo_text}
-
--- Main SQL implementation
-SELECT * FROM table_name WHERE condition = 'value';
-"""
-    
-    def _generate_bash_code(self, request: str, todos: List[str], task_type: str) -> str:
-        """Generate Bash script"""
-        todo_text = "\n".join([f"# - {todo}" for todo in todos])
-        
-        return f"""#!/bin/bash
-# Generated Bash script for: {request}
-{todo_text}
-
-# Main script implementation
-echo "Script executed successfully"
-"""
+        return render_prompt(template, request=request, todo_text=_format_todos(todos, todo_prefix, todo_suffix))
     
     def _generate_code_from_todos(self, todos: List[str], request: str) -> str:
         """Generate code from todos using Python agent"""
         try:
             # Use Python agent to generate code
-            todo_text = "\n".join([f"- {todo}" for todo in todos])
+            todo_text = _format_todos(todos, "- ")
             full_request = f"{request}\n\nTasks to implement:\n{todo_text}"
             
             # This would call the actual Python agent
@@ -1828,12 +1949,10 @@ echo "Script executed successfully"
     
     def _check_todo_completion(self, todos: List[str], code: str) -> List[str]:
         """Check which todos are completed in the code"""
-        completed = []
-        for todo in todos:
-            # Simple keyword matching for completion check
-            if any(keyword in code.lower() for keyword in todo.lower().split()):
-                completed.append(todo)
-        return completed
+        # Simple keyword matching for completion check: a todo counts as done when
+        # any of its words shows up in the code. Tokenize the code once, not per keyword.
+        code_words = _tokenize(code)
+        return [todo for todo in todos if not code_words.isdisjoint(_tokenize(todo))]
     
     def _generate_coding_response(self, code: str, todos: List[str]) -> str:
         """Generate response for coding tasks"""
@@ -1860,40 +1979,17 @@ echo "Script executed successfully"
     
     def _should_continue_after_confirmation_simple(self, state: VoiceCodingState) -> str:
         """Simple confirmation routing - Wake-up → Voice → Speech-to-Text → Confirmation → Intent Classification"""
-        confirmation_status = state.get("confirmation_status", "confirmed")
-        
-        if confirmation_status == "confirmed":
-            return "intent_classification"  # Go to intent classification after confirmation
-        elif confirmation_status == "re_record":
-            return "voice_input"  # Go back to voice input if "no"
-        else:  # cancelled
-            return END
+        # "re_record" goes back to voice input; anything else (cancelled) ends the flow
+        return _CONFIRMATION_ROUTES.get(state.get("confirmation_status", "confirmed"), END)
     
     def _should_continue_after_intent_classification(self, state: VoiceCodingState) -> str:
         """Route to appropriate task based on intent classification"""
-        user_intent = state.get("user_intent", "general")
-        
-        if user_intent == "coding":
-            return "todo_generation"  # Start with todo generation for coding tasks
-        elif user_intent == "review":
-            return "code_review"
-        elif user_intent == "explanation":
-            return "code_explanation"
-        else:  # general or unknown
-            return "code_explanation"  # Default to explanation for general queries
+        # Default to explanation for general or unknown queries
+        return _INTENT_ROUTES.get(state.get("user_intent", "general"), "code_explanation")
     
     def _should_continue_after_todo_generation(self, state: VoiceCodingState) -> str:
         """Route after todo generation"""
-        user_intent = state.get("user_intent", "coding")
-        
-        if user_intent == "coding":
-            return "code_generation"
-        elif user_intent == "explanation":
-            return "code_explanation"
-        elif user_intent == "review":
-            return "code_review"
-        else:
-            return "code_generation"  # Default to code generation
+        return _TODO_GENERATION_ROUTES.get(state.get("user_intent", "coding"), "code_generation")
     
     def _should_continue_after_code_generation(self, state: VoiceCodingState) -> str:
         """Route after code generation"""
@@ -1957,118 +2053,103 @@ echo "Script executed successfully"
     def run_pipeline(self, initial_state: Optional[VoiceCodingState] = None) -> VoiceCodingState:
         """Run the confirmation flow pipeline"""
         if initial_state is None:
-            initial_state = {
-                "wake_word_detected": False,
-                "voice_input": "",
-                "transcribed_text": "",
-                "user_confirmed": False,
-                "confirmation_status": "",
-                "confirmation_spoken": False,
-                "current_step": "wake_word_detection",
-                "pipeline_status": "active",
-                "error_message": "",
-                "user_intent": "",
-                "generated_todos": [],
-                "todos_completed": False,
-                "generated_code": "",
-                "code_file_path": "",
-                "code_explanation": "",
-                "code_review": "",
-                "review_score": 0,
-                "user_feedback": "",
-                "feedback_processed": False,
-                "iteration_count": 0,
-                "max_iterations": 3,
-                "final_response": "",
-                "interaction_count": 0,
-                "current_todo_index": 0
-            }
+            initial_state = dict(_INITIAL_STATE, generated_todos=[])
         
         try:
-            print(" Starting Confirmation Flow Pipeline...")
+            logger.info(" Starting Confirmation Flow Pipeline...")
             result = self.workflow.invoke(initial_state)
-            print(" Confirmation flow completed!")
+            logger.info(" Confirmation flow completed!")
             return result
             
         except Exception as e:
-            print(f" Pipeline error: {e}")
+            logger.error(f" Pipeline error: {e}")
             return {
                 "error_message": str(e),
                 "pipeline_status": "error"
             }
     
-    def start_continuous_session(self):
-        """Start the continuous voice coding session with infinite loop"""
-        print("\n Starting Continuous Voice Coding Session...")
-        print("📋 Flow: Wake-up Word → Voice Input → Speech-to-Text → Confirmation → Intent Classification → Code Generation")
-        print(" Say 'Blueberry' to start, then speak your request")
-        print("🔄 After task completion, system asks if you need more help")
-        print("🔄 If you say 'no', system goes back to wake-up word detection")
-        print("🔄 If you say 'yes', system starts a new task")
-        print("⏹️  Press Ctrl+C to exit anytime")
-        print("\n" + "=" * 60)
+    def run_scripted(self, events: List[ScriptedEvent], max_duration: float = 30,
+                     initial_state: Optional[VoiceCodingState] = None) -> VoiceCodingState:
+        """Run one session from scripted events instead of the microphone, for tests.
+
+        Listens consume the events in order. The run ends when the graph does or when the script
+        runs out of events or time, and returns the last state reached.
+        """
+        live_stt, self.stt_agent = self.stt_agent, _ScriptedSpeech(events, max_duration)
+        state = initial_state if initial_state is not None else dict(_INITIAL_STATE, generated_todos=[])
+        try:
+            for state in self.workflow.stream(state, stream_mode="values"):
+                pass
+        except _ScriptEnded:
+            logger.info(" Scripted session ran out of events")
+        finally:
+            self.stt_agent = live_stt
+        return state
+    
+    def start_continuous_session(self) -> bool:
+        """Run voice coding interactions until Ctrl+C.
+
+        A failing interaction is retried with backoff. After _MAX_RESTART_ATTEMPTS failures in a row
+        the session gives up and returns False; it returns True when the user stops it.
+        """
+        logger.info("\n Starting Continuous Voice Coding Session...")
+        logger.info("📋 Flow: Wake-up Word → Voice Input → Speech-to-Text → Confirmation → Intent Classification → Code Generation")
+        logger.info(" Say 'Blueberry' to start, then speak your request")
+        logger.info("🔄 After task completion, system asks if you need more help")
+        logger.info("🔄 If you say 'no', system goes back to wake-up word detection")
+        logger.info("🔄 If you say 'yes', system starts a new task")
+        logger.info("⏹️  Press Ctrl+C to exit anytime")
+        logger.info("\n" + "=" * 60)
 
+        restart_attempt = 0
         try:
             while True:
-                print("\n🔄 Starting new interaction...")
+                logger.info("\n🔄 Starting new interaction...")
 
                 # Initialize state for this interaction
-                initial_state = {
-                    "wake_word_detected": False,
-                    "voice_input": "",
-                    "transcribed_text": "",
-                    "user_confirmed": False,
-                    "confirmation_status": "",
-                    "confirmation_spoken": False,
-                    "current_step": "wake_word_detection",
-                    "pipeline_status": "active",
-                    "error_message": "",
-                    "user_intent": "",
-                    "generated_todos": [],
-                    "todos_completed": False,
-                    "generated_code": "",
-                    "code_file_path": "",
-                    "code_explanation": "",
-                    "code_review": "",
-                    "review_score": 0,
-                    "user_feedback": "",
-                    "feedback_processed": False,
-                    "iteration_count": 0,
-                    "max_iterations": 3,
-                    "final_response": "",
-                    "interaction_count": 0,
-                    "current_todo_index": 0
-                }
-
-                # Run the workflow
-                result = self.workflow.invoke(initial_state)
+                initial_state = dict(_INITIAL_STATE, generated_todos=[])
+
+                # Run the workflow, backing off before retrying if it fails
+                try:
+                    result = self.workflow.invoke(initial_state)
+                except Exception as e:
+                    logger.error(f"\n Session error: {e}")
+                    if restart_attempt >= _MAX_RESTART_ATTEMPTS:
+                        logger.error(f"\n Voice coding session stopped: it failed {restart_attempt + 1} times in a row "
+                                     f"(last error: {e}). Check your microphone, network and API keys, then start it again.")
+                        return False
+                    delay = min(_MAX_RESTART_DELAY, 2 ** restart_attempt) + random.uniform(0, 0.5)
+                    restart_attempt += 1
+                    logger.info(f"Restarting session in {delay:.1f}s...")
+                    time.sleep(delay)
+                    continue
+                restart_attempt = 0
 
                 # Check if task was completed
                 if result.get("task_completed"):
-                    print("\n Task completed successfully!")
-                    print(f" Intent: {result.get('user_intent', 'unknown')}")
-                    print(f" Task Result:\n{result.get('task_result', 'No result')}")
+                    logger.info("\n Task completed successfully!")
+                    logger.info(f" Intent: {result.get('user_intent', 'unknown')}")
+                    logger.info(f" Task Result:\n{result.get('task_result', 'No result')}")
                 elif result.get("user_confirmed"):
-                    print("\n User confirmed! Intent classification completed.")
-                    print(f" Intent: {result.get('user_intent', 'unknown')}")
+                    logger.info("\n User confirmed! Intent classification completed.")
+                    logger.info(f" Intent: {result.get('user_intent', 'unknown')}")
                 elif result.get("pipeline_status") == "completed":
-                    print("\n Session completed! Going back to wake-up word detection...")
-                    print("🔄 Waiting for 'Blueberry' to start new session...")
+                    logger.info("\n Session completed! Going back to wake-up word detection...")
+                    logger.info("🔄 Waiting for 'Blueberry' to start new session...")
                     continue  # Continue the while loop to wait for next wake-up word
                 else:
-                    print("\n User did not confirm. Flow ended.")
+                    logger.info("\n User did not confirm. Flow ended.")
 
-                print("\n🔄 Ready for next interaction...")
+                logger.info("\n🔄 Ready for next interaction...")
 
         except KeyboardInterrupt:
-            print("\n\n👋 Session interrupted by user. Stopping TTS...")
+            logger.info("\n\n👋 Session interrupted by user. Stopping TTS...")
             # Stop TTS immediately
             self.tts_agent.stop_tts()
-            print(" TTS stopped. Goodbye!")
-        except Exception as e:
-            print(f"\n Session error: {e}")
-            print("Restarting session...")
-            time.sleep(2)
+            logger.info(" TTS stopped. Goodbye!")
+        finally:
+            self.close()
+        return True
 
 
 def main():
@@ -2095,8 +2176,9 @@ def main():
     pipeline = LangGraphVoicePipeline()
     global_pipeline = pipeline  # Store reference for signal handler
     
-    # Start continuous session
-    pipeline.start_continuous_session()
+    # Start continuous session; it only returns by itself when it keeps failing
+    if not pipeline.start_continuous_session():
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,10 +3,8 @@ Main entry point for LangGraph Voice Pipeline - Universal Code Generation
 Tests: Wake-up Word → Voice Input → Speech-to-Text → Confirmation → Intent Classification → Universal Code Generation
 """
 
-import os
 import sys
-from dotenv import load_dotenv
-from langgraph_pipeline import LangGraphVoicePipeline
+from langgraph_pipeline import LangGraphVoicePipeline, bootstrap
 
 def main():
     """Main entry point - Universal Code Generation Pipeline."""
@@ -15,17 +13,16 @@ def main():
     print("=" * 80)
 
     # Load environment variables
-    load_dotenv()
+    env = bootstrap()
 
     # Verify OpenAI API key
-    if not os.getenv("OPENAI_API_KEY"):
+    if not env.openai_api_key:
         print("ERROR: OPENAI_API_KEY not found in environment variables.")
         print("Please set your OpenAI API key in a .env file or environment variable.")
         sys.exit(1)
 
     # Check for Porcupine API key (optional, will fallback to manual activation)
-    porcupine_key = os.getenv("PORCUPINE_ACCESS_KEY")
-    if not porcupine_key:
+    if not env.porcupine_access_key:
         print("  WARNING: PORCUPINE_ACCESS_KEY not found.")
         print("   Wake-up word detection will be disabled.")
         print("   You can get a free API key from: https://picovoice.ai/")
@@ -3,6 +3,9 @@ Centralized Prompts for AI Pair Programming Multi-Agent Framework
 Contains all system prompts, user prompts, and templates used across agents.
 """
 
+import string
+import functools
+
 # =============================================================================
 # INTENT CLASSIFICATION PROMPTS
 # =============================================================================
@@ -26,18 +29,9 @@ Analyze this user request and classify it into one of these categories:
 
 5. **exit** - User wants to end the session (handled separately)
 
-User request: "{user_request}"
-
-Respond with a JSON object containing:
-- intent: one of ["coding", "discussion", "file_operations", "code_analysis"]
-- confidence: float between 0.0 and 1.0
-- action: specific action to take
-- extracted_info: any relevant extracted information (like file names, code requirements, analysis type, etc.)
-- message: brief explanation of the classification
+Classify it as one of ["coding", "discussion", "file_operations", "code_analysis"], with your confidence (0.0 to 1.0), the specific action to take, and a brief explanation of the classification.
 
-Example responses:
-{{"intent": "coding", "confidence": 0.95, "action": "generate_code", "extracted_info": {{"task": "create a sorting function"}}, "message": "User wants to create code"}}
-{{"intent": "code_analysis", "confidence": 0.90, "action": "analyze_code", "extracted_info": {{"analysis_type": "explain"}}, "message": "User wants to analyze existing code"}}
+User request: "{user_request}"
 """
 
 # =============================================================================
@@ -74,11 +68,6 @@ Remember: This will be spoken aloud, so structure your answer to flow naturally
 
 CODE_EXPLANATION_PROMPT = """You are a senior software engineer explaining code to a colleague through voice conversation.
 
-Code to analyze:
-```{language}
-{code}
-```
-
 Please explain this code in a clear, conversational way suitable for voice output. Include:
 
 1. **What it does** - Main purpose and functionality
@@ -92,14 +81,14 @@ Keep your explanation:
 - Focused on the most important aspects
 - Suitable for voice delivery (avoid complex formatting)
 
-Start your response with a brief summary, then provide details."""
+Start your response with a brief summary, then provide details.
 
-CODE_REVIEW_PROMPT = """You are conducting a friendly code review through voice conversation.
-
-Code to review:
+Code to analyze:
 ```{language}
 {code}
-```
+```"""
+
+CODE_REVIEW_PROMPT = """You are conducting a friendly code review through voice conversation.
 
 Provide a voice-friendly code review covering:
 
@@ -108,14 +97,14 @@ Provide a voice-friendly code review covering:
 3. **Potential improvements** - Any issues or suggestions?
 4. **Best practices** - Are there better patterns to use?
 
-Keep it constructive and conversational for voice delivery. Focus on the most important points."""
-
-CODE_OPTIMIZATION_PROMPT = """You are a performance optimization expert analyzing code through voice.
+Keep it constructive and conversational for voice delivery. Focus on the most important points.
 
-Code to optimize:
+Code to review:
 ```{language}
 {code}
-```
+```"""
+
+CODE_OPTIMIZATION_PROMPT = """You are a performance optimization expert analyzing code through voice.
 
 Suggest optimizations in a voice-friendly format:
 
@@ -124,14 +113,14 @@ Suggest optimizations in a voice-friendly format:
 3. **Best practices** - Modern patterns and techniques
 4. **Specific suggestions** - Concrete changes to make
 
-Keep suggestions practical and explain the benefits clearly for voice delivery."""
-
-CODE_DEBUG_PROMPT = """You are a debugging expert analyzing code for potential issues.
+Keep suggestions practical and explain the benefits clearly for voice delivery.
 
-Code to debug:
+Code to optimize:
 ```{language}
 {code}
-```
+```"""
+
+CODE_DEBUG_PROMPT = """You are a debugging expert analyzing code for potential issues.
 
 Analyze for potential issues in a voice-friendly way:
 
@@ -140,7 +129,12 @@ Analyze for potential issues in a voice-friendly way:
 3. **Error handling** - Missing try-catch or validation
 4. **Recommendations** - How to make the code more robust
 
-Focus on the most likely issues and explain them clearly for voice."""
+Focus on the most likely issues and explain them clearly for voice.
+
+Code to debug:
+```{language}
+{code}
+```"""
 
 # =============================================================================
 # TODO AGENT PROMPTS
@@ -177,6 +171,8 @@ Generate a clear, step-by-step to-do list for implementing this request:"""
 # CODE (PROGRAMMING) AGENT PROMPTS
 # =============================================================================
 
+# As with language detection below, everything static sits in the system message so
+# code-generation calls share one verbatim prefix; only the task list varies.
 CODE_SYSTEM_PROMPT = """You are an expert programmer who writes clean, efficient, and well-documented code in multiple langauges including Python, HTML, CSS, C, C++, Java, JavaScript, Ruby.
 
 Your task is to implement Python code based on a given to-do list of tasks.
@@ -191,14 +187,35 @@ Guidelines:
 7. Add comments for complex logic
 8. Include example usage in a main block if appropriate
 
+Identify the suitable language for the tasks you are given. If no language is mentioned, default to Python. Write code that fulfills the requirements, with proper error handling, type hints, and documentation.
+
 Return ONLY the Python code, no additional explanation or markdown formatting."""
 
-CODE_GENERATION_PROMPT = """Identify the suitable language for the give code that needs to be implemented for the following tasks:
+CODE_GENERATION_PROMPT = """Tasks:
+{tasks}"""
+
+# =============================================================================
+# LANGUAGE DETECTION PROMPTS
+# =============================================================================
+
+# Static instructions live in the system message so every call shares the same
+# prefix (OpenAI caches repeated prompt prefixes automatically); only the short
+# user turn below changes between calls.
+LANGUAGE_DETECTION_SYSTEM_PROMPT = """Analyze the user's response and determine which programming language they want to use.
+
+Return ONLY the language name in lowercase. Choose from:
+python, javascript, java, c++, c#, go, rust, php, ruby, swift, kotlin, typescript, html, css, sql, bash, powershell, yaml, json, xml
+
+If unclear, return "python" as default."""
+
+LANGUAGE_DETECTION_PROMPT = """User response: "{response}"
 
-{tasks}
+Language:"""
 
-Please identify the langauge required for the task. If not mentioned default to Python. Write code that fulfills the requirements. Include proper error handling, type hints, and documentation."""
+LANGUAGE_DETECTION_BATCH_PROMPT = """Numbered user responses:
+{responses}
 
+Return ONLY a JSON array with one language name per response, in the same order."""
 
 
 # =============================================================================
@@ -236,58 +253,296 @@ I helped you with programming discussions, code generation, file operations, and
 
 Happy coding! Goodbye!"""
 
+# =============================================================================
+# CODE GENERATION TEMPLATES
+# =============================================================================
+# Filled with str.format(request=..., todo_text=...); literal braces are doubled.
+
+PYTHON_CLASS_TEMPLATE = """# Generated Python class for: {request}
+{todo_text}
+
+class GeneratedClass:
+    def __init__(self):
+        \"\"\"Initialize the class\"\"\"
+        pass
+    
+    def main_method(self):
+        \"\"\"Main method implementation\"\"\"
+        pass
+
+if __name__ == '__main__':
+    obj = GeneratedClass()
+    obj.main_method()
+"""
+
+PYTHON_API_TEMPLATE = """# Generated Python API for: {request}
+{todo_text}
+
+from flask import Flask, request, jsonify
+
+app = Flask(__name__)
+
+@app.route('/api/endpoint', methods=['GET', 'POST'])
+def api_endpoint():
+    \"\"\"API endpoint implementation\"\"\"
+    return jsonify({{"message": "API response"}})
+
+if __name__ == '__main__':
+    app.run(debug=True)
+"""
+
+PYTHON_HELLO_WORLD_TEMPLATE = """# Generated Python function for: {request}
+{todo_text}
+
+def print_hello_world():
+    \"\"\"Function to print hello world\"\"\"
+    print("Hello, World!")
+
+def main():
+    \"\"\"Main function to run the hello world function\"\"\"
+    print_hello_world()
+
+if __name__ == '__main__':
+    main()
+"""
+
+PYTHON_FUNCTION_TEMPLATE = """# Generated Python function for: {request}
+{todo_text}
+
+def main():
+    \"\"\"Main function implementation\"\"\"
+    # Add your code here
+    pass
+
+if __name__ == '__main__':
+    main()
+"""
+
+PYTHON_DEFAULT_TEMPLATE = """# Generated Python code for: {request}
+{todo_text}
+
+def main():
+    \"\"\"Main function implementation\"\"\"
+    # Add your code here
+    pass
+
+if __name__ == '__main__':
+    main()
+"""
+
+JAVASCRIPT_CLASS_TEMPLATE = """// Generated JavaScript class for: {request}
+{todo_text}
+
+class GeneratedClass {{
+    constructor() {{
+        // Constructor implementation
+    }}
+    
+    mainMethod() {{
+        // Main method implementation
+    }}
+}}
+
+// Usage
+const obj = new GeneratedClass();
+obj.mainMethod();
+"""
+
+JAVASCRIPT_API_TEMPLATE = """// Generated JavaScript API for: {request}
+{todo_text}
+
+const express = require('express');
+const app = express();
+
+app.get('/api/endpoint', (req, res) => {{
+    res.json({{ message: 'API response' }});
+}});
+
+app.listen(3000, () => {{
+    console.log('Server running on port 3000');
+}});
+"""
+
+JAVASCRIPT_HELLO_WORLD_TEMPLATE = """// Generated JavaScript function for: {request}
+{todo_text}
+
+function printHelloWorld() {{
+    console.log("Hello, World!");
+}}
+
+function main() {{
+    printHelloWorld();
+}}
+
+main();
+"""
+
+JAVASCRIPT_FUNCTION_TEMPLATE = """// Generated JavaScript function for: {request}
+{todo_text}
+
+function main() {{
+    // Main function implementation
+}}
+
+main();
+"""
+
+JAVASCRIPT_DEFAULT_TEMPLATE = """// Generated JavaScript code for: {request}
+{todo_text}
+
+function main() {{
+    // Main function implementation
+}}
+
+main();
+"""
+
+JAVA_HELLO_WORLD_TEMPLATE = """// Generated Java code for: {request}
+{todo_text}
+
+public class HelloWorld {{
+    public static void printHelloWorld() {{
+        System.out.println("Hello, World!");
+    }}
+
+    public static void main(String[] args) {{
+        printHelloWorld();
+    }}
+}}
+"""
+
+JAVA_FUNCTION_TEMPLATE = """// Generated Java code for: {request}
+{todo_text}
+
+public class Main {{
+    public static void main(String[] args) {{
+        // Main method implementation
+    }}
+}}
+"""
+
+JAVA_DEFAULT_TEMPLATE = """// Generated Java code for: {request}
+{todo_text}
+
+public class GeneratedClass {{
+    public static void main(String[] args) {{
+        // Main method implementation
+    }}
+}}
+"""
+
+CPP_HELLO_WORLD_TEMPLATE = """// Generated C++ code for: {request}
+{todo_text}
+
+#include <iostream>
+
+void printHelloWorld() {{
+    std::cout << "Hello, World!" << std::endl;
+}}
+
+int main() {{
+    printHelloWorld();
+    return 0;
+}}
+"""
+
+CPP_FUNCTION_TEMPLATE = """// Generated C++ code for: {request}
+{todo_text}
+
+#include <iostream>
+
+int main() {{
+    // Main function implementation
+    return 0;
+}}
+"""
+
+CPP_DEFAULT_TEMPLATE = """// Generated C++ code for: {request}
+{todo_text}
+
+#include <iostream>
+
+int main() {{
+    // Main function implementation
+    return 0;
+}}
+"""
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Generated Page</title>
+</head>
+<body>
+{todo_text}
+    <h1>Generated HTML for: {request}</h1>
+    <script>
+        // JavaScript implementation
+    </script>
+</body>
+</html>
+"""
+
+SQL_TEMPLATE = """-- Generated SQL for: {request}
+{todo_text}
+
+-- Main SQL implementation
+SELECT * FROM table_name WHERE condition = 'value';
+"""
+
+BASH_TEMPLATE = """#!/bin/bash
+# Generated Bash script for: {request}
+{todo_text}
+
+# Main script implementation
+echo "Script executed successfully"
+"""
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _compile_prompt(template: str) -> tuple:
+    """Split a str.format template once into (literal text, field name) pairs."""
+    parts = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        if format_spec or conversion or field == "":
+            raise ValueError(f"Prompt templates only support named fields, got {{{field}}}")
+        parts.append((literal, field))
+    return tuple(parts)
+
+def render_prompt(template: str, **values) -> str:
+    """Same result as template.format(**values), without re-parsing the template each call."""
+    return "".join([literal if field is None else literal + str(values[field])
+                    for literal, field in _compile_prompt(template)])
+
 def format_code_prompt(template: str, code: str, language: str = "auto") -> str:
     """Format a code analysis prompt with the provided code and language."""
-    return template.format(code=code, language=language)
+    return render_prompt(template, code=code, language=language)
 
 def format_user_request_prompt(template: str, user_request: str) -> str:
     """Format a prompt with a user request."""
-    return template.format(user_request=user_request)
+    return render_prompt(template, user_request=user_request)
 
 def format_tasks_prompt(template: str, tasks: list) -> str:
     """Format a prompt with a list of tasks."""
-    tasks_str = "\n".join([f"- {task}" for task in tasks])
-    return template.format(tasks=tasks_str)
+    # One join with the bullet in the separator; no per-task "- ..." strings
+    tasks_str = "- " + "\n- ".join(tasks) if tasks else ""
+    return render_prompt(template, tasks=tasks_str)
+
+_PROMPTS_BY_ANALYSIS_TYPE = {
+    "explain": CODE_EXPLANATION_PROMPT,
+    "review": CODE_REVIEW_PROMPT,
+    "optimize": CODE_OPTIMIZATION_PROMPT,
+    "debug": CODE_DEBUG_PROMPT
+}
 
 def get_prompt_by_analysis_type(analysis_type: str) -> str:
     """Get the appropriate code analysis prompt based on type."""
-    prompt_map = {
-        "explain": CODE_EXPLANATION_PROMPT,
-        "review": CODE_REVIEW_PROMPT,
-        "optimize": CODE_OPTIMIZATION_PROMPT,
-        "debug": CODE_DEBUG_PROMPT
-    }
-    return prompt_map.get(analysis_type, CODE_EXPLANATION_PROMPT)
-
-# =============================================================================
-# PROMPT VALIDATION
-# =============================================================================
-
-def validate_prompts():
-    """Validate that all required prompts are defined and non-empty."""
-    required_prompts = [
-        'INTENT_CLASSIFICATION_PROMPT',
-        'DISCUSSION_SYSTEM_PROMPT',
-        'CODE_EXPLANATION_PROMPT',
-        'CODE_REVIEW_PROMPT',
-        'CODE_OPTIMIZATION_PROMPT',
-        'CODE_DEBUG_PROMPT',
-        'TODO_SYSTEM_PROMPT',
-        'TODO_CREATION_PROMPT',
-        'WELCOME_MESSAGE',
-        'EXIT_MESSAGE'
-    ]
-    
-    for prompt_name in required_prompts:
-        prompt = globals().get(prompt_name)
-        if not prompt or not prompt.strip():
-            raise ValueError(f"Required prompt {prompt_name} is missing or empty")
-    
-    return True
+    return _PROMPTS_BY_ANALYSIS_TYPE.get(analysis_type, CODE_EXPLANATION_PROMPT)
 
 # =============================================================================
 # CODERABBIT CODE REVIEW PROMPTS
@@ -316,33 +571,43 @@ CODERABBIT_ERROR_MESSAGE = "Um, sorry, the code review failed. {error_message}"
 # PROMPT VALIDATION
 # =============================================================================
 
+# Checked once per process; later calls return straight away
+_REQUIRED_PROMPTS = (
+    'INTENT_CLASSIFICATION_PROMPT',
+    'DISCUSSION_SYSTEM_PROMPT',
+    'CODE_EXPLANATION_PROMPT',
+    'CODE_REVIEW_PROMPT',
+    'CODE_OPTIMIZATION_PROMPT',
+    'CODE_DEBUG_PROMPT',
+    'TODO_SYSTEM_PROMPT',
+    'TODO_CREATION_PROMPT',
+    'WELCOME_MESSAGE',
+    'EXIT_MESSAGE',
+    'CODERABBIT_SUMMARIZATION_PROMPT',
+    'CODERABBIT_RATE_LIMIT_MESSAGE',
+    'CODERABBIT_TIMEOUT_MESSAGE',
+    'CODERABBIT_START_MESSAGE',
+    'CODERABBIT_ERROR_MESSAGE',
+    'LANGUAGE_DETECTION_SYSTEM_PROMPT',
+    'LANGUAGE_DETECTION_PROMPT'
+)
+_prompts_validated = False
+
 def validate_prompts():
     """Validate that all required prompts are defined and non-empty."""
-    required_prompts = [
-        'INTENT_CLASSIFICATION_PROMPT',
-        'DISCUSSION_SYSTEM_PROMPT',
-        'CODE_EXPLANATION_PROMPT',
-        'CODE_REVIEW_PROMPT',
-        'CODE_OPTIMIZATION_PROMPT',
-        'CODE_DEBUG_PROMPT',
-        'TODO_SYSTEM_PROMPT',
-        'TODO_CREATION_PROMPT',
-        'WELCOME_MESSAGE',
-        'EXIT_MESSAGE',
-        'CODERABBIT_SUMMARIZATION_PROMPT',
-        'CODERABBIT_RATE_LIMIT_MESSAGE',
-        'CODERABBIT_TIMEOUT_MESSAGE',
-        'CODERABBIT_START_MESSAGE',
-        'CODERABBIT_ERROR_MESSAGE'
-    ]
-
-    for prompt_name in required_prompts:
-        prompt = globals().get(prompt_name)
-        if not prompt or not prompt.strip():
+    global _prompts_validated
+    if _prompts_validated:
+        return True
+
+    module_globals = globals()
+    for prompt_name in _REQUIRED_PROMPTS:
+        prompt = module_globals.get(prompt_name)
+        if not prompt or prompt.isspace():
             raise ValueError(f"Required prompt {prompt_name} is missing or empty")
 
+    _prompts_validated = True
     return True
 
 # Validate prompts on import
-if __name__ != "__main__":
+if __name__ != "__main__" and not _prompts_validated:
     validate_prompts()
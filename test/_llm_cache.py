@@ -0,0 +1,44 @@
+"""
+LangChain response cache for the test suite, kept in SQLite so it survives between runs.
+langchain_community's SQLiteCache would do the same, but it isn't a dependency.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration
+
+CACHE_PATH = Path.home() / ".cache" / "mypeer" / "llm_cache.sqlite"
+
+
+class SQLiteLLMCache(BaseCache):
+    """Chat responses keyed on (prompt, model settings); only the message text is stored"""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Parallel test workers share the file; a writer waits for the lock instead of failing
+        self._db = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (prompt TEXT, llm TEXT, texts TEXT, PRIMARY KEY (prompt, llm))"
+            )
+
+    def lookup(self, prompt, llm_string):
+        row = self._db.execute("SELECT texts FROM responses WHERE prompt = ? AND llm = ?", (prompt, llm_string)).fetchone()
+        if row is None:
+            return None
+        return [ChatGeneration(message=AIMessage(content=text)) for text in json.loads(row[0])]
+
+    def update(self, prompt, llm_string, return_val):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (prompt, llm_string, json.dumps([generation.text for generation in return_val]))
+            )
+
+    def clear(self, **kwargs):
+        with self._db:
+            self._db.execute("DELETE FROM responses")
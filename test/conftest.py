@@ -0,0 +1,69 @@
+"""
+Shared pytest fixtures.
+Building a LangGraphVoicePipeline loads every agent and the audio stack, so tests share one.
+
+Test files are independent, so with pytest-xdist installed they can run side by side:
+`pytest -n auto --dist=loadfile`. Each worker builds its own pipeline and shares the on-disk caches.
+"""
+
+import os
+import dataclasses
+import pytest
+
+# Upper bound on xdist workers, since every worker talks to the OpenAI API
+MAX_CONCURRENT_OPENAI = int(os.getenv("MYPEER_MAX_CONCURRENT_OPENAI", "4"))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """`-n auto` uses one worker per CPU, capped at MAX_CONCURRENT_OPENAI"""
+    return max(1, min(os.cpu_count() or 1, MAX_CONCURRENT_OPENAI))
+
+
+@pytest.fixture(scope="session")
+def pipeline():
+    """One pipeline for the whole test session"""
+    # bootstrap() reads .env once per process; the pipeline reuses the same snapshot
+    from langgraph_pipeline import LangGraphVoicePipeline, bootstrap
+    if not bootstrap().openai_api_key:
+        pytest.skip("OPENAI_API_KEY not found in environment variables")
+    # Repeat runs answer the same LangChain prompts from disk instead of the API
+    from langchain_core.globals import set_llm_cache
+    from _llm_cache import SQLiteLLMCache
+    set_llm_cache(SQLiteLLMCache())
+
+    pipeline = LangGraphVoicePipeline.instance()
+    yield pipeline
+    pipeline.close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_conversation(request):
+    """Tests on the shared pipeline each start from a clean conversation"""
+    if "pipeline" in request.fixturenames:
+        request.getfixturevalue("pipeline").reset_conversation_state()
+
+
+class RecordingTTSAgent:
+    """Records what the pipeline says instead of playing it"""
+
+    def __init__(self):
+        self.spoken = []
+
+    def synthesize(self, text):
+        return None
+
+    def run(self, text, audio=None):
+        self.spoken.append(text)
+        return text
+
+
+@pytest.fixture
+def scripted_pipeline():
+    """A fresh pipeline for run_scripted: speech goes to a RecordingTTSAgent (pipeline.tts_agent.spoken),
+    and a placeholder OpenAI key keeps it buildable offline, since the scripts never reach the API"""
+    from langgraph_pipeline import LangGraphVoicePipeline, bootstrap
+    env = dataclasses.replace(bootstrap(), openai_api_key="sk-test")
+    pipeline = LangGraphVoicePipeline(stt_agent=object(), tts_agent=RecordingTTSAgent(), env=env)
+    yield pipeline
+    pipeline.close()  # Tests build one per case; don't let their worker threads pile up
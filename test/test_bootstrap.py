@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Test Environment Settings
+Demonstrates: A bad optional setting falls back instead of stopping the pipeline from starting
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("raw, sensitivity", (
+    ("0.7", 0.7),
+    ("", 0.5),  # Blank line in .env
+    ("high", 0.5),
+    ("nan", 0.5),
+    ("3", 1.0),
+    ("-1", 0.0),
+))
+def test_porcupine_sensitivity(raw, sensitivity, monkeypatch):
+    from langgraph_pipeline import _read_sensitivity
+    monkeypatch.setenv("PORCUPINE_SENSITIVITY", raw)
+    assert _read_sensitivity() == sensitivity
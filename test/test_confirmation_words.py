@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test Request Confirmation Replies
+Demonstrates: Only a plain yes confirms the read-back request; any negation re-records
+"""
+
+import pytest
+
+
+@pytest.mark.parametrize("reply, confirmed", (
+    ("yes", True),
+    ("yeah that's right", True),
+    ("no, that's not good", False),
+    ("that's not right", False),
+    ("good", False),
+))
+def test_confirmation_reply(scripted_pipeline, reply, confirmed):
+    from langgraph_pipeline import ScriptedEvent
+    events = [ScriptedEvent("wake", "blueberry"),
+              ScriptedEvent("utterance", "create a function to print hello world"),
+              ScriptedEvent("utterance", reply)]
+
+    scripted_pipeline.run_scripted(events)
+    scripted_pipeline._wait_for_speech()
+    spoken = scripted_pipeline.tts_agent.spoken
+
+    assert ("Great! Um, let me get started on that for you." in spoken) == confirmed
+    assert ("Oh, um, I'm sorry about that. Could you please say it again?" in spoken) != confirmed
+
+
+@pytest.mark.parametrize("reply, proceeds", (
+    ("sounds good", True),
+    ("yes, go ahead", True),
+    ("no, that's not good", False),
+    ("that's not good", False),
+))
+def test_discussion_loop_reply(scripted_pipeline, reply, proceeds, tmp_path, monkeypatch):
+    from langgraph_pipeline import ScriptedEvent
+    monkeypatch.chdir(tmp_path)  # Generated code is saved to the working directory
+    events = [ScriptedEvent("wake", "blueberry")] + [ScriptedEvent("utterance", text) for text in (
+        "create a function to print hello world",  # Initial request
+        "yes",  # Confirmation
+        "python",  # Language choice
+        "yes",  # Confirm the language
+        reply  # Answer to "What do you think?"
+    )]
+
+    scripted_pipeline.run_scripted(events)
+    scripted_pipeline._wait_for_speech()
+    spoken = scripted_pipeline.tts_agent.spoken
+
+    assert any("I've created the python code" in message for message in spoken) == proceeds
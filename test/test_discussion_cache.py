@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test Discussion Answer Cache
+Demonstrates: Similar questions reuse an answer, different ones and unconfirmed ones don't
+"""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+
+def _unit(cosine):
+    """3-d unit vector whose cosine similarity with (1, 0, 0) is `cosine`"""
+    return [cosine, math.sqrt(1 - cosine ** 2), 0.0]
+
+
+# Canned embeddings, by how close each question is to "what is recursion"
+EMBEDDINGS = {
+    "what is recursion": _unit(1.0),
+    "what's recursion": _unit(0.95),  # Above the 0.92 threshold
+    "what is iteration": _unit(0.90),  # Just below it
+    "how do i sort a list": [0.0, 0.0, 1.0],
+}
+
+
+class StubClient:
+    """Stands in for OpenAI: fixed embeddings, and numbered chat answers so reuse is visible"""
+
+    def __init__(self):
+        self.chat_calls = 0
+        self.embeddings = SimpleNamespace(create=self._embed)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._complete))
+
+    def _embed(self, model, input):
+        return SimpleNamespace(data=[SimpleNamespace(embedding=EMBEDDINGS[input])])
+
+    def _complete(self, **kwargs):
+        self.chat_calls += 1
+        message = SimpleNamespace(content=f"answer {self.chat_calls}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def agent(tmp_path):
+    from agents.discussion_agent import DiscussionAgent
+    agent = DiscussionAgent({"discussion_cache_dir": str(tmp_path), "openai_api_key": "sk-test"})
+    agent.client = StubClient()
+    return agent
+
+
+def test_rephrased_question_hits_cache(agent):
+    assert agent.run("What is recursion") == "answer 1"
+    assert agent.run("What's recursion") == "answer 1"
+    assert agent.client.chat_calls == 1
+
+
+def test_near_miss_and_miss_ask_the_model(agent):
+    agent.run("What is recursion")
+    assert agent.run("What is iteration") == "answer 2"
+    assert agent.run("How do I sort a list") == "answer 3"
+    assert agent.client.chat_calls == 3
+
+
+def test_unconfirmed_answer_is_cached_only_after_remember(agent):
+    agent.run("What is recursion", confirmed=False)
+    assert agent.run("What's recursion") == "answer 2"
+
+    agent.run("How do I sort a list", confirmed=False)
+    agent.remember("How do I sort a list")
+    assert agent.run("How do I sort a list") == "answer 3"
+    assert agent.client.chat_calls == 3
+
+
+def test_cache_is_capped_and_tied_to_settings(agent, tmp_path, monkeypatch):
+    from agents.discussion_agent import DiscussionAgent
+    monkeypatch.setattr(DiscussionAgent, "CACHE_MAX_ENTRIES", 2)
+    for question in ("What is recursion", "What is iteration", "How do I sort a list"):
+        agent.run(question)
+    assert len(agent._cache_answers) == 2
+    agent._save_cache()
+
+    # Same settings: the saved answers come back
+    assert len(DiscussionAgent({"discussion_cache_dir": str(tmp_path), "openai_api_key": "sk-test"})._cache_answers) == 2
+
+    # Different model: the saved answers no longer apply
+    monkeypatch.setattr(DiscussionAgent, "MODEL", "gpt-4o")
+    assert DiscussionAgent({"discussion_cache_dir": str(tmp_path), "openai_api_key": "sk-test"})._cache_answers == []
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test File Operation Read-Back
+Demonstrates: A file asked for after "anything else?" is read back to the user
+"""
+
+import pytest
+
+
+class CannedDiscussionAgent:
+    """Answers explanation requests without calling the model"""
+
+    def run(self, text, confirmed=True):
+        return "A decorator wraps a function to add behaviour."
+
+    def remember(self, text):
+        pass
+
+
+@pytest.fixture
+def file_pipeline(scripted_pipeline, tmp_path):
+    scripted_pipeline.discussion_agent = CannedDiscussionAgent()
+    scripted_pipeline.file_agent.workspace_path = tmp_path
+    (tmp_path / "notes.txt").write_text("Buy milk.")
+    return scripted_pipeline
+
+
+def test_file_result_is_spoken(file_pipeline):
+    from langgraph_pipeline import ScriptedEvent
+    pipeline = file_pipeline
+    events = [ScriptedEvent("wake", "blueberry")] + [ScriptedEvent("utterance", text) for text in (
+        "explain what a python decorator is",  # Initial request
+        "yes",  # Confirmation
+        "yes",  # Anything else?
+        "read the file notes.txt"  # Next request
+    )]
+
+    result = pipeline.run_scripted(events)
+    pipeline._wait_for_speech()
+
+    spoken = " ".join(pipeline.tts_agent.spoken)
+    assert "Sure, um, let me find that file." in pipeline.tts_agent.spoken
+    assert "Here are the contents of notes.txt: Buy milk." in spoken
+    assert result["user_intent"] == "file_operation"
+
+
+@pytest.mark.parametrize("request_text, action", (
+    ("open the file remove_duplicates.py", "open_file"),
+    ("open file exchange_rates.py", "open_file"),
+    ("rename the file app.py", "modify_file"),
+    ("read the file notes.txt", "show_file"),
+    ("list the files", "list_files"),
+))
+def test_file_action_matches_whole_words(request_text, action):
+    from agents.file_agent import FileAgent
+    assert FileAgent().extract_file_operation(request_text)["action"] == action
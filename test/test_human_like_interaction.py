@@ -1,88 +0,0 @@
-#!/usr/bin/env python3
-"""
-Test Human-Like Interaction Features
-Demonstrates: Summarized confirmation + Human-like filler sounds + Simplified todo generation + Natural conversation
-"""
-
-import os
-import sys
-from dotenv import load_dotenv
-from langgraph_pipeline import LangGraphVoicePipeline
-
-def main():
-    """Test the human-like interaction features"""
-    print("🤖 Human-Like Interaction Features Test")
-    print("🎯 Features: Summarized confirmation + Human-like filler sounds + Simplified todos + Natural conversation")
-    print("=" * 100)
-
-    # Load environment variables
-    load_dotenv()
-
-    # Verify OpenAI API key
-    if not os.getenv("OPENAI_API_KEY"):
-        print("ERROR: OPENAI_API_KEY not found in environment variables.")
-        print("Please set your OpenAI API key in a .env file or environment variable.")
-        sys.exit(1)
-
-    try:
-        # Initialize LangGraph pipeline
-        print("🚀 Initializing Human-Like Interaction Pipeline...")
-        pipeline = LangGraphVoicePipeline()
-
-        print("✅ Human-Like Interaction Pipeline initialized successfully!")
-        print()
-        print("🤖 HUMAN-LIKE INTERACTION FEATURES:")
-        print("   • Summarized confirmation instead of exact repetition")
-        print("   • Human-like filler sounds (hmm, um, etc.)")
-        print("   • Simplified todo generation (2-3 tasks instead of 7)")
-        print("   • Natural conversation flow")
-        print("   • Colleague-like communication")
-        print()
-        print("💬 CONFIRMATION EXAMPLES:")
-        print("   User: 'Create a function to print hello world'")
-        print("   System: 'Hmm, let me make sure I understand. You want me to create a hello world function. Is that right?'")
-        print("   (Instead of: 'I heard you say: Create a function to print hello world. Is this correct?')")
-        print()
-        print("🗣️ HUMAN-LIKE FILLER SOUNDS:")
-        print("   • 'Hmm, let me make sure I understand...'")
-        print("   • 'Um, I'll create a Python function for you...'")
-        print("   • 'Oh, no problem! Um, what would you like me to change...'")
-        print("   • 'Hmm, I didn't catch that. Could you please...'")
-        print("   • 'Um, are you still there? Should I continue...'")
-        print()
-        print("📋 SIMPLIFIED TODO GENERATION:")
-        print("   • Function request → 3 tasks (file creation, function creation, implementation)")
-        print("   • Class request → 3 tasks (file creation, class definition, method implementation)")
-        print("   • API request → 3 tasks (file creation, framework setup, endpoint creation)")
-        print("   • (Instead of 7+ tasks that were overwhelming)")
-        print()
-        print("🎯 NATURAL CONVERSATION FLOW:")
-        print("   1. User makes request")
-        print("   2. System summarizes and confirms")
-        print("   3. System creates focused todo list")
-        print("   4. Interactive discussion with human-like responses")
-        print("   5. Natural language adaptation")
-        print()
-        print("💡 EXAMPLE INTERACTION:")
-        print("   User: 'Create a function to print hello world'")
-        print("   System: 'Hmm, let me make sure I understand. You want me to create a hello world function. Is that right?'")
-        print("   User: 'Yes'")
-        print("   System: 'Great! Let me get started on that for you.'")
-        print("   System: 'I've created a plan with 3 tasks. Let's start with the first one: Create a new file with appropriate name and extension. Should I proceed with this?'")
-        print("   User: 'Yes'")
-        print("   System: 'Hey! I'm working on Create a new file. Um, I'll create a Python function for you. What do you think?'")
-        print()
-
-        # Start the continuous voice session
-        pipeline.start_continuous_session()
-
-    except KeyboardInterrupt:
-        print("\n\n👋 Session ended by user. Goodbye!")
-    except Exception as e:
-        print(f"\n❌ Fatal error: {str(e)}")
-        print("Please check your configuration and try again.")
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Test Keyword Intent Classification
+Demonstrates: Known phrases settle the intent locally only when they agree
+"""
+
+import pytest
+
+
+@pytest.fixture
+def intent_agent():
+    from agents.intent_agent import IntentAgent
+    return IntentAgent({"openai_api_key": "sk-test"})
+
+
+@pytest.mark.parametrize("request_text, intent", (
+    ("Write a function that reverses a string", "coding"),  # One phrase, at the start
+    ("I'd like you to write a parser and implement its tests", "coding"),  # Two phrases, elsewhere
+    ("Please write a function that reverses a string", None),  # One phrase, not at the start
+    ("What is the best way to write a sort function", None),  # Phrases disagree
+))
+def test_classify_with_keywords(intent_agent, request_text, intent):
+    classification = intent_agent._classify_with_keywords(request_text)
+    assert (classification and classification["intent"]) == intent
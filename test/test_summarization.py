@@ -4,16 +4,11 @@ Test Summarization Function
 Demonstrates: Better understanding of user requests
 """
 
-from langgraph_pipeline import LangGraphVoicePipeline
-
-def test_summarization():
+def test_summarization(pipeline):
     """Test the summarization function"""
     print("🤖 Testing Summarization Function")
     print("=" * 50)
     
-    # Create pipeline instance
-    pipeline = LangGraphVoicePipeline()
-    
     # Test cases
     test_cases = [
         "Print, write a function to print hello world",
@@ -39,4 +34,5 @@ def test_summarization():
     print("✅ Summarization test completed!")
 
 if __name__ == "__main__":
-    test_summarization()
+    from langgraph_pipeline import LangGraphVoicePipeline
+    test_summarization(LangGraphVoicePipeline.instance())